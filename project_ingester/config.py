@@ -5,6 +5,9 @@ NODE_WIDTH = 80
 NODE_HEIGHT = 45
 ROW_HEIGHT = 60
 BTN_SIZE = 12
+TREE_VIEW_MODE = "widgets"  # "model": QTreeView with painted nodes, for projects with thousands of shots
+PROPERTIES_MAX_TABS = 10  # Larger selections only get the multi-edit form in the properties panel
+SEARCH_MAX_RESULTS = 200  # Nodes highlighted by the project tree search box (first matches)
 
 # Colors
 COLOR_BG_DARK = "#1e1e1e"
@@ -12,6 +15,33 @@ COLOR_BG_PANEL = "#2d2d30"
 COLOR_TEXT_PRIMARY = "#ffffff"
 COLOR_TEXT_SECONDARY = "#d4d4d4"
 
+# ============================================================================
+# FOLDER SCANNER
+# ============================================================================
+SCAN_WORKERS = 1            # > 1 lists directories concurrently (network storage)
+SCAN_MOUNT_LIMITS = {}      # path prefix -> max concurrent listings, e.g. {"//nas01/projects": 4}
+SCAN_CACHE_TTL = 2.0        # seconds a cached listing is trusted before its mtime is re-checked
+SCAN_PREFETCH_WORKERS = 8   # concurrent listings when the folder builder applies a mapping to siblings
+
+# Folder discovery rules (shared by FolderMapper and FolderBuilderDialog).
+# Globs and regexes match folder names, case-insensitively. Excluded folders are
+# never shown nor opened; a folder holding a stop marker is shown but not opened.
+SCAN_EXCLUDE = [".*", "reference", "docs", "lut", "plates", "dailies"]
+SCAN_EXCLUDE_REGEX = []
+SCAN_INCLUDE = []           # if set, only matching folders are kept
+SCAN_INCLUDE_REGEX = []
+SCAN_MAX_DEPTH = None       # folder levels below the scanned root that are opened (None = no limit)
+SCAN_STOP_MARKERS = []      # e.g. [".noscan"]: file/folder names that stop descent
+
+# Live folder watching (FolderBuilderDialog "Watch" option, headless sync tools)
+FOLDER_WATCH_BACKEND = "auto"       # "inotify" (Linux), "poll" or "auto"
+FOLDER_WATCH_DEBOUNCE = 0.5         # seconds of quiet before a batch of changes is delivered
+FOLDER_WATCH_POLL_INTERVAL = 2.0    # seconds between polls (polling backend)
+
+# On-disk folder materializer (core/materialize.py)
+MATERIALIZE_WORKERS = 8     # concurrent mkdir calls (network storage benefits most)
+FOLDER_TASK_TYPES = []      # task folders for "{task_type}" when a step lists no tasks, e.g. ["anim", "comp"]
+
 # ============================================================================
 # METADATA OPTIONS
 # ============================================================================
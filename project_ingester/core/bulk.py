@@ -0,0 +1,143 @@
+# ============================================================================
+# BULK STRUCTURE TEMPLATES
+# ============================================================================
+# A bulk spec describes a whole block of entities by counts and naming
+# patterns instead of one node per entity, e.g. "12 sequences x 80 shots":
+#
+#   {
+#       "type": "sequence", "count": 12, "pattern": "SQ{n:03d}", "start": 10, "step": 10,
+#       "children": [
+#           {"type": "shot", "count": 80, "pattern": "SH{n:04d}", "start": 10, "step": 10}
+#       ]
+#   }
+#
+# Pattern fields: {n} = number (start + i * step), {i} = 1-based position,
+# {parent} = name of the parent entity.
+# Specs are plain dicts (JSON friendly) and are only ever expanded lazily
+# through generators, so holding a 10,000-shot block costs the same as a 10-shot one.
+
+DEFAULT_PATTERNS = {
+    "episode": "EP{n:02d}",
+    "sequence": "SQ{n:03d}",
+    "shot": "SH{n:04d}",
+    "asset_type": "AssetType{n:02d}",
+    "asset": "Asset{n:03d}"
+}
+
+PLURALS = {
+    "episode": "episodes",
+    "sequence": "sequences",
+    "shot": "shots",
+    "asset_type": "asset types",
+    "asset": "assets"
+}
+
+
+def make_level(node_type, count, pattern=None, start=1, step=1, properties=None, children=None):
+    """Builds one (normalized) spec level."""
+    return normalize_spec({
+        "type": node_type,
+        "count": count,
+        "pattern": pattern or DEFAULT_PATTERNS.get(node_type, node_type + "{n:03d}"),
+        "start": start,
+        "step": step,
+        "properties": properties or {},
+        "children": children or []
+    })
+
+
+def normalize_spec(spec):
+    """
+    Validates a spec (recursively) and fills in defaults.
+    Raises ValueError on bad counts or naming patterns.
+    """
+    if not isinstance(spec, dict) or not spec.get("type"):
+        raise ValueError("Bulk spec level needs a 'type'.")
+
+    node_type = spec["type"]
+    level = {
+        "type": node_type,
+        "count": int(spec.get("count", 0)),
+        "pattern": spec.get("pattern") or DEFAULT_PATTERNS.get(node_type, node_type + "{n:03d}"),
+        "start": int(spec.get("start", 1)),
+        "step": int(spec.get("step", 1)),
+        "properties": dict(spec.get("properties") or {}),
+        "children": [normalize_spec(c) for c in spec.get("children") or []]
+    }
+
+    if level["count"] < 0:
+        raise ValueError(f"Negative count for {node_type}.")
+    if level["step"] == 0:
+        raise ValueError(f"Step for {node_type} cannot be 0.")
+    try:
+        format_name(level, 0)
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(f"Invalid naming pattern '{level['pattern']}' for {node_type}: {e}")
+
+    return level
+
+
+def format_name(level, i, parent_name=""):
+    n = level["start"] + i * level["step"]
+    return level["pattern"].format(n=n, i=i + 1, parent=parent_name)
+
+
+def iter_level(level, parent_name=""):
+    """Yields the properties dict of every entity of one level, lazily."""
+    base = level.get("properties") or {}
+    for i in range(level["count"]):
+        props = dict(base)
+        props["name"] = format_name(level, i, parent_name)
+        yield props
+
+
+def iter_structure(level, parent_name=""):
+    """
+    Expands a spec into the nested project model used by the tree
+    ({"type", "name", "properties", "children"}). Children are generators,
+    so nothing is materialized until a consumer walks into it.
+    """
+    for props in iter_level(level, parent_name):
+        yield {
+            "type": level["type"],
+            "name": props["name"],
+            "properties": props,
+            "children": _iter_children(level, props["name"])
+        }
+
+
+def _iter_children(level, parent_name):
+    for child_level in level.get("children", []):
+        yield from iter_structure(child_level, parent_name)
+
+
+def count_nodes(level, multiplier=1, totals=None):
+    """Returns {type: total count} without expanding anything."""
+    totals = totals if totals is not None else {}
+    total = multiplier * level["count"]
+    totals[level["type"]] = totals.get(level["type"], 0) + total
+    for child_level in level.get("children", []):
+        count_nodes(child_level, total, totals)
+    return totals
+
+
+def describe(level):
+    """Short human readable summary, e.g. '12 sequences x 80 shots (960 shots)'."""
+    parts = []
+    current = level
+    while current:
+        parts.append(f"{current['count']} {PLURALS.get(current['type'], current['type'])}")
+        current = current["children"][0] if len(current.get("children", [])) == 1 else None
+
+    text = " x ".join(parts)
+    if len(parts) > 1:
+        totals = count_nodes(level)
+        last_type = list(totals.keys())[-1]
+        text += f" ({totals[last_type]} {PLURALS.get(last_type, last_type)})"
+    return text
+
+
+def short_label(level):
+    """Label that fits in a tree node, e.g. '12×SQ'."""
+    prefix = level["pattern"].split("{")[0] or level["type"][:3]
+    return f"{level['count']}×{prefix}"
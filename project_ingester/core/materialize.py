@@ -0,0 +1,153 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ..config import MATERIALIZE_WORKERS, FOLDER_TASK_TYPES
+
+# ============================================================================
+# FOLDER MATERIALIZER
+# ============================================================================
+# Creates the on-disk folder structure described by the "data" of plan steps
+# (or of entities loaded from Kitsu, which carry the same data):
+#   - every "*_path" value is a folder
+#   - every "*_tree" template is expanded below the entity's own path.
+#     Literal keys ("shared", "work") are folders; "{task_type}" expands to the
+#     step's tasks; entity placeholders ("{sequence}", "{shot}", ...) are left
+#     to the child entities, which carry their own path and tree.
+# The folders are deduplicated and created level by level (parents first),
+# each level spread over a bounded thread pool; one mkdir per folder, and
+# folders that already exist are counted, not touched.
+
+ENTITY_PLACEHOLDERS = {"{episode}", "{sequence}", "{shot}", "{asset_type}", "{asset_name}", "{asset}"}
+
+# *_tree key -> the *_path it is rooted at
+TREE_ROOTS = {
+    "project_tree": "project_path",
+    "episode_tree": "episode_path",
+    "sequence_tree": "sequence_path",
+    "shot_tree": "shot_path",
+    "asset_tree": "asset_path"
+}
+
+
+def _expand(base, tree, task_types, out):
+    for key, subtree in (tree or {}).items():
+        if key in ENTITY_PLACEHOLDERS:
+            continue
+        if key == "{task_type}":
+            names = task_types
+        elif key.startswith("{"):
+            continue  # Unknown placeholder: nothing to resolve it with
+        else:
+            names = [key]
+        for name in names:
+            path = f"{base}/{name}"
+            out.add(path)
+            _expand(path, subtree, task_types, out)
+
+
+def collect_directories(entries, task_types=None):
+    """
+    Expands plan steps (or entity dicts) into the sorted, deduplicated list of
+    folders they describe. Steps are read lazily, so plan files can be streamed.
+    task_types: task folder names used when a step lists no "tasks"
+    (defaults to FOLDER_TASK_TYPES).
+    """
+    default_tasks = FOLDER_TASK_TYPES if task_types is None else task_types
+    folders = set()
+    for entry in entries:
+        params = entry.get("params", entry)
+        data = params.get("data") or {}
+        if not isinstance(data, dict):
+            continue
+        tasks = [t.lower() for t in params.get("tasks") or default_tasks]
+
+        for key, value in data.items():
+            if key.endswith("_path") and isinstance(value, str) and value:
+                folders.add(value.replace("\\", "/").rstrip("/"))
+        for tree_key, path_key in TREE_ROOTS.items():
+            base = (data.get(path_key) or "").replace("\\", "/").rstrip("/")
+            if base and isinstance(data.get(tree_key), dict):
+                _expand(base, data[tree_key], tasks, folders)
+
+    return sorted(folders, key=lambda p: (p.count("/"), p))
+
+
+def _make_dir(path):
+    """Returns "created", "existing" or an error message."""
+    try:
+        os.mkdir(path)
+        return "created"
+    except FileExistsError:
+        return "existing" if os.path.isdir(path) else "exists and is not a folder"
+    except FileNotFoundError:
+        try:
+            os.makedirs(path)  # Parent outside the plan (e.g. the projects root)
+            return "created"
+        except FileExistsError:
+            return "existing"
+        except OSError as e:
+            return str(e)
+    except OSError as e:
+        return str(e)
+
+
+def materialize(directories, workers=None, dry_run=False, progress=None):
+    """
+    Creates 'directories' (parents listed before children, as returned by
+    collect_directories). Already existing folders are skipped, so runs are
+    idempotent. dry_run: only lists the folders that would be created.
+    progress(done, total) is called after each level.
+    Returns a report dict (see format_summary).
+    """
+    start = time.monotonic()
+    directories = list(directories)
+    report = {
+        "dry_run": dry_run,
+        "planned": len(directories),
+        "created": [],
+        "existing": 0,
+        "failed": [],
+        "seconds": 0.0
+    }
+
+    if dry_run:
+        for path in directories:
+            if os.path.isdir(path):
+                report["existing"] += 1
+            else:
+                report["created"].append(path)
+        report["seconds"] = time.monotonic() - start
+        return report
+
+    levels = {}
+    for path in directories:
+        levels.setdefault(path.count("/"), []).append(path)
+
+    done = 0
+    workers = workers or MATERIALIZE_WORKERS
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for depth in sorted(levels):
+            level = levels[depth]
+            for path, result in zip(level, pool.map(_make_dir, level)):
+                if result == "created":
+                    report["created"].append(path)
+                elif result == "existing":
+                    report["existing"] += 1
+                else:
+                    report["failed"].append((path, result))
+            done += len(level)
+            if progress:
+                progress(done, len(directories))
+
+    report["seconds"] = time.monotonic() - start
+    return report
+
+
+def format_summary(report):
+    """One-paragraph summary of a materialize() report."""
+    verb = "would be created" if report["dry_run"] else "created"
+    text = (f"{report['planned']} folders planned: {len(report['created'])} {verb}, "
+            f"{report['existing']} already existed")
+    if report["failed"]:
+        text += f", {len(report['failed'])} failed"
+    return text + f" ({report['seconds']:.2f}s)."
@@ -0,0 +1,45 @@
+import re
+
+# ============================================================================
+# NAMING CONVENTION CLASSIFIER
+# ============================================================================
+# Sorts folder names into entity types by naming convention
+# (e.g. "ep01" -> episode, "SQ010" -> sequence). All patterns are compiled
+# into one alternation, so each name costs a single match whatever the number
+# of types; when several patterns match, the first type listed wins.
+
+
+class NameClassifier:
+    def __init__(self, patterns):
+        """patterns: {entity_type: regex} in priority order, matched case-insensitively."""
+        self.types = list(patterns)
+        alternatives = [f"(?P<_t{i}>{patterns[t]})" for i, t in enumerate(self.types)]
+        self._groups = {f"_t{i}": t for i, t in enumerate(self.types)}
+        self._regex = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+
+    def classify(self, name):
+        """Entity type whose convention 'name' follows, or None."""
+        if not self._regex:
+            return None
+        match = self._regex.match(name)
+        if not match:
+            return None
+        for group, entity_type in self._groups.items():
+            if match.group(group) is not None:
+                return entity_type
+        return None
+
+    def split(self, listing):
+        """
+        Classifies a whole [(name, path)] listing in one batch.
+        Returns ({entity_type: [(name, path)]}, leftovers), listing order kept.
+        """
+        mapped = {}
+        leftovers = []
+        for entry in listing:
+            entity_type = self.classify(entry[0])
+            if entity_type is None:
+                leftovers.append(entry)
+            else:
+                mapped.setdefault(entity_type, []).append(entry)
+        return mapped, leftovers
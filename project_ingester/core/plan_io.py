@@ -0,0 +1,104 @@
+import json
+
+# ============================================================================
+# PLAN FILES (JSON Lines)
+# ============================================================================
+# Line 1 is a header, every following line is one step:
+#   {"format": "kitsu-plan", "version": 1}
+#   {"index": 0, "parent": null, "type": "project", "name": "...", "role": "...", "params": {...}}
+#   {"index": 1, "parent": 0, "type": "sequence", ...}
+# Parents are referenced by step index (never by widget), and parents are
+# always written before their children, so a plan can be executed while it
+# is being read.
+
+PLAN_FORMAT = "kitsu-plan"
+PLAN_VERSION = 1
+
+# Keys of an in-memory step that are persisted. 'widget', 'created_entity'
+# and 'fetched_data' are runtime-only.
+STEP_KEYS = ("index", "parent", "type", "name", "role", "params")
+
+
+def serialize_step(step):
+    record = {key: step.get(key) for key in STEP_KEYS}
+    return json.dumps(record, separators=(",", ":"), default=str)
+
+
+class PlanWriter:
+    """
+    List-like sink that streams plan steps to a JSON Lines file as they are appended.
+    Can be passed to ProjectManager.build_plan(sink=...) so a plan never has to be
+    held in memory in full.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write(json.dumps({"format": PLAN_FORMAT, "version": PLAN_VERSION}) + "\n")
+
+    def append(self, step):
+        if step.get("index") is None:
+            step["index"] = self.count
+        self._file.write(serialize_step(step) + "\n")
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _parent_indexes(plan):
+    """
+    Yields (step, parent_index) for an in-memory plan. Uses the step's own
+    'parent' if present, otherwise resolves it through the source tree items.
+    """
+    index_by_item = {}
+    for i, step in enumerate(plan):
+        parent = step.get("parent")
+        widget = step.get("widget")
+        source_item = getattr(widget, "item", None)
+        if parent is None and source_item is not None:
+            parent = index_by_item.get(source_item.parent())
+        if source_item is not None:
+            index_by_item[source_item] = i
+        yield step, parent
+
+
+def write_plan(plan, path):
+    """Writes an in-memory plan to 'path'. Returns the number of steps written."""
+    with PlanWriter(path) as writer:
+        for i, (step, parent) in enumerate(_parent_indexes(plan)):
+            record = {key: step.get(key) for key in STEP_KEYS}
+            record["index"] = i
+            record["parent"] = parent
+            writer.append(record)
+    return writer.count
+
+
+def iter_plan(path):
+    """Reads a plan file one step at a time."""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != PLAN_FORMAT:
+            raise ValueError(f"{path} is not a plan file.")
+        if header.get("version", 0) > PLAN_VERSION:
+            raise ValueError(f"Unsupported plan version {header.get('version')} in {path}.")
+
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_plan(path):
+    return list(iter_plan(path))
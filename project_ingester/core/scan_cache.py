@@ -0,0 +1,84 @@
+import os
+import time
+import threading
+from ..config import SCAN_CACHE_TTL
+
+# ============================================================================
+# SCAN CACHE
+# ============================================================================
+# Directory listings keyed by path and validated by the directory's mtime.
+# A directory's mtime changes whenever an entry is added, removed or renamed
+# in it, so an unchanged mtime means the cached listing is still exact.
+#   - within 'ttl' seconds of the last check: served without touching the disk
+#     (one stat per directory can still cost a round trip on NFS/SMB)
+#   - after that: one os.stat(); the directory is only re-listed if its mtime moved
+# An mtime within RACY_WINDOW of "now" is not trusted (a change in the same
+# timestamp tick would go unnoticed on coarse filesystems); such listings are
+# re-checked by listing again once the TTL is over.
+
+RACY_WINDOW = 2.0  # seconds
+
+
+def scandir_dirs(path):
+    """Default loader: [(name, path)] of every sub-directory of 'path'."""
+    with os.scandir(path) as it:
+        return [(e.name, e.path) for e in it if e.is_dir()]
+
+
+class ScanCache:
+    def __init__(self, ttl=SCAN_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}  # path -> (mtime, checked_at, listing)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def list_dirs(self, path, loader=scandir_dirs):
+        """
+        Sorted [(name, path)] of the sub-directories of 'path' ([] on error).
+        'loader' does the actual listing on a miss (e.g. a throttled scandir).
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached and now - cached[1] < self.ttl:
+            self.hits += 1
+            return cached[2]
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self.invalidate(path)
+            return []
+
+        if cached and cached[0] == mtime:
+            with self._lock:
+                self._entries[key] = (mtime, now, cached[2])
+            self.hits += 1
+            return cached[2]
+
+        try:
+            listing = loader(path)
+        except OSError:
+            return []
+        listing = sorted(listing, key=lambda e: (e[0].lower(), e[0]))
+        if time.time() - mtime / 1e9 < RACY_WINDOW:
+            mtime = None
+
+        with self._lock:
+            self._entries[key] = (mtime, now, listing)
+        self.misses += 1
+        return listing
+
+    def invalidate(self, path=None):
+        """Drops one directory (or everything if path is None)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.normcase(os.path.abspath(path)), None)
+
+
+# Shared by FolderMapper and FolderBuilderDialog
+SHARED_CACHE = ScanCache()
@@ -0,0 +1,62 @@
+import os
+import re
+import fnmatch
+from ..config import (
+    SCAN_EXCLUDE, SCAN_EXCLUDE_REGEX, SCAN_INCLUDE, SCAN_INCLUDE_REGEX,
+    SCAN_MAX_DEPTH, SCAN_STOP_MARKERS
+)
+
+# ============================================================================
+# SCAN RULES
+# ============================================================================
+# Include/exclude rules for folder discovery, compiled once into a single
+# regex per side so every folder name costs one match whatever the rule count.
+
+
+def _compile(globs, regexes):
+    parts = [fnmatch.translate(g) for g in globs or []] + list(regexes or [])
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in parts), re.IGNORECASE)
+
+
+class ScanRules:
+    def __init__(self, exclude=None, exclude_regex=None, include=None, include_regex=None,
+                 max_depth=None, stop_markers=None):
+        """Arguments left to None fall back to the SCAN_* settings in config.py."""
+        self.exclude = _compile(
+            SCAN_EXCLUDE if exclude is None else exclude,
+            SCAN_EXCLUDE_REGEX if exclude_regex is None else exclude_regex
+        )
+        self.include = _compile(
+            SCAN_INCLUDE if include is None else include,
+            SCAN_INCLUDE_REGEX if include_regex is None else include_regex
+        )
+        self.max_depth = SCAN_MAX_DEPTH if max_depth is None else max_depth
+        self.stop_markers = list(SCAN_STOP_MARKERS if stop_markers is None else stop_markers)
+
+    def accepts(self, name):
+        if self.exclude and self.exclude.match(name):
+            return False
+        if self.include and not self.include.match(name):
+            return False
+        return True
+
+    def filter(self, listing):
+        """Keeps the accepted [(name, path)] entries of a listing."""
+        return [entry for entry in listing if self.accepts(entry[0])]
+
+    def can_descend(self, path, depth):
+        """
+        Whether the folder at 'path' ('depth' levels below the scanned root,
+        which is depth 0) may be opened.
+        """
+        if self.max_depth is not None and depth >= self.max_depth:
+            return False
+        for marker in self.stop_markers:
+            if os.path.lexists(os.path.join(path, marker)):
+                return False
+        return True
+
+
+DEFAULT_SCAN_RULES = ScanRules()
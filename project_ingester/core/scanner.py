@@ -1,9 +1,72 @@
 import os
-from ..data.rules import RULE_MAP
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from ..data.rules import RULE_MAP, name_patterns_for
+from ..config import SCAN_WORKERS, SCAN_MOUNT_LIMITS
+from .scan_cache import SHARED_CACHE
+from .scan_rules import DEFAULT_SCAN_RULES
+from .naming import NameClassifier
 
 class FolderMapper:
-    def __init__(self):
-        pass
+    def __init__(self, workers=None, mount_limits=None, cache=None, scan_rules=None):
+        """
+        workers: number of concurrent directory listings. 1 scans depth-first on
+            the calling thread; > 1 fans listings out over a bounded thread pool.
+        mount_limits: {path prefix: max concurrent listings} for slow mounts.
+        cache: ScanCache for listings (defaults to the one shared with FolderBuilderDialog).
+        scan_rules: ScanRules deciding which folders are kept and opened
+            (defaults to the config rules, also used by FolderBuilderDialog).
+        Both modes return the same structure, children sorted by name.
+        """
+        self.cache = cache if cache is not None else SHARED_CACHE
+        self.scan_rules = scan_rules if scan_rules is not None else DEFAULT_SCAN_RULES
+        self.workers = workers if workers is not None else SCAN_WORKERS
+        self.mount_limits = {
+            self._norm(prefix): limit
+            for prefix, limit in (mount_limits if mount_limits is not None else SCAN_MOUNT_LIMITS).items()
+        }
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        self.set_template(None)
+
+    def set_template(self, template_name):
+        """Naming conventions of 'template_name' (see name_patterns_for), as in FolderBuilderDialog."""
+        self.name_patterns = name_patterns_for(template_name)
+        self._classifiers = {} # candidate types -> NameClassifier over their patterns
+
+    @staticmethod
+    def _norm(path):
+        return os.path.normcase(os.path.abspath(path)).replace("\\", "/").rstrip("/")
+
+    def _mount_semaphore(self, path):
+        """Semaphore of the longest configured mount prefix containing 'path'."""
+        if not self.mount_limits:
+            return None
+        norm = self._norm(path)
+        best = None
+        for prefix in self.mount_limits:
+            if (norm == prefix or norm.startswith(prefix + "/")) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        if best is None:
+            return None
+        with self._lock:
+            if best not in self._semaphores:
+                self._semaphores[best] = threading.BoundedSemaphore(max(1, self.mount_limits[best]))
+            return self._semaphores[best]
+
+    def _scandir(self, path):
+        """Lists 'path' on disk, throttled by its mount limit. Called on cache misses only."""
+        semaphore = self._mount_semaphore(path)
+        if semaphore: semaphore.acquire()
+        try:
+            with os.scandir(path) as it:
+                return [(e.name, e.path) for e in it if e.is_dir()]
+        finally:
+            if semaphore: semaphore.release()
+
+    def _list_dirs(self, path):
+        """Returns the sorted, rule-filtered [(name, path)] sub-directories of 'path' ([] on error)."""
+        return self.scan_rules.filter(self.cache.list_dirs(path, self._scandir))
 
     def scan_structure(self, template_name, mappings):
         """
@@ -31,123 +94,123 @@ class FolderMapper:
             "children": []
         }
         
-        # 2. Derive Hierarchy from Template
+        # 2. Derive Hierarchy (and naming conventions) from Template
         rules = RULE_MAP.get(template_name, {})
+        self.set_template(template_name)
         project_children_types = rules.get('project', {}).get('children', [])
         
-        # 3. Recursively Build
-        # We need to pass the parent path to connect the dots if user didn't map every single level explicitly.
-        # But per requirements, user maps "Entity Levels" to "Folders".
+        # 3. Mapped levels
+        # Per requirements, user maps "Entity Levels" to "Folders". Every mapped
+        # folder is listed once, even if several entity types are mapped to it.
+        pending = self._process_mapped_levels(structure, project_children_types, mappings, rules)
         
-        # Let's handle the direct children of Project first
-        for child_type in project_children_types:
-            self._process_level(structure, child_type, mappings, rules)
+        # 4. Discover everything below the mapped levels
+        if self.workers > 1:
+            self._expand_parallel(pending, rules)
+        else:
+            for node, child_types, depth in pending:
+                self._scan_children_recursive(node, child_types, rules, depth)
             
         return structure
 
-    def _process_level(self, parent_node, entity_type, mappings, rules):
+    def classify(self, name, candidate_types):
         """
-        Populate parent_node['children'] with nodes of entity_type.
+        Picks at most one entity type for a folder name among candidate_types
+        (the children allowed by RULE_MAP for the parent):
+          - the only candidate, if there is just one
+          - else the first candidate whose naming convention (name_patterns_for) matches
+          - else the first candidate without a naming convention (e.g. asset_type)
+        Returns None if the folder fits none of them.
         """
-        # 1. Check if user explicitly mapped this entity type
-        mapped_path = mappings.get(entity_type.lower())
-        
-        candidates = []
-        
-        if mapped_path and os.path.exists(mapped_path):
-            # User said "Episodes are in X"
-            # So every folder in X is an Episode
-            try:
-                # We scan the mapped folder for subfolders
-                if os.path.isdir(mapped_path):
-                    for entry in os.scandir(mapped_path):
-                        if entry.is_dir():
-                            candidates.append({
-                                "name": entry.name,
-                                "path": entry.path
-                            })
-            except Exception as e:
-                print(f"Error scanning {mapped_path}: {e}")
-                
-        # 2. If no explicit mapping, can we infer it?
-        # Only if the parent has a path we can look into?
-        # For now, let's rely on explicit mappings for high levels, 
-        # OR if the parent path is known, we can maybe look for a folder named "{entity_type}s"?
-        # But requirement says "User maps folder names".
-        
-        # Strategy: If mapped, use it. If not, skip? 
-        # Or maybe the mapped path IS the parent folder.
-        
-        if not candidates:
-            return
+        if len(candidate_types) == 1:
+            return candidate_types[0]
+        key = tuple(candidate_types)
+        classifier = self._classifiers.get(key)
+        if classifier is None:
+            classifier = self._classifiers[key] = NameClassifier(
+                {t: self.name_patterns[t] for t in candidate_types if t in self.name_patterns}
+            )
+        entity_type = classifier.classify(name)
+        if entity_type:
+            return entity_type
+        for entity_type in candidate_types:
+            if entity_type not in self.name_patterns:
+                return entity_type
+        return None
 
-        # 3. Create Nodes
-        entity_rules = rules.get(entity_type, {})
-        allowed_children = entity_rules.get("children", [])
-        
-        for cand in candidates:
+    def _add_children(self, parent_node, entries, candidate_types, rules, depth):
+        """
+        Classifies listed entries (found 'depth' levels below the scanned root)
+        into nodes under parent_node.
+        Returns the (node, child_types, depth) still to be scanned below them.
+        """
+        pending = []
+        for name, path in entries:
+            entity_type = self.classify(name, candidate_types)
+            if not entity_type:
+                continue
             new_node = {
                 "type": entity_type,
-                "name": cand['name'],
-                "path": cand['path'], # Store for potentially finding children
+                "name": name,
+                "path": path, # Store for finding children
                 "children": []
             }
             parent_node['children'].append(new_node)
             
-            # Recurse for grandchildren
-            # But wait, mappings are global "Entity Type -> Folder".
-            # If I mapped "Sequence" -> "D:/Seqs", that implies ALL sequences are flat in there? 
-            # unlikely for a tree.
-            # Usually structure is nested: Project/Ep01/Sq01...
-            
-            # HYBRID APPROACH:
-            # If "Sequence" is mapped globally, does it mean "Look for a folder named Sequence inside the parent"?
-            # OR "Use the 'Sequence' mapping path provided by user"?
-            # If the user maps "Sequence" -> "C:/MyProject/Sequences", then maybe all sequences are there.
-            # BUT if the user maps "Episode" -> "C:/MyProject/Episodes", we found "Ep01".
-            # Inside "Ep01", we expect to find Sequences.
-            
             # AUTOMATIC DISCOVERY:
-            # Once we are inside a scanned entity (e.g. Ep01 path), we should look for children folders there.
-            # unless told otherwise.
-            
-            if allowed_children:
-                for child_type in allowed_children:
-                     self._scan_children_recursive(new_node, child_type, rules)
+            # Once we are inside a scanned entity (e.g. Ep01 path), we look for
+            # children folders there (e.g. Ep01/Sq01, Ep01/Sq02).
+            allowed_children = rules.get(entity_type, {}).get("children", [])
+            if allowed_children and self.scan_rules.can_descend(path, depth):
+                pending.append((new_node, allowed_children, depth))
+        return pending
+
+    def _process_mapped_levels(self, parent_node, entity_types, mappings, rules):
+        """
+        Populate parent_node['children'] from the folders the user mapped to
+        entity_types (User said "Episodes are in X": every folder in X is an Episode).
+        Types without a mapping are skipped.
+        """
+        # Group types by mapped folder, keeping rule order
+        types_by_path = {}
+        for entity_type in entity_types:
+            mapped_path = mappings.get(entity_type.lower())
+            if mapped_path and os.path.isdir(mapped_path) and self.scan_rules.can_descend(mapped_path, 0):
+                types_by_path.setdefault(self._norm(mapped_path), (mapped_path, []))[1].append(entity_type)
+        
+        pending = []
+        for mapped_path, types in types_by_path.values():
+            entries = self._list_dirs(mapped_path)
+            pending.extend(self._add_children(parent_node, entries, types, rules, 1))
+        return pending
 
-    def _scan_children_recursive(self, parent_node, child_type, rules):
+    def _scan_children_recursive(self, parent_node, child_types, rules, depth=0):
+        """Lists parent_node's folder once and classifies every entry among child_types."""
         parent_path = parent_node.get('path')
         if not parent_path or not os.path.isdir(parent_path):
             return
 
         # We assume children folders are directly inside parent folder
-        # e.g. Ep01/Sq01, Ep01/Sq02
-        
-        # Check if there is an intermediate folder? e.g. Ep01/Sequences/Sq01?
-        # Some pipelines have standard folder names like "sequences" or "shots".
-        # For now, simplest approach: All subfolders are candidates.
-        
-        entity_rules = rules.get(child_type, {})
-        grand_children_types = entity_rules.get("children", [])
-        
-        try:
-             # Heuristic: Filter out common non-entity folders?
-            ignore = {".git", ".vs", "reference", "docs", "lut", "plates", "dailies"}
+        entries = self._list_dirs(parent_path)
+        for node, grand_children_types, node_depth in self._add_children(parent_node, entries, child_types, rules, depth + 1):
+            self._scan_children_recursive(node, grand_children_types, rules, node_depth)
+
+    def _expand_parallel(self, pending, rules):
+        """
+        Same result as _scan_children_recursive, but every directory listing is
+        a separate task on a bounded pool. Each node's children are appended in
+        the order of its own sorted listing, so the output is deterministic
+        whatever order the listings complete in.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {}
+            for node, child_types, depth in pending:
+                if node.get('path') and os.path.isdir(node['path']):
+                    futures[pool.submit(self._list_dirs, node['path'])] = (node, child_types, depth)
             
-            for entry in os.scandir(parent_path):
-                if entry.is_dir() and entry.name.lower() not in ignore:
-                    # Create Node
-                    new_node = {
-                        "type": child_type,
-                        "name": entry.name,
-                        "path": entry.path,
-                        "children": []
-                    }
-                    parent_node['children'].append(new_node)
-                    
-                    # Recurse
-                    for grand_child in grand_children_types:
-                        self._scan_children_recursive(new_node, grand_child, rules)
-                        
-        except Exception:
-            pass
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node, child_types, depth = futures.pop(future)
+                    for child, grand_children_types, child_depth in self._add_children(node, future.result(), child_types, rules, depth + 1):
+                        futures[pool.submit(self._list_dirs, child['path'])] = (child, grand_children_types, child_depth)
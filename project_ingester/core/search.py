@@ -0,0 +1,127 @@
+from bisect import bisect_left, insort
+from ..config import SEARCH_MAX_RESULTS
+
+# ============================================================================
+# NODE SEARCH INDEX
+# ============================================================================
+# In-memory lookup of tree nodes by name, code and id, case-insensitively.
+#   - prefix: a sorted list of (term, key), found with bisect
+#   - substring: trigram -> keys postings, intersected (smallest first) and
+#     then checked with 'in'; queries shorter than a trigram are prefix only
+# Nodes are any hashable objects (tree items); 'key' is an insertion counter,
+# so substring matches come back in the order the nodes were indexed.
+# A lookup touches the matching postings only, never the whole tree. Nodes
+# added to an empty index (loading a project) are sorted once on the next
+# lookup instead of being inserted one by one.
+
+GRAM = 3
+
+
+def trigrams(term):
+    return {term[i:i + GRAM] for i in range(len(term) - GRAM + 1)}
+
+
+class NodeSearchIndex:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._entries = {}   # node -> (key, terms)
+        self._nodes = {}     # key -> node
+        self._sorted = []    # [(term, key)], sorted when _sorted_ok
+        self._sorted_ok = True
+        self._grams = {}     # trigram -> {key}
+        self._next_key = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, node):
+        return node in self._entries
+
+    def add(self, node, *values):
+        """Indexes (or re-indexes, keeping its place) 'node' under the given names/codes/ids."""
+        terms = tuple(sorted({str(v).strip().lower() for v in values if v} - {""}))
+        entry = self._entries.get(node)
+        if entry is not None:
+            if entry[1] == terms:
+                return
+            key = entry[0]
+            self._unlink(key, entry[1])
+        else:
+            key = self._next_key
+            self._next_key += 1
+            self._nodes[key] = node
+        self._entries[node] = (key, terms)
+
+        for term in terms:
+            if self._sorted_ok and self._sorted:
+                insort(self._sorted, (term, key))
+            else:
+                # Empty or already unsorted: sort once on the next lookup
+                self._sorted.append((term, key))
+                self._sorted_ok = False
+            for gram in trigrams(term):
+                self._grams.setdefault(gram, set()).add(key)
+
+    def remove(self, node):
+        entry = self._entries.pop(node, None)
+        if entry is None:
+            return
+        key, terms = entry
+        del self._nodes[key]
+        self._unlink(key, terms)
+
+    def _unlink(self, key, terms):
+        for term in terms:
+            if self._sorted_ok:
+                i = bisect_left(self._sorted, (term, key))
+                if i < len(self._sorted) and self._sorted[i] == (term, key):
+                    del self._sorted[i]
+            else:
+                self._sorted.remove((term, key))
+            for gram in trigrams(term):
+                keys = self._grams.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._grams[gram]
+
+    def find(self, query, limit=SEARCH_MAX_RESULTS):
+        """
+        Nodes matching 'query': those with a term starting with it (in term
+        order) first, then those containing it. At most 'limit' nodes.
+        """
+        query = query.strip().lower()
+        if not query or limit <= 0:
+            return []
+        if not self._sorted_ok:
+            self._sorted.sort()
+            self._sorted_ok = True
+
+        found = {}
+        i = bisect_left(self._sorted, (query,))
+        while i < len(self._sorted) and len(found) < limit:
+            term, key = self._sorted[i]
+            if not term.startswith(query):
+                break
+            found[key] = None
+            i += 1
+
+        if len(query) >= GRAM and len(found) < limit:
+            postings = sorted((self._grams.get(g, ()) for g in trigrams(query)), key=len)
+            candidates = postings[0]
+            for keys in postings[1:]:
+                if not candidates:
+                    break
+                candidates = candidates & keys
+            contained = []
+            for key in candidates:
+                if key not in found and any(query in term for term in self._entries[self._nodes[key]][1]):
+                    contained.append(key)
+                    if len(found) + len(contained) >= limit:
+                        break
+            for key in sorted(contained):
+                found[key] = None
+
+        return [self._nodes[key] for key in found]
@@ -1,5 +1,7 @@
 import gazu
 import json
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from ..entities.project import get_or_create_project
 from ..entities.episode import get_or_create_episode
 from ..entities.sequence import get_or_create_sequence
@@ -8,10 +10,27 @@ from ..entities.asset import get_or_create_asset, get_or_create_asset_type
 from ..entities.task import get_or_create_task, get_or_create_task_type
 from ..kitsu_config import KITSU_HOST, KITSU_EMAIL, KITSU_PASSWORD
 from ..utils import code_gen
+from . import plan_io
+from . import validator
+from . import bulk
+from . import materialize
 
 from ..ui.dialogs import GenerationSummaryDialog, LoginDialog
 from ..utils.compat import QApplication, QMessageBox
 
+def merge_plans(plans):
+    """Concatenates plans, shifting step indexes so 'parent' links stay valid."""
+    merged = []
+    for plan in plans:
+        offset = len(merged)
+        for step in plan:
+            step['index'] = step.get('index', 0) + offset
+            if step.get('parent') is not None:
+                step['parent'] += offset
+            merged.append(step)
+    return merged
+
+
 class ProjectManager:
     def __init__(self, log_callback=None):
         self.log_callback = log_callback if log_callback else print
@@ -100,6 +119,9 @@ class ProjectManager:
         return tree_widget.itemWidget(item, 0)
 
     def process_node(self, item, tree_widget, hierarchy=True):
+        return self.process_nodes([item], tree_widget, hierarchy)
+
+    def process_nodes(self, items, tree_widget, hierarchy=True):
         """
         Orchestrator for the Generate Workflow:
         1. Connect
@@ -117,7 +139,7 @@ class ProjectManager:
             
         # --- Step 1: Build Plan ---
         self.log("Analyzing structure...", "INFO")
-        plan = self.build_plan(item, tree_widget, hierarchy)
+        plan = self.build_plans(items, tree_widget, hierarchy)
         
         if not plan:
             self.log("No valid entities found to generate.", "WARNING")
@@ -202,12 +224,20 @@ class ProjectManager:
                 return step['params'] if 'params' in step else None
         return None
 
-    def build_plan(self, item, tree_widget, hierarchy=True):
+    def build_plan(self, item, tree_widget, hierarchy=True, sink=None, existing=None,
+                   allocators=None, counters=None):
         """
         Traverses the UI tree (or selected item) to build a linear execution plan.
         Resolves parameters and generates CODES.
+        
+        Every step gets an 'index' and the 'parent' index of its parent step.
+        sink: optional list-like receiving the steps (e.g. plan_io.PlanWriter to
+        stream a large plan straight to disk). Defaults to a new list.
+        existing: optional result of fetch_existing_codes() (skips the pre-fetch).
+        allocators / counters: optional code allocators and sibling counters
+        shared with other roots of the same project (see build_plans).
         """
-        plan = []
+        plan = sink if sink is not None else []
         
         # 1. Initialize Context & Counters
         context = {
@@ -231,22 +261,25 @@ class ProjectManager:
         if widget and widget.node_frame.node_type == "project":
             project_name = widget.node_frame.properties.get("name")
             
-        if self.connected and project_name:
-            try:
-                proj = gazu.project.get_project_by_name(project_name)
-                if proj:
-                     self.log(f"Fetching existing codes for {project_name}...", "INFO")
-                     eps = gazu.shot.all_episodes_for_project(proj)
-                     context["existing"]["episodes"] = [e["code"] for e in eps if e.get("code")]
-                     
-                     seqs = gazu.shot.all_sequences_for_project(proj)
-                     context["existing"]["sequences"] = [s["code"] for s in seqs if s.get("code")]
-            except Exception as e:
-                self.log(f"Failed to fetch context: {e}", "WARNING")
+        if existing is not None:
+            context["existing"].update(existing)
+        elif project_name:
+            context["existing"].update(self.fetch_existing_codes(project_name))
+
+        # Index existing codes once per plan (shared by every branch context)
+        context["allocators"] = allocators if allocators is not None else self._code_allocators(context["existing"])
+        if counters is not None:
+            context["counters"] = counters
 
         # 3. Process Root
+        if widget and widget.node_frame.properties.get("bulk_spec"):
+            self._collect_bulk(widget.node_frame.properties["bulk_spec"], plan, context, hierarchy)
+            return plan
+        
         step = self._prepare_step(item, tree_widget, "Context" if hierarchy else "Selected", context)
         if step:
+            step['index'] = len(plan)
+            step['parent'] = None
             plan.append(step)
             # Update context for children if root resolved a code
             root_code = step['params'].get('code')
@@ -257,6 +290,8 @@ class ProjectManager:
             child_context['counters'] = context['counters'].copy() # shallow copy dict
             child_context['parent_code'] = root_code
             child_context['parent_type'] = root_type
+            child_context['parent_index'] = step['index']
+            child_context['parent_name'] = step['name']
             
             # Extract root data params (e.g. project_path)
             root_data = step['params'].get('data', {})
@@ -270,57 +305,181 @@ class ProjectManager:
         
         return plan
 
+    def fetch_existing_codes(self, project_name):
+        """
+        Fetches the codes already used in Kitsu for one project (Best Effort).
+        Returns {"episodes": [...], "sequences": [...], "shots": []}.
+        """
+        existing = {"episodes": [], "sequences": [], "shots": []}
+        if not self.connected or not project_name:
+            return existing
+        try:
+            proj = gazu.project.get_project_by_name(project_name)
+            if proj:
+                 self.log(f"Fetching existing codes for {project_name}...", "INFO")
+                 eps = gazu.shot.all_episodes_for_project(proj)
+                 existing["episodes"] = [e["code"] for e in eps if e.get("code")]
+                 
+                 seqs = gazu.shot.all_sequences_for_project(proj)
+                 existing["sequences"] = [s["code"] for s in seqs if s.get("code")]
+        except Exception as e:
+            self.log(f"Failed to fetch context: {e}", "WARNING")
+        return existing
+
+    def build_plans(self, items, tree_widget, hierarchy=True, max_workers=None):
+        """
+        Builds one combined plan for several roots (e.g. a multi-selection).
+        
+        The existing codes of every distinct project are fetched concurrently
+        (network I/O) in a worker pool; the CPU-bound planning then runs on the
+        calling thread. Roots of one project share a single code state: the
+        code allocators and sibling counters carry over from root to root, so
+        two selected episodes get ep01 and ep02 exactly as build_plan on their
+        project would. Plans are merged in the order of 'items'.
+        """
+        roots = self._distinct_roots(items, hierarchy)
+        if len(roots) == 1:
+            return self.build_plan(roots[0], tree_widget, hierarchy)
+        if not roots:
+            return []
+        
+        names = [self._project_name_of(root, tree_widget) for root in roots]
+        unique_names = list(dict.fromkeys(names))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            fetched = dict(zip(unique_names, pool.map(self.fetch_existing_codes, unique_names)))
+        
+        projects = {}  # project name -> (existing, allocators, {parent item: counters})
+        plans = []
+        for root, name in zip(roots, names):
+            if name not in projects:
+                projects[name] = (fetched[name], self._code_allocators(fetched[name]), {})
+            existing, allocators, counters = projects[name]
+            
+            # Sibling roots keep counting where the previous one stopped
+            siblings = counters.setdefault(root.parent(), {"episode": 0, "sequence": 0, "shot": 0})
+            plans.append(self.build_plan(
+                root, tree_widget, hierarchy,
+                existing=existing, allocators=allocators, counters=siblings
+            ))
+        return merge_plans(plans)
+
+    def _code_allocators(self, existing):
+        return {
+            "episodes": code_gen.CodeAllocator(existing.get("episodes", [])),
+            "sequences": code_gen.CodeAllocator(existing.get("sequences", []))
+        }
+
+    def _distinct_roots(self, items, hierarchy):
+        """Drops duplicates and, in hierarchy mode, roots already inside another root."""
+        roots = list(dict.fromkeys(items))
+        if not hierarchy:
+            return roots
+        root_set = set(roots)
+        
+        def has_root_ancestor(item):
+            parent = item.parent()
+            while parent is not None:
+                if parent in root_set: return True
+                parent = parent.parent()
+            return False
+        
+        return [r for r in roots if not has_root_ancestor(r)]
+
+    def _project_name_of(self, item, tree_widget):
+        top = item
+        while top.parent() is not None:
+            top = top.parent()
+        widget = self._get_node_widget(tree_widget, top)
+        if widget and widget.node_frame.node_type == "project":
+            return widget.node_frame.properties.get("name")
+        return None
+
     def _collect_children(self, parent_item, tree_widget, plan, context):
         count = parent_item.childCount()
         for i in range(count):
             child = parent_item.child(i)
             
+            # Bulk summary nodes expand straight into steps (no widget per entity)
+            widget = self._get_node_widget(tree_widget, child)
+            bulk_spec = widget.node_frame.properties.get("bulk_spec") if widget else None
+            if bulk_spec:
+                self._collect_bulk(bulk_spec, plan, context)
+                continue
+            
             # Prepare Step
             step = self._prepare_step(child, tree_widget, "Child", context)
             if step:
+                step['index'] = len(plan)
+                step['parent'] = context.get('parent_index')
                 plan.append(step)
                 
-                # Update Context for traversing DEEPER (Metadata for grandchild)
-                branch_context = context.copy()
-                branch_context['counters'] = context['counters'].copy() 
-                
-                current_type = step['type']
-                current_code = step['params'].get('code')
-                
-                branch_context['parent_code'] = current_code
-                branch_context['parent_type'] = current_type
-                
-                # Extract paths from the generated data to pass down
-                data_params = step['params'].get('data', {})
-                if current_type == "project":
-                    branch_context['project_path'] = data_params.get('project_path')
-                    branch_context['project_code'] = data_params.get('project_code')
-                elif current_type == "episode":
-                    branch_context['episode_path'] = data_params.get('episode_path')
-                    branch_context['episode_code'] = data_params.get('episode_code')
-                elif current_type == "sequence":
-                    branch_context['sequence_path'] = data_params.get('sequence_path')
-                    branch_context['sequence_code'] = data_params.get('sequence_code')
-                elif current_type == "asset_type":
-                     # Special logic to calculate Asset Type Path if not in data
-                     proj_path = context.get('project_path', "")
-                     at_name = step['name'].lower().replace(" ", "")
-                     if proj_path:
-                         branch_context['asset_type_path'] = f"{proj_path}/assets/{at_name}"
-                     branch_context['asset_type_name'] = at_name
-                
-                # If we just entered a Sequence, reset shot counter in the branch context
-                if current_type == "sequence":
-                     branch_context['counters']['shot'] = 0
-                
+                branch_context = self._branch_context(step, context)
                 self._collect_children(child, tree_widget, plan, branch_context)
 
+    def _collect_bulk(self, level, plan, context, hierarchy=True):
+        """
+        Expands one bulk spec level (see core/bulk.py) lazily into plan steps.
+        Steps are resolved exactly like UI nodes, but carry no widget.
+        """
+        level = bulk.normalize_spec(level)
+        for props in bulk.iter_level(level, context.get('parent_name', "")):
+            step = self._make_step(level['type'], props, "Bulk", context)
+            step['index'] = len(plan)
+            step['parent'] = context.get('parent_index')
+            plan.append(step)
+            
+            if hierarchy and level['children']:
+                branch_context = self._branch_context(step, context)
+                for child_level in level['children']:
+                    self._collect_bulk(child_level, plan, branch_context)
+
+    def _branch_context(self, step, context):
+        """Context for traversing DEEPER below 'step' (Metadata for grandchild)."""
+        branch_context = context.copy()
+        branch_context['counters'] = context['counters'].copy() 
+        
+        current_type = step['type']
+        current_code = step['params'].get('code')
+        
+        branch_context['parent_code'] = current_code
+        branch_context['parent_type'] = current_type
+        branch_context['parent_index'] = step['index']
+        branch_context['parent_name'] = step['name']
+        
+        # Extract paths from the generated data to pass down
+        data_params = step['params'].get('data', {})
+        if current_type == "project":
+            branch_context['project_path'] = data_params.get('project_path')
+            branch_context['project_code'] = data_params.get('project_code')
+        elif current_type == "episode":
+            branch_context['episode_path'] = data_params.get('episode_path')
+            branch_context['episode_code'] = data_params.get('episode_code')
+        elif current_type == "sequence":
+            branch_context['sequence_path'] = data_params.get('sequence_path')
+            branch_context['sequence_code'] = data_params.get('sequence_code')
+        elif current_type == "asset_type":
+             # Special logic to calculate Asset Type Path if not in data
+             proj_path = context.get('project_path', "")
+             at_name = step['name'].lower().replace(" ", "")
+             if proj_path:
+                 branch_context['asset_type_path'] = f"{proj_path}/assets/{at_name}"
+             branch_context['asset_type_name'] = at_name
+        
+        # If we just entered a Sequence, reset shot counter in the branch context
+        if current_type == "sequence":
+             branch_context['counters']['shot'] = 0
+        
+        return branch_context
+
     def _prepare_step(self, item, tree_widget, role, context):
         widget = self._get_node_widget(tree_widget, item)
         if not widget: return None
         
         node_type = widget.node_frame.node_type
         props = widget.node_frame.properties
+        return self._make_step(node_type, props, role, context, widget)
+
+    def _make_step(self, node_type, props, role, context, widget=None):
         name = props.get("name", "Unknown")
         
         # Calculate Params (Injecting Context)
@@ -340,6 +499,7 @@ class ProjectManager:
         """
         name = props.get("name", "Unknown")
         existing_codes = context.get('existing', {})
+        allocators = context.get('allocators') or {}
         counters = context.get('counters', {})
         
         # Context Paths
@@ -402,7 +562,8 @@ class ProjectManager:
             
         elif node_type == "episode":
             count = counters["episode"]
-            code = code_gen.generate_incremental_code("ep", existing_codes.get("episodes", []), count)
+            allocator = allocators.get("episodes") or code_gen.CodeAllocator(existing_codes.get("episodes", []))
+            code = allocator.code_for("ep", count)
             counters["episode"] += 1 
             
             ep_code_data = name.lower()
@@ -437,7 +598,8 @@ class ProjectManager:
             
         elif node_type == "sequence":
             count = counters["sequence"]
-            code = code_gen.generate_incremental_code("seq", existing_codes.get("sequences", []), count)
+            allocator = allocators.get("sequences") or code_gen.CodeAllocator(existing_codes.get("sequences", []))
+            code = allocator.code_for("seq", count)
             counters["sequence"] += 1
             
             eff_parent_path = episode_path if episode_path else project_path
@@ -661,14 +823,99 @@ class ProjectManager:
             
         return True, "Sanity Check Passed"
 
+    def fetch_existing_names(self, project_name):
+        """
+        One bulk fetch of everything the validator compares against:
+        global asset types, plus the project's entities if it already exists.
+        """
+        if not self.connected:
+            return {}
+        
+        try:
+            asset_types = gazu.asset.all_asset_types()
+            project = gazu.project.get_project_by_name(project_name) if project_name else None
+            if not project:
+                return validator.existing_names_from_entities(asset_types=asset_types)
+            
+            return validator.existing_names_from_entities(
+                episodes=gazu.shot.all_episodes_for_project(project),
+                sequences=gazu.shot.all_sequences_for_project(project),
+                shots=gazu.shot.all_shots_for_project(project),
+                asset_types=asset_types,
+                assets=gazu.asset.all_assets_for_project(project)
+            )
+        except Exception as e:
+            self.log(f"Could not fetch existing entities: {e}", "WARNING")
+            return {}
+
+    def validate_plan(self, plan):
+        """
+        Checks the whole plan in one pass before anything is sent to Kitsu.
+        Returns the list of problems (see core.validator).
+        """
+        # Combined plans (build_plans) may hold several projects: each is
+        # checked against its own entities
+        projects = {step.get('index', i): step.get('name') for i, step in enumerate(plan) if step.get('type') == 'project'}
+        fetched = {name: self.fetch_existing_names(name) for name in dict.fromkeys(projects.values())}
+        existing = self.fetch_existing_names(None) if not projects else {}
+        problems = validator.validate_plan(
+            plan, existing,
+            existing_by_project={index: fetched[name] for index, name in projects.items()}
+        )
+        
+        for p in problems:
+            self.log(f"[Validation] {p['type']} '{p['name']}' (step {p['index']}): {p['message']}", p['severity'])
+        if not problems:
+            self.log("Plan validation passed.", "SUCCESS")
+        return problems
+
+    def materialize_folders(self, plan, dry_run=False, workers=None):
+        """
+        Creates the folders described by the plan's paths and *_tree templates
+        (see core.materialize). plan: list of steps, loaded entities, or the
+        path of a plan file. Returns the report.
+        """
+        self.log_section("📁 Creating Folders" if not dry_run else "📁 Folder Dry Run")
+        if isinstance(plan, str):
+            plan = plan_io.iter_plan(plan)
+            
+        directories = materialize.collect_directories(plan)
+        report = materialize.materialize(
+            directories, workers=workers, dry_run=dry_run,
+            progress=lambda done, total: self.log(f"Folders: {done}/{total}", "DEBUG")
+        )
+        
+        if dry_run:
+            for path in report["created"]:
+                self.log(f"Would create: {path}", "DEBUG")
+        for path, error in report["failed"]:
+            self.log(f"Could not create {path}: {error}", "ERROR")
+        self.log(materialize.format_summary(report), "ERROR" if report["failed"] else "SUCCESS")
+        return report
+
     def execute_plan(self, plan):
+        """
+        Executes a plan step by step.
+        plan: list of steps, any iterable of steps, or the path of a plan file
+        written by plan_io (read lazily, so a 50k-step plan is never fully loaded).
+        """
         self.log_section("🚀 Executing Plan")
         
-        if not plan:
+        if isinstance(plan, str):
+            plan = plan_io.iter_plan(plan)
+        elif isinstance(plan, list):
+            # Combined plans (build_plans) hold one project per root
+            starts = [i for i, s in enumerate(plan) if s['type'] == 'project' and s.get('parent') is None]
+            if len(starts) > 1:
+                bounds = sorted(set([0] + starts)) + [len(plan)]
+                return all([self.execute_plan(plan[a:b]) for a, b in zip(bounds, bounds[1:])])
+        steps = iter(plan)
+        
+        project_step = next(steps, None)
+        if not project_step:
             self.log("Empty Plan", "WARNING")
             return
             
-        project_step = plan[0]
         if project_step['type'] != 'project':
             self.log("Plan invalid: First item must be Project.", "ERROR")
             return
@@ -732,7 +979,8 @@ class ProjectManager:
             self.log(f"✅ Project '{proj_name}' Configured.", "SUCCESS")
             
             project_step['created_entity'] = project
-            if len(plan) == 1: return 
+            first_child = next(steps, None)
+            if first_child is None: return 
             
         except Exception as e:
             self.log(f"❌ Project Creation Failed: {e}", "ERROR")
@@ -743,8 +991,25 @@ class ProjectManager:
         
         entity_cache = { ("project", proj_name): project }
         success_count = 0
+        processed = 1
+        
+        # Parents are resolved through the step's 'parent' index; steps without one
+        # (hand-built plans) fall back to the closest preceding step of the parent type.
+        created_by_index = { project_step.get('index', 0): project_step }
+        last_of_type = { "project": project_step }
         
-        for step in plan[1:]:
+        def find_parent(step, parent_type):
+            parent_index = step.get('parent')
+            if parent_index is not None:
+                parent_step = created_by_index.get(parent_index)
+                if parent_step and parent_step['type'] == parent_type:
+                    return parent_step.get('created_entity')
+                return None
+            parent_step = last_of_type.get(parent_type)
+            return parent_step.get('created_entity') if parent_step else None
+        
+        for step in itertools.chain([first_child], steps):
+            processed += 1
             try:
                 node_type = step['type']
                 name = step['name']
@@ -775,14 +1040,10 @@ class ProjectManager:
                     entity_cache[("episode", name)] = created_entity
                     
                 elif node_type == "sequence":
-                    # Find Parent Episode (Scan backwards in plan)
-                    idx = plan.index(step)
+                    # Find Parent Episode
                     parent_ep_obj = None
                     if project.get('production_type') == 'tv_show':
-                        for i in range(idx-1, -1, -1):
-                            if plan[i]['type'] == 'episode':
-                                parent_ep_obj = plan[i].get('created_entity')
-                                break
+                        parent_ep_obj = find_parent(step, 'episode')
                     
                     created_entity = gazu.shot.new_sequence(
                         project=project,
@@ -801,13 +1062,8 @@ class ProjectManager:
                     entity_cache[("sequence", name)] = created_entity
 
                 elif node_type == "shot":
-                    # Find Parent Sequence (Scan backwards)
-                    idx = plan.index(step)
-                    parent_seq_obj = None
-                    for i in range(idx-1, -1, -1):
-                        if plan[i]['type'] == 'sequence':
-                            parent_seq_obj = plan[i].get('created_entity')
-                            break
+                    # Find Parent Sequence
+                    parent_seq_obj = find_parent(step, 'sequence')
                     
                     if parent_seq_obj:
                         created_entity = gazu.shot.new_shot(
@@ -840,16 +1096,11 @@ class ProjectManager:
                      at_obj = None
                      if at_name:
                          at_obj = entity_cache.get(("asset_type", at_name))
-                         if not at_obj: list(filter(lambda x: x['type'] == 'asset_type' and x['name'] == at_name, plan))
                          # Fallback to fetch
                          if not at_obj: at_obj = gazu.asset.get_asset_type_by_name(at_name)
                      
                      if not at_obj:
-                         idx = plan.index(step)
-                         for i in range(idx-1, -1, -1):
-                             if plan[i]['type'] == 'asset_type':
-                                 at_obj = plan[i].get('created_entity')
-                                 break
+                         at_obj = find_parent(step, 'asset_type')
                      
                      if at_obj:
                          created_entity = gazu.asset.new_asset(
@@ -879,9 +1130,15 @@ class ProjectManager:
                      
             except Exception as e:
                 self.log(f"Failed {node_type} {name}: {e}", "ERROR")
+            
+            # Only steps that can parent others need to stay referenced
+            if step.get('type') in ("episode", "sequence", "asset_type"):
+                last_of_type[step['type']] = step
+                if step.get('index') is not None:
+                    created_by_index[step['index']] = step
 
         self.log_section("🏁 Execution Finished")
-        self.log(f"Processed {len(plan)} items. Success: {success_count}.", "INFO")
+        self.log(f"Processed {processed} items. Success: {success_count}.", "INFO")
         
         if proj_name:
             self.verify_project_data(proj_name)
@@ -0,0 +1,163 @@
+# ============================================================================
+# PLAN VALIDATION
+# ============================================================================
+# Runs over a whole plan in one pass, before any request is sent to Kitsu.
+# Everything is checked through hash indexes:
+#   (parent, type, name) -> first step index     duplicate names
+#   (parent, code)       -> first step index     colliding codes
+#   (type, parent name, name)                    names already on the server
+
+# Which step type each entity expects as its parent in Kitsu
+EXPECTED_PARENTS = {
+    "shot": ("sequence",),
+    "asset": ("asset_type",),
+}
+
+
+def _key(value):
+    return (value or "").strip().lower()
+
+
+def _problem(index, step, message, severity="ERROR"):
+    return {
+        "index": index,
+        "type": step.get("type"),
+        "name": step.get("name"),
+        "severity": severity,
+        "message": message
+    }
+
+
+def server_name(step):
+    """The name execute_plan gives the step's entity in Kitsu (episodes are named after their code)."""
+    name = step.get("name")
+    if step.get("type") == "episode":
+        code = (step.get("params") or {}).get("code", name)
+        return code.upper() if code else name
+    return name
+
+
+def existing_names_from_entities(episodes=None, sequences=None, shots=None, asset_types=None, assets=None):
+    """
+    Builds the server-side name index from bulk gazu results.
+    Returns {"names": set of (type, parent_name, name), "asset_types": set of names}.
+    """
+    names = set()
+    seq_by_id = {}
+    ep_by_id = {}
+    type_by_id = {}
+
+    for ep in episodes or []:
+        ep_by_id[ep.get("id")] = ep.get("name")
+        names.add(("episode", "", _key(ep.get("name"))))
+
+    for seq in sequences or []:
+        seq_by_id[seq.get("id")] = seq.get("name")
+        parent_name = ep_by_id.get(seq.get("parent_id"), "")
+        names.add(("sequence", _key(parent_name), _key(seq.get("name"))))
+
+    for shot in shots or []:
+        parent_name = seq_by_id.get(shot.get("parent_id"), shot.get("sequence_name", ""))
+        names.add(("shot", _key(parent_name), _key(shot.get("name"))))
+
+    for at in asset_types or []:
+        type_by_id[at.get("id")] = at.get("name")
+
+    for asset in assets or []:
+        parent_name = type_by_id.get(asset.get("entity_type_id"), asset.get("asset_type_name", ""))
+        names.add(("asset", _key(parent_name), _key(asset.get("name"))))
+
+    return {
+        "names": names,
+        "asset_types": {_key(at.get("name")) for at in asset_types or []}
+    }
+
+
+def validate_plan(plan, existing=None, existing_by_project=None):
+    """
+    Validates every step of 'plan' in a single pass.
+    existing: optional index from existing_names_from_entities().
+    existing_by_project: optional {project step index: index} for merged
+        multi-project plans; the steps after a project step are checked
+        against its index (falling back to 'existing').
+    Returns a list of problem dicts (empty if the plan is clean).
+    """
+    existing = existing or {}
+    existing_by_project = existing_by_project or {}
+    existing_names = existing.get("names", set())
+    server_asset_types = existing.get("asset_types", set())
+
+    problems = []
+    parents = {}          # step index -> (type, server name); only steps that can have children
+    names_index = {}      # (parent index, type, name) -> step index
+    codes_index = {}      # (parent index, code) -> step index
+    plan_asset_types = set()
+
+    for position, step in enumerate(plan):
+        index = step.get("index", position)
+        node_type = step.get("type")
+        name = step.get("name")
+        params = step.get("params") or {}
+        parent_index = step.get("parent")
+        parent_type, parent_name = parents.get(parent_index, (None, ""))
+
+        if node_type == "project":
+            project_existing = existing_by_project.get(index, existing)
+            existing_names = project_existing.get("names", set())
+            server_asset_types = project_existing.get("asset_types", set())
+
+        if not _key(name):
+            problems.append(_problem(index, step, f"{node_type} has an empty name."))
+
+        if node_type != "project" and parent_index is not None and parent_index not in parents:
+            problems.append(_problem(index, step, f"Parent step {parent_index} is missing or comes after this step."))
+
+        # 1. Duplicate names under one parent
+        name_key = (parent_index, node_type, _key(name))
+        first = names_index.get(name_key)
+        if first is not None:
+            problems.append(_problem(index, step, f"Duplicate {node_type} name '{name}' (also step {first})."))
+        else:
+            names_index[name_key] = index
+
+        # 2. Colliding codes under one parent
+        code = params.get("code")
+        if code and node_type != "project":
+            code_key = (parent_index, _key(code))
+            first = codes_index.get(code_key)
+            if first is not None:
+                problems.append(_problem(index, step, f"Code '{code}' collides with step {first}."))
+            else:
+                codes_index[code_key] = index
+
+        # 3. Parent type / asset type resolution
+        expected = EXPECTED_PARENTS.get(node_type)
+        if node_type == "asset":
+            at_name = _key((params.get("data") or {}).get("asset_type"))
+            resolvable = (
+                parent_type == "asset_type"
+                or at_name in plan_asset_types
+                or at_name in server_asset_types
+            )
+            if not resolvable:
+                problems.append(_problem(index, step, f"Asset type '{at_name or '?'}' cannot be resolved."))
+        elif expected and parent_type not in expected:
+            problems.append(_problem(index, step, f"{node_type} needs a {' or '.join(expected)} parent."))
+
+        # 4. Names that already exist on the server (gazu will reuse them)
+        server_parent = parent_name if parent_type in ("episode", "sequence", "asset_type") else ""
+        if (node_type, _key(server_parent), _key(server_name(step))) in existing_names:
+            problems.append(_problem(index, step, f"{node_type} '{server_name(step)}' already exists in Kitsu and will be reused.", "WARNING"))
+
+        if node_type in ("project", "episode", "sequence", "asset_type"):
+            parents[index] = (node_type, server_name(step))
+        if node_type == "asset_type":
+            plan_asset_types.add(_key(name))
+            # build_plan stores the asset type on assets as name.lower() without spaces
+            plan_asset_types.add(_key(name).replace(" ", ""))
+
+    return problems
+
+
+def has_errors(problems):
+    return any(p["severity"] == "ERROR" for p in problems)
@@ -0,0 +1,284 @@
+import os
+import sys
+import time
+import select
+import struct
+import threading
+from ..config import FOLDER_WATCH_BACKEND, FOLDER_WATCH_DEBOUNCE, FOLDER_WATCH_POLL_INTERVAL
+from .scan_cache import RACY_WINDOW
+
+# ============================================================================
+# FOLDER WATCHER
+# ============================================================================
+# Watches a set of directories (not recursively) for sub-folders being
+# created, deleted or renamed, and hands the changes to a callback in
+# debounced batches from a background thread:
+#
+#   watcher = FolderWatcher(on_changes)     # on_changes([("created", path), ("deleted", path)])
+#   watcher.watch("/show/sequences")
+#   watcher.start()
+#   ...
+#   watcher.stop()
+#
+# A rename arrives as ("deleted", old path) + ("created", new path).
+# Changes to the same path within one batch are folded into their net effect.
+# When the kernel drops events (inotify queue overflow) the batch is a single
+# (RESCAN, None): the receiver must re-list every folder it watches.
+# Backends: inotify (Linux, through libc, no extra dependency) or polling
+# (everywhere else; one stat per folder per poll, listing only on mtime change).
+# Nothing here depends on Qt, so long-running headless sync processes can use it.
+
+CREATED = "created"
+DELETED = "deleted"
+RESCAN = "rescan"
+MAX_DELAY_FACTOR = 10  # a batch is never held back longer than 10 x debounce
+
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class _InotifyBackend:
+    name = "inotify"
+
+    def __init__(self, libc):
+        self.libc = libc
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError("inotify_init1 failed")
+        self.paths = {}  # wd -> path
+        self.wds = {}    # path -> wd
+        self.lock = threading.Lock()
+
+    def add(self, path, names=None):
+        mask = _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            return  # Gone or unreadable: nothing to watch
+        with self.lock:
+            self.paths[wd] = path
+            self.wds[path] = wd
+
+    def remove(self, path):
+        with self.lock:
+            wd = self.wds.pop(path, None)
+            if wd is not None:
+                self.paths.pop(wd, None)
+        if wd is not None:
+            self.libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                events.append((RESCAN, None))  # Events were lost
+                continue
+            with self.lock:
+                parent = self.paths.get(wd)
+                if mask & _IN_IGNORED and parent is not None:
+                    self.paths.pop(wd, None)
+                    self.wds.pop(parent, None)
+            if parent is None or not name or not mask & _IN_ISDIR:
+                continue
+            path = os.path.join(parent, name)
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                events.append((CREATED, path))
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                events.append((DELETED, path))
+        return events
+
+    def wake(self):
+        pass  # read() never blocks longer than its timeout
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _PollingBackend:
+    name = "poll"
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.snapshots = {}  # path -> (mtime_ns or None, set of sub-folder names or None)
+        self.lock = threading.Lock()
+        self._wake = threading.Event()
+        self._last_poll = None  # time.monotonic() of the last pass over the folders
+
+    def add(self, path, names=None):
+        """names: sub-folders already known (saves the first listing)."""
+        mtime = None
+        if names is not None:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+            # Same rule as the scan cache: a too recent mtime may hide a change
+            if mtime is not None and time.time() - mtime / 1e9 < RACY_WINDOW:
+                mtime = None
+        with self.lock:
+            self.snapshots[path] = (mtime, set(names) if names is not None else None)
+
+    def remove(self, path):
+        with self.lock:
+            self.snapshots.pop(path, None)
+
+    def read(self, timeout):
+        """Polls once 'interval' has passed since the last poll; [] until then (at most 'timeout')."""
+        due = 0.0 if self._last_poll is None else self._last_poll + self.interval - time.monotonic()
+        self._wake.wait(max(0.0, min(timeout, due)))
+        if self._wake.is_set() or due > timeout:
+            return []
+        self._last_poll = time.monotonic()
+        with self.lock:
+            snapshots = list(self.snapshots.items())
+
+        events = []
+        for path, (mtime, names) in snapshots:
+            try:
+                current_mtime = os.stat(path).st_mtime_ns
+                if current_mtime == mtime:
+                    continue
+                with os.scandir(path) as it:
+                    current = {e.name for e in it if e.is_dir()}
+            except OSError:
+                self.remove(path)  # Deleted: its parent reports it
+                continue
+            if names is not None:
+                events.extend((CREATED, os.path.join(path, n)) for n in sorted(current - names))
+                events.extend((DELETED, os.path.join(path, n)) for n in sorted(names - current))
+            with self.lock:
+                if path in self.snapshots:
+                    self.snapshots[path] = (current_mtime, current)
+        return events
+
+    def wake(self):
+        self._wake.set()
+
+    def close(self):
+        self._wake.set()
+
+
+def coalesce(events):
+    """Folds a list of events into the net change per path, first-seen order kept."""
+    if any(kind == RESCAN for kind, _ in events):
+        return [(RESCAN, None)]  # A full re-list supersedes everything else
+    net = {}  # path -> (first kind, last kind)
+    for kind, path in events:
+        first, _ = net.get(path, (kind, kind))
+        net[path] = (first, kind)
+
+    result = []
+    for path, (first, last) in net.items():
+        if first == CREATED and last == DELETED:
+            continue  # Came and went
+        if first == DELETED and last == CREATED:
+            result.append((DELETED, path))  # Replaced: drop what was there
+        result.append((last, path))
+    return result
+
+
+class FolderWatcher:
+    def __init__(self, callback, backend=None, debounce=None, poll_interval=None):
+        """
+        callback(events): called from the watcher thread with a coalesced batch,
+            once no new change arrived for 'debounce' seconds.
+        backend: "inotify", "poll" or "auto" (defaults to FOLDER_WATCH_BACKEND).
+        """
+        self.callback = callback
+        self.debounce = FOLDER_WATCH_DEBOUNCE if debounce is None else debounce
+        interval = FOLDER_WATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        backend = backend or FOLDER_WATCH_BACKEND
+
+        self.backend = None
+        if backend in ("auto", "inotify"):
+            libc = _load_libc()
+            if libc:
+                try:
+                    self.backend = _InotifyBackend(libc)
+                except OSError:
+                    pass
+        if self.backend is None:
+            self.backend = _PollingBackend(interval)
+
+        self._thread = None
+        self._stopped = threading.Event()
+
+    @property
+    def backend_name(self):
+        return self.backend.name
+
+    def watch(self, path, names=None):
+        """Starts watching 'path' for sub-folder changes ('names': its known sub-folders)."""
+        self.backend.add(path, names)
+
+    def unwatch(self, path):
+        self.backend.remove(path)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="FolderWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stops the thread (pending, undelivered changes are dropped)."""
+        self._stopped.set()
+        self.backend.wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.backend.close()
+
+    def _run(self):
+        pending = []
+        first_event = last_event = 0.0
+        while not self._stopped.is_set():
+            timeout = self.debounce if pending else 0.2
+            events = self.backend.read(timeout)
+            now = time.monotonic()
+            if events:
+                if not pending:
+                    first_event = now
+                pending.extend(events)
+                last_event = now
+            # Deliver after a quiet period, or anyway once changes keep coming for too long
+            quiet = now - last_event >= self.debounce
+            overdue = now - first_event >= self.debounce * MAX_DELAY_FACTOR
+            if pending and (quiet or overdue):
+                batch = coalesce(pending)
+                pending = []
+                if batch:
+                    self.callback(batch)
@@ -47,3 +47,22 @@ RULE_MAP = {
     "Asset Only": ASSET_ONLY_RULES,
     "Custom": CUSTOM_RULES
 }
+
+# Folder naming conventions used to tell entity types apart when a folder may
+# hold several of them (e.g. Custom: project -> episode, sequence, asset_type).
+# Types without an entry (asset_type, asset) take whatever matches nothing else.
+ENTITY_NAME_PATTERNS = {
+    "episode": r"^(ep|episode)[ _-]?\d+",
+    "sequence": r"^(sq|seq|sequence)[ _-]?\d+",
+    "shot": r"^(sh|shot)[ _-]?\d+"
+}
+
+# Per-template naming conventions used by the folder builder to auto-map a
+# scan in one batch. Entries override ENTITY_NAME_PATTERNS for that template,
+# e.g. {"TV Show": {"episode": r"^e\d{3}"}}.
+TEMPLATE_NAME_PATTERNS = {}
+
+
+def name_patterns_for(template_name):
+    """{entity_type: regex} naming conventions in effect for a template."""
+    return {**ENTITY_NAME_PATTERNS, **TEMPLATE_NAME_PATTERNS.get(template_name, {})}
@@ -120,6 +120,7 @@ class MainWindow(QMainWindow):
         self.console.log("Application started successfully", "SUCCESS")
         self.apply_template("Custom")
         self.project_panel.node_selected.connect(self.properties_panel.load_nodes)
+        self.properties_panel.node_changed.connect(self.project_panel.on_node_property_changed)
         self.project_panel.viewer_requested.connect(self.on_viewer_requested)
         
         self.project_panel.log_message.connect(self.console.log)
@@ -248,7 +249,7 @@ class MainWindow(QMainWindow):
              self.rebuild_tree_from_data(data)
 
     def rebuild_tree_from_data(self, data):
-        self.project_panel.tree.clear()
+        self.project_panel.clear_tree()
         
         # 1. Update Watermark
         prod_type = data.get('production_type', 'TV Show') # Default
@@ -260,23 +261,29 @@ class MainWindow(QMainWindow):
         self.project_panel.status_label.setText(f"Project Loaded: {p_name}")
         
         # Root is project
-        root_item = self.project_panel.add_node(None, "project", is_root=True)
-        self._apply_properties_to_node(root_item, data, is_loaded=True)
-        self.project_panel.tree.expandItem(root_item)
-        
-        self._recursive_build(root_item, data.get("children", []), is_loaded=True)
+        # Every node's properties go into one console entry instead of two appends per node
+        log_lines = []
+        with self.project_panel.batch_insert():
+            root_item = self.project_panel.add_node(None, "project", is_root=True)
+            self._apply_properties_to_node(root_item, data, is_loaded=True, log_lines=log_lines)
+            self.project_panel.tree.expandItem(root_item)
+            
+            self._recursive_build(root_item, data.get("children", []), is_loaded=True, log_lines=log_lines)
+        if log_lines:
+            self.console.log("\n".join(log_lines), "DEBUG")
         self.console.log("Tree reconstruction complete.", "SUCCESS")
 
-    def _recursive_build(self, parent_item, children_data, is_loaded=False):
+    def _recursive_build(self, parent_item, children_data, is_loaded=False, log_lines=None):
         for child_data in children_data:
             node_type = child_data['type']
             new_item = self.project_panel.add_node(parent_item, node_type)
-            self._apply_properties_to_node(new_item, child_data, is_loaded=is_loaded)
+            self._apply_properties_to_node(new_item, child_data, is_loaded=is_loaded, log_lines=log_lines)
             
             # Recursion
-            self._recursive_build(new_item, child_data.get("children", []), is_loaded=is_loaded)
+            self._recursive_build(new_item, child_data.get("children", []), is_loaded=is_loaded, log_lines=log_lines)
 
-    def _apply_properties_to_node(self, item, data, is_loaded=False):
+    def _apply_properties_to_node(self, item, data, is_loaded=False, log_lines=None):
+        """Applies loaded properties; the log lines are appended to 'log_lines' when given, else logged now."""
         widget = self.project_panel.tree.itemWidget(item, 0)
         if widget and widget.node_frame:
              props = data.get("properties", {})
@@ -288,19 +295,20 @@ class MainWindow(QMainWindow):
              name = props.get("name", "Unknown")
              type_ = data.get("type", "Unknown")
              
-             self.console.log(f"Loading {type_}: {name}", "DEBUG")
              widget.node_frame.properties.update(props)
              
              # Also update visual name
-             widget.node_frame.name_edit.setText(name)
+             widget.node_frame.set_label(name)
              
              # Log parameters logic
-             log_lines = []
+             lines = [f"Loading {type_}: {name}"]
              for k, v in props.items():
-                  log_lines.append(f"  {k}: {v}")
+                  lines.append(f"  {k}: {v}")
              
-             if log_lines:
-                 self.console.log("\n".join(log_lines), "DEBUG")
+             if log_lines is not None:
+                 log_lines.extend(lines)
+             else:
+                 self.console.log("\n".join(lines), "DEBUG")
 
     def on_viewer_requested(self, params, node_type):
         dialog = EntityViewerDialog(params, node_type, self)
@@ -1,5 +1,7 @@
 from ..utils.compat import *
 from ..utils import code_gen
+from ..core import bulk
+from ..core import materialize
 import json
 
 class GenerationSummaryDialog(QDialog):
@@ -52,6 +54,12 @@ class GenerationSummaryDialog(QDialog):
         self.btn_cancel.clicked.connect(self.reject)
         btn_layout.addWidget(self.btn_cancel)
         
+        if hasattr(self.manager, 'materialize_folders'):
+            self.btn_folders = QPushButton("Create Folders")
+            self.btn_folders.setToolTip("Create the plan's folders on disk (no Kitsu request)")
+            self.btn_folders.clicked.connect(self.on_create_folders)
+            btn_layout.addWidget(self.btn_folders)
+        
         if self.manager:
              self.btn_gen_query = QPushButton("Generate & Query")
              self.btn_gen_query.setStyleSheet("background-color: #1976D2; color: white; font-weight: bold; padding: 5px 15px;")
@@ -81,8 +89,30 @@ class GenerationSummaryDialog(QDialog):
                 self.status_label.setText(f"Error: {msg}")
                 self.status_label.setStyleSheet("color: #F44336; font-weight: bold;")
                 return False
+        
+        # Whole-plan validation: report every problem at once
+        if hasattr(self.manager, 'validate_plan'):
+            self.status_label.setText("Validating plan...")
+            QApplication.processEvents()
+            
+            problems = self.manager.validate_plan(self.plan)
+            errors = [p for p in problems if p['severity'] == 'ERROR']
+            if errors:
+                self.show_problems(problems)
+                self.status_label.setText(f"Error: {len(errors)} problem(s) found in plan.")
+                self.status_label.setStyleSheet("color: #F44336; font-weight: bold;")
+                return False
         return True
 
+    def show_problems(self, problems):
+        colors = {"ERROR": "#F44336", "WARNING": "#FFB74D"}
+        rows = []
+        for p in problems:
+            color = colors.get(p['severity'], "#d4d4d4")
+            rows.append(f"<li><span style='color: {color};'>[{p['severity']}]</span> "
+                        f"<b>{p['type']}</b> {p['name']} (step {p['index']}): {p['message']}</li>")
+        self.details.setHtml(f"<h3>Plan Validation</h3><ul>{''.join(rows)}</ul>")
+
     def on_generate(self):
         if not self.manager: return
         
@@ -107,6 +137,18 @@ class GenerationSummaryDialog(QDialog):
             self.status_label.setText(f"Error: {str(e)}")
             self.set_buttons_enabled(True)
 
+    def on_create_folders(self):
+        self.status_label.setText("Creating folders... Please wait.")
+        self.set_buttons_enabled(False)
+        QApplication.processEvents()
+        try:
+            report = self.manager.materialize_folders(self.plan)
+            self.status_label.setText(materialize.format_summary(report))
+            self.status_label.setStyleSheet("color: #F44336; font-weight: bold;" if report["failed"] else "color: #888; font-style: italic; margin-left: 10px;")
+        except Exception as e:
+            self.status_label.setText(f"Error: {str(e)}")
+        self.set_buttons_enabled(True)
+
     def on_generate_query(self):
         if not self.manager: return
         
@@ -152,6 +194,7 @@ class GenerationSummaryDialog(QDialog):
     def set_buttons_enabled(self, enabled):
         self.btn_generate.setEnabled(enabled)
         if hasattr(self, 'btn_gen_query'): self.btn_gen_query.setEnabled(enabled)
+        if hasattr(self, 'btn_folders'): self.btn_folders.setEnabled(enabled)
         self.btn_cancel.setEnabled(True) 
         pass
 
@@ -162,6 +205,8 @@ class GenerationSummaryDialog(QDialog):
         # Map source QTreeWidgetItem -> Dialog QTreeWidgetItem
         # This allows us to reconstruct the hierarchy if the plan items are ordered parents-first
         item_map = {}
+        # Plans loaded from a plan file have no widgets; they link parents by step index
+        index_map = {}
         
         for step in self.plan:
             # Try to find parent in our map
@@ -173,6 +218,8 @@ class GenerationSummaryDialog(QDialog):
                 source_parent = source_item.parent()
                 if source_parent in item_map:
                     parent_item = item_map[source_parent]
+            elif step.get('parent') is not None:
+                parent_item = index_map.get(step['parent'])
             
             # Create item attached to parent (or root)
             if parent_item:
@@ -200,6 +247,8 @@ class GenerationSummaryDialog(QDialog):
             # Register in map
             if widget and hasattr(widget, 'item'):
                 item_map[widget.item] = item
+            if step.get('index') is not None:
+                index_map[step['index']] = item
             
             # Expand by default
             item.setExpanded(True)
@@ -680,3 +729,140 @@ class LoginDialog(QDialog):
     def get_credentials(self):
         return self.host, self.email, self.password
 
+
+
+class BulkSpecDialog(QDialog):
+    """
+    Describes a bulk block (counts + naming patterns per level) instead of
+    adding nodes one by one. The result is a spec for core/bulk.py.
+    """
+    def __init__(self, rules, parent_type, parent=None):
+        super().__init__(parent)
+        self.rules = rules or {}
+        self.parent_type = parent_type
+        self.level_rows = []
+        self.setWindowTitle("Add Bulk Block")
+        self.resize(560, 220)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        form_layout = QFormLayout()
+        self.type_combo = QComboBox()
+        for child_type in self.rules.get(self.parent_type, {}).get("children", []):
+            self.type_combo.addItem(child_type.capitalize(), child_type)
+        self.type_combo.currentIndexChanged.connect(self.rebuild_levels)
+        form_layout.addRow("Block Type:", self.type_combo)
+        layout.addLayout(form_layout)
+
+        self.levels_layout = QtWidgets.QGridLayout()
+        layout.addLayout(self.levels_layout)
+
+        hint = QLabel("Pattern fields: {n} number, {i} position, {parent} parent name")
+        hint.setStyleSheet("color: #888; font-style: italic;")
+        layout.addWidget(hint)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(self.summary_label)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(self.reject)
+        btn_layout.addWidget(self.btn_cancel)
+
+        self.btn_ok = QPushButton("Add Block")
+        self.btn_ok.clicked.connect(self.on_accept)
+        self.btn_ok.setStyleSheet("background-color: #2e7d32; color: white; font-weight: bold; padding: 5px 15px;")
+        btn_layout.addWidget(self.btn_ok)
+
+        layout.addLayout(btn_layout)
+        self.rebuild_levels()
+
+    def level_chain(self, top_type):
+        """top_type and the first allowed child of every level below it."""
+        chain = [top_type]
+        while True:
+            children = self.rules.get(chain[-1], {}).get("children", [])
+            if not children or children[0] in chain:
+                return chain
+            chain.append(children[0])
+
+    def rebuild_levels(self):
+        while self.levels_layout.count():
+            w = self.levels_layout.takeAt(0).widget()
+            if w: w.deleteLater()
+        self.level_rows = []
+
+        top_type = self.type_combo.currentData()
+        if not top_type: return
+
+        for col, title in enumerate(["", "Level", "Count", "Pattern", "Start", "Step"]):
+            self.levels_layout.addWidget(QLabel(title), 0, col)
+
+        for row, node_type in enumerate(self.level_chain(top_type), start=1):
+            include = QCheckBox()
+            include.setChecked(row == 1)
+            include.setEnabled(row > 1)
+            count = QSpinBox()
+            count.setRange(0, 100000)
+            count.setValue(10)
+            pattern = QLineEdit(bulk.DEFAULT_PATTERNS.get(node_type, node_type + "{n:03d}"))
+            start = QSpinBox()
+            start.setRange(0, 1000000)
+            start.setValue(10)
+            step = QSpinBox()
+            step.setRange(1, 1000)
+            step.setValue(10)
+
+            for w in (include, count, start, step):
+                signal = w.toggled if w is include else w.valueChanged
+                signal.connect(self.update_summary)
+            pattern.textChanged.connect(self.update_summary)
+
+            self.levels_layout.addWidget(include, row, 0)
+            self.levels_layout.addWidget(QLabel(node_type.capitalize()), row, 1)
+            self.levels_layout.addWidget(count, row, 2)
+            self.levels_layout.addWidget(pattern, row, 3)
+            self.levels_layout.addWidget(start, row, 4)
+            self.levels_layout.addWidget(step, row, 5)
+            self.level_rows.append((node_type, include, count, pattern, start, step))
+
+        self.update_summary()
+
+    def get_spec(self):
+        """Nested spec of the included levels (stops at the first unchecked one)."""
+        spec = None
+        current = None
+        for node_type, include, count, pattern, start, step in self.level_rows:
+            if not include.isChecked(): break
+            level = {
+                "type": node_type,
+                "count": count.value(),
+                "pattern": pattern.text().strip(),
+                "start": start.value(),
+                "step": step.value(),
+                "children": []
+            }
+            if current is None: spec = level
+            else: current["children"].append(level)
+            current = level
+        return bulk.normalize_spec(spec) if spec else None
+
+    def update_summary(self):
+        try:
+            spec = self.get_spec()
+            self.summary_label.setText(bulk.describe(spec) if spec else "")
+            self.btn_ok.setEnabled(bool(spec))
+        except ValueError as e:
+            self.summary_label.setText(str(e))
+            self.btn_ok.setEnabled(False)
+
+    def on_accept(self):
+        try:
+            if self.get_spec(): self.accept()
+        except ValueError as e:
+            QMessageBox.warning(self, "Validation Error", str(e))
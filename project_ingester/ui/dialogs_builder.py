@@ -1,7 +1,15 @@
 from ..utils.compat import *
-from ..data.rules import RULE_MAP
+from ..data.rules import RULE_MAP, name_patterns_for
 from .themes import DARK_THEME # Fallback
+from ..core.scan_cache import SHARED_CACHE
+from ..core.scan_rules import DEFAULT_SCAN_RULES
+from ..core.naming import NameClassifier
+from ..core.watcher import FolderWatcher, CREATED, DELETED, RESCAN
+from ..config import SCAN_PREFETCH_WORKERS
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import os
+import time
+import queue
 # Fallback removed, relying on compat
 
 from ..utils.compat import * 
@@ -129,8 +137,156 @@ class BuilderTreeWidget(QTreeWidget):
             
             painter.restore()
 
-class FolderBuilderDialog(QDialog):
+class FolderScanWorker(QThread):
+    """
+    Lists requested folders in the background (through the shared scan cache)
+    and hands the listings back in batches, so the builder dialog can append
+    rows as they arrive instead of freezing on large roots.
+    """
+    batch_ready = Signal(list) # [(generation, path, [(name, path), ...]), ...]
+    
+    BATCH_SIZE = 50
+    BATCH_INTERVAL = 0.1 # seconds
+    
     def __init__(self, parent=None):
+        super().__init__(parent)
+        self.requests = queue.Queue()
+        self._stopped = False
+        
+    def request(self, generation, path):
+        self.requests.put((generation, path))
+        if not self.isRunning():
+            self.start()
+            
+    def cancel(self):
+        """Drops every request not yet listed."""
+        try:
+            while True:
+                self.requests.get_nowait()
+        except queue.Empty:
+            pass
+            
+    def stop(self):
+        self._stopped = True
+        self.cancel()
+        self.wait()
+        
+    def run(self):
+        batch = []
+        last_emit = time.monotonic()
+        while not self._stopped:
+            try:
+                generation, path = self.requests.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            
+            batch.append((generation, path, SHARED_CACHE.list_dirs(path)))
+            
+            # Flush when idle (first rows show up immediately) or when the batch is big/old enough
+            if self.requests.empty() or len(batch) >= self.BATCH_SIZE or time.monotonic() - last_emit >= self.BATCH_INTERVAL:
+                self.batch_ready.emit(batch)
+                batch = []
+                last_emit = time.monotonic()
+
+
+def guess_category_folder(entity_type, parent_path, subfolders):
+    """
+    Folder a category row maps to by default: a sub-folder named after the
+    type ("shot"/"shots"), else the parent itself (<Direct Children>) if it
+    has sub-folders, else None (left for the user).
+    """
+    aliases = (entity_type.lower(), entity_type.lower() + "s")
+    for name, path in subfolders:
+        if name.lower() in aliases:
+            return path
+    return parent_path if subfolders else None
+
+
+class SiblingPrefetchWorker(QThread):
+    """
+    Lists, concurrently and off the GUI thread, every folder that applying a
+    mapping to siblings will need: the mapped folders, their instances, and
+    recursively whatever the default category mapping picks below them.
+    Emits every listing at once so the tree can be updated in a single pass.
+    """
+    progress = Signal(int, int) # listed, known so far
+    listed = Signal(int, dict)  # cascade id, {path: visible sub-folders}
+    
+    def __init__(self, cascade_id, jobs, rules, scan_rules, folder_depth, parent=None):
+        """jobs: [(folder path, entity type of the instances it holds)]"""
+        super().__init__(parent)
+        self.cascade_id = cascade_id
+        self.jobs = jobs
+        self.rules = rules
+        self.scan_rules = scan_rules
+        self.folder_depth = folder_depth
+        self._stopped = False
+        
+    def stop(self):
+        self._stopped = True
+        self.wait()
+        
+    def _list(self, path):
+        if not self.scan_rules.can_descend(path, self.folder_depth(path)):
+            return []
+        return self.scan_rules.filter(SHARED_CACHE.list_dirs(path))
+        
+    def run(self):
+        results = self.collect()
+        if not self._stopped:
+            self.listed.emit(self.cascade_id, results)
+        
+    def collect(self):
+        """{path: listing} for every folder the cascade needs (also usable inline)."""
+        results = {}
+        needs = {} # path -> [("instances", type) or ("categories", [child types])]
+        
+        with ThreadPoolExecutor(max_workers=max(1, SCAN_PREFETCH_WORKERS)) as pool:
+            futures = {}
+            
+            def need(path, purpose):
+                if path in results:
+                    follow(path, purpose)
+                    return
+                needs.setdefault(path, []).append(purpose)
+                if len(needs[path]) == 1:
+                    futures[pool.submit(self._list, path)] = path
+                    
+            def follow(path, purpose):
+                kind, arg = purpose
+                listing = results[path]
+                if kind == "instances":
+                    child_types = self.rules.get(arg, {}).get("children", [])
+                    if child_types:
+                        for _, instance_path in listing:
+                            need(instance_path, ("categories", child_types))
+                else:
+                    for child_type in arg:
+                        folder = guess_category_folder(child_type, path, listing)
+                        if folder:
+                            need(folder, ("instances", child_type))
+                            
+            for path, entity_type in self.jobs:
+                need(path, ("instances", entity_type))
+                
+            while futures and not self._stopped:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = futures.pop(future)
+                    results[path] = future.result()
+                    for purpose in needs.pop(path, []):
+                        follow(path, purpose)
+                self.progress.emit(len(results), len(results) + len(futures))
+                
+            for future in futures:
+                future.cancel()
+        return results
+
+
+class FolderBuilderDialog(QDialog):
+    folder_changes = Signal(list) # [(kind, path), ...] from the folder watcher thread
+    
+    def __init__(self, parent=None, streaming=True):
         super().__init__(parent)
         self.setWindowTitle("Build Project from Folders")
         self.resize(800, 600)
@@ -139,6 +295,32 @@ class FolderBuilderDialog(QDialog):
         # Data storage
         self.project_root = None
         
+        # Background scanning (streaming=False lists synchronously, e.g. for scripts)
+        self.streaming = streaming
+        self.scan_worker = None
+        self.scan_generation = 0
+        self.pending_listings = {} # path -> [callbacks waiting for its listing]
+        self.scan_results = {} # path -> listing, for the current tree
+        self.scan_rules = DEFAULT_SCAN_RULES # Same include/exclude rules as FolderMapper
+        self._cancelling = False
+        self.scanned_folders = 0
+        self.scan_stopped = 0 # Folders left unlisted by the last cancel_scan()
+        
+        # Applying a mapping to siblings (listed in the background, applied in one pass)
+        self.cascade_id = 0
+        self.cascade_worker = None
+        self.cascade_targets = []
+        
+        # Live folder watching (optional)
+        self.watcher = None
+        self.watched_folders = set()
+        self.folder_changes.connect(self.on_folder_changes)
+        
+        # Mapping statistics, kept up to date as rows come and go
+        self.unmapped_count = 0
+        self.instance_counts = {} # entity_type -> instance rows
+        self._stats_pending = False
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -163,6 +345,15 @@ class FolderBuilderDialog(QDialog):
         root_layout.addWidget(self.root_btn)
         form_layout.addRow("Project Root:", root_layout)
         
+        self.auto_map_check = QCheckBox("Auto-map root folders by naming convention (ep01, sq010, sh0010...)")
+        self.auto_map_check.setChecked(True)
+        self.auto_map_check.toggled.connect(self.refresh_tree)
+        form_layout.addRow("", self.auto_map_check)
+        
+        self.watch_check = QCheckBox("Watch folders for changes while the dialog is open")
+        self.watch_check.toggled.connect(self.set_watching)
+        form_layout.addRow("", self.watch_check)
+        
         layout.addLayout(form_layout)
         
         # 2. Tree Widget
@@ -185,15 +376,30 @@ class FolderBuilderDialog(QDialog):
         btn_box = QHBoxLayout()
         self.status_label = QLabel("Select a project root to begin.")
         btn_box.addWidget(self.status_label)
+        
+        self.scan_label = QLabel("")
+        self.scan_label.setStyleSheet("color: #888; font-style: italic;")
+        btn_box.addWidget(self.scan_label)
+        
+        self.cancel_scan_btn = QPushButton("Stop Scan")
+        self.cancel_scan_btn.clicked.connect(self.cancel_scan)
+        self.cancel_scan_btn.hide()
+        btn_box.addWidget(self.cancel_scan_btn)
+        
+        self.cascade_progress = QtWidgets.QProgressBar()
+        self.cascade_progress.setMaximumWidth(260)
+        self.cascade_progress.setFormat("Applying to siblings: %v/%m folders")
+        self.cascade_progress.hide()
+        btn_box.addWidget(self.cascade_progress)
         btn_box.addStretch()
         
-        build_btn = QPushButton("Build")
-        build_btn.clicked.connect(self.on_build)
+        self.build_btn = QPushButton("Build")
+        self.build_btn.clicked.connect(self.on_build)
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         
         btn_box.addWidget(cancel_btn)
-        btn_box.addWidget(build_btn)
+        btn_box.addWidget(self.build_btn)
         
         # 4. Stats / Log Widget (Bottom Right essentially, but we put it below tree for now or split)
         # Requirement: "at the right bottom of the tool ,there should be log like thing"
@@ -222,79 +428,264 @@ class FolderBuilderDialog(QDialog):
         self.project_root = folder_path
         self.refresh_tree()
 
-    def calculate_stats(self):
+    # ------------------------------------------------------------------
+    # Background listing
+    # ------------------------------------------------------------------
+    def list_folder(self, path, callback):
         """
-        Traverses the tree to count mapped/unmapped entities and updates the log.
+        Calls callback(subfolders) with the visible sub-folders of 'path',
+        right away when not streaming, otherwise once the background scan listed it.
+        Folders the scan rules don't allow to open resolve as empty.
         """
-        root = self.tree.topLevelItem(0)
-        if not root:
-             self.log_edit.setText("No project loaded.")
-             return
-
-        stats = {
-            "level_1_count": 0,
-            "level_2_count": 0,
-            "unmapped_categories": 0,
-            "mapped_categories": 0
-        }
+        if not self.scan_rules.can_descend(path, self.folder_depth(path)):
+            callback([])
+            return
+        if not self.streaming:
+            listing = self.scan_results[path] = self._visible(SHARED_CACHE.list_dirs(path))
+            self._watch(path)
+            callback(listing)
+            return
+        if path in self.scan_results:
+            callback(self.scan_results[path])
+            return
+        if self._cancelling:
+            callback([]) # Don't let rows resolved by a cancel start new listings
+            return
+            
+        waiting = self.pending_listings.setdefault(path, [])
+        waiting.append(callback)
+        if len(waiting) == 1:
+            if not self.scan_worker:
+                self.scan_worker = FolderScanWorker(self)
+                self.scan_worker.batch_ready.connect(self.on_scan_batch)
+            self.scan_worker.request(self.scan_generation, path)
+        self.update_scan_status()
+        
+    def _visible(self, listing):
+        return self.scan_rules.filter(listing)
 
-        # Helper to recurse
-        def traverse(item):
-            data = item.data(0, Qt.UserRole)
-            if not data: return
+    def folder_depth(self, path):
+        """Levels below the project root (0 for the root, or for folders outside it)."""
+        if not self.project_root:
+            return 0
+        rel = os.path.relpath(path, self.project_root)
+        if rel == "." or rel.startswith(".."):
+            return 0
+        return len(rel.replace("\\", "/").split("/"))
+        
+    def on_scan_batch(self, batch):
+        for generation, path, listing in batch:
+            if generation != self.scan_generation:
+                continue # Stale: tree was rebuilt or scan cancelled
+            self.scanned_folders += 1
+            listing = self.scan_results[path] = self._visible(listing)
+            self._watch(path)
+            for callback in self.pending_listings.pop(path, []):
+                try:
+                    callback(listing)
+                except RuntimeError:
+                    pass # Row was removed while its folder was being listed
+        self.update_scan_status()
+        self.schedule_stats()
+        
+    def start_scan(self):
+        """Invalidates everything still in flight (tree is being rebuilt)."""
+        self.scan_generation += 1
+        self.pending_listings = {}
+        self.scan_results = {}
+        self.scanned_folders = 0
+        self.scan_stopped = 0
+        if self.scan_worker:
+            self.scan_worker.cancel()
+        self.stop_cascade()
+        if self.watcher:
+            for path in self.watched_folders:
+                self.watcher.unwatch(path)
+        self.watched_folders = set()
+        self.update_scan_status()
+        
+    def cancel_scan(self):
+        """Stops the background scan; rows still waiting resolve as empty folders."""
+        self.scan_generation += 1
+        if self.scan_worker:
+            self.scan_worker.cancel()
+        pending = self.pending_listings
+        self.pending_listings = {}
+        # Sibling rows of a cascade still being listed keep their old folders
+        cascade = len(self.cascade_targets) if self.cascade_worker else 0
+        self.scan_stopped += len(pending) + cascade
+        self.stop_cascade()
+        self._cancelling = True
+        try:
+            for callbacks in pending.values():
+                for callback in callbacks:
+                    try:
+                        callback([])
+                    except RuntimeError:
+                        pass
+        finally:
+            self._cancelling = False
+        self.update_scan_status(cancelled=bool(pending or cascade))
+        self.schedule_stats()
+        
+    def is_scanning(self):
+        """True while folder listings (rows or a sibling cascade) are still on their way."""
+        return bool(self.pending_listings or self.cascade_worker)
+        
+    def update_scan_controls(self):
+        """Stop shown and Build disabled while anything is listed (building would return a partial tree)."""
+        scanning = self.is_scanning()
+        self.cancel_scan_btn.setVisible(scanning)
+        self.build_btn.setEnabled(not scanning)
+        
+    def update_scan_status(self, cancelled=False):
+        scanning = bool(self.pending_listings)
+        self.update_scan_controls()
+        if scanning:
+            self.scan_label.setText(f"Scanning... {self.scanned_folders} folders listed, {len(self.pending_listings)} pending")
+        elif cancelled:
+            self.scan_label.setText(f"Scan stopped after {self.scanned_folders} folders.")
+        elif self.scanned_folders:
+            self.scan_label.setText(f"{self.scanned_folders} folders listed.")
+        else:
+            self.scan_label.setText("")
+            
+    def wait_for_scan(self, timeout=30.0):
+        """Processes events until the background scan is idle (scripts/tests)."""
+        deadline = time.monotonic() + timeout
+        while self.is_scanning() and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+        if self._stats_pending:
+            self.calculate_stats()
+        return not self.is_scanning()
+        
+    def done(self, result):
+        if self.scan_worker:
+            self.scan_worker.stop()
+        self.stop_cascade()
+        self.set_watching(False)
+        super().done(result)
 
+    # ------------------------------------------------------------------
+    # Live folder watching
+    # ------------------------------------------------------------------
+    def set_watching(self, enabled):
+        """Starts/stops watching every folder listed for the current tree."""
+        if enabled and not self.watcher:
+            self.watcher = FolderWatcher(self.folder_changes.emit)
+            self.watcher.start()
+            for path in list(self.scan_results):
+                self._watch(path)
+        elif not enabled and self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+            self.watched_folders = set()
+            
+    def _watch(self, path):
+        if self.watcher and path not in self.watched_folders:
+            self.watched_folders.add(path)
+            self.watcher.watch(path, [name for name, _ in self.scan_results.get(path, [])])
+            
+    def on_folder_changes(self, events):
+        """
+        Applies a batch of created/deleted folders to the rows showing their
+        parent folder, without rescanning anything else.
+        """
+        root = self.tree.topLevelItem(0)
+        if not root or not self.watcher:
+            return
+        if any(kind == RESCAN for kind, _ in events):
+            events = self._rescan_watched()
+            
+        # One pass over the tree: rows by folder, categories by mapped folder / by parent folder
+        rows_by_path = {}
+        mapped_categories = {}
+        combos_by_parent = {}
+        unmapped_item = None
+        root_categories = {}
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            data = item.data(0, Qt.UserRole) or {}
             kind = data.get('node_kind')
+            if kind in ('instance', 'unmapped_item'):
+                rows_by_path.setdefault(data.get('path'), []).append(item)
+            elif kind == 'unmapped_root':
+                unmapped_item = item
+            elif kind == 'category':
+                combo = self.tree.itemWidget(item, 1)
+                if isinstance(combo, QComboBox):
+                    combos_by_parent.setdefault(data.get('parent_path'), []).append((item, combo))
+                if isinstance(combo, QComboBox) and combo.currentData():
+                    mapped_categories.setdefault(combo.currentData(), []).append(item)
+                elif item.parent() is root:
+                    root_categories[data['entity_type']] = item
+            stack.extend(item.child(i) for i in range(item.childCount()))
             
-            if kind == 'category':
-                # Check if mapped
-                widget = self.tree.itemWidget(item, 1)
-                is_mapped = False
-                if isinstance(widget, QComboBox):
-                    if widget.currentData(): # Has a path selected
-                        is_mapped = True
-                
-                if is_mapped:
-                    stats["mapped_categories"] += 1
-                else:
-                    stats["unmapped_categories"] += 1
+        rules = RULE_MAP.get(self.template_combo.currentText(), {})
+        for kind, path in events:
+            parent_path, name = os.path.split(path)
+            SHARED_CACHE.invalidate(parent_path)
+            listing = self.scan_results.get(parent_path)
+            
+            if kind == DELETED:
+                SHARED_CACHE.invalidate(path)
+                self.watched_folders = {p for p in self.watched_folders if p != path and not p.startswith(path + os.sep)}
+                if listing is not None:
+                    self.scan_results[parent_path] = [e for e in listing if e[1] != path]
+                for item in rows_by_path.pop(path, []):
+                    self._remove_row(item)
+                for _, combo in combos_by_parent.get(parent_path, []):
+                    index = combo.findData(path)
+                    if index > 1:
+                        combo.removeItem(index) # Remaps the category if it was the selected folder
+                continue
                 
-                # Recurse children (Instances)
-                for i in range(item.childCount()):
-                    traverse(item.child(i))
-
-            elif kind == 'instance':
-                # Determine level?
-                # Root is level 0 (Project)
-                # Children of Root Category are Level 1
-                # Children of Level 1 Category are Level 2
+            if not self.scan_rules.accepts(name) or path in rows_by_path:
+                continue
+            if listing is not None:
+                self.scan_results[parent_path] = sorted(listing + [(name, path)], key=lambda e: (e[0].lower(), e[0]))
+            for category_item in mapped_categories.get(parent_path, []):
+                entity_type = category_item.data(0, Qt.UserRole)['entity_type']
+                allowed_children = rules.get(entity_type, {}).get("children", [])
+                self.add_instance_row(category_item, entity_type, name, path, allowed_children)
+            for category_item, combo in combos_by_parent.get(parent_path, []):
+                if not combo.isEnabled() or combo.findData(path) != -1:
+                    continue # Still being listed, or already there
+                first_folder = combo.count() == 2
+                combo.addItem(name, path)
+                if first_folder and combo.currentIndex() == 0:
+                    # Was left unmapped because the folder was empty: same heuristic as a fresh scan
+                    entity_type = category_item.data(0, Qt.UserRole)['entity_type']
+                    combo.setCurrentIndex(combo.findData(guess_category_folder(entity_type, parent_path, [(name, path)])))
+            if unmapped_item and parent_path == self.project_root:
+                self.auto_map_folders(unmapped_item, root_categories, [(name, path)])
                 
-                # We can approximate by depth or check parent chain
-                parent = item.parent()
-
-                if parent: # Not root project
-                    # Parent is a Category
-                    grandparent = parent.parent()
-                    if grandparent == root:
-                         stats["level_1_count"] += 1
-                    elif grandparent and grandparent.parent() and grandparent.parent().parent() == root:
-                         stats["level_2_count"] += 1
-                         
-                # Recurse children (Categories)
-                for i in range(item.childCount()):
-                    traverse(item.child(i))
-
-        traverse(root)
-        
-        msg = (f"<b>Project Statistics:</b><br>"
-               f"• Level 1 Entities (e.g. Sequences): {stats['level_1_count']}<br>"
-               f"• Level 2 Entities (e.g. Shots): {stats['level_2_count']}<br>"
-               f"• Mapped Entity Groups: {stats['mapped_categories']}<br>"
-               f"<font color='#ff6666'>• Unmapped Groups: {stats['unmapped_categories']}</font>")
-        
-        self.log_edit.setHtml(msg)
+        self.schedule_stats()
+
+    def _rescan_watched(self):
+        """
+        Re-lists every watched folder after the watcher lost events and returns
+        the differences with the listings shown as created/deleted events.
+        """
+        events = []
+        for path in sorted(self.watched_folders):
+            listing = self.scan_results.get(path)
+            if listing is None or not os.path.isdir(path):
+                continue # Deleted: its parent reports it
+            SHARED_CACHE.invalidate(path)
+            known = {p for _, p in listing}
+            current = {p for _, p in self._visible(SHARED_CACHE.list_dirs(path))}
+            events.extend((DELETED, p) for p in sorted(known - current))
+            events.extend((CREATED, p) for p in sorted(current - known))
+        return events
 
     def refresh_tree(self):
+        self.start_scan()
         self.tree.clear()
+        self.unmapped_count = 0
+        self.instance_counts = {}
         if not self.project_root:
             return
 
@@ -328,13 +719,9 @@ class FolderBuilderDialog(QDialog):
             
         if is_single_entity_mode:
             # === SINGLE ENTITY MODE (Old Behavior) ===
-            all_children_ok = True
             for child_type in project_children:
                 # We map all subfolders to this single entity type immediately
-                cat_item = self.add_category_row(root_item, child_type, self.project_root, is_root_child=True, force_direct=True)
-                if cat_item.childCount() == 0:
-                    all_children_ok = False
-            root_item.setExpanded(not all_children_ok)
+                self.add_category_row(root_item, child_type, self.project_root, is_root_child=True, force_direct=True)
             
         else:
             # === MULTI ENTITY MODE (Unmapped Workflow) ===
@@ -351,25 +738,42 @@ class FolderBuilderDialog(QDialog):
             unmapped_item.setData(0, Qt.UserRole, {"node_kind": "unmapped_root"})
             unmapped_item.setFlags(unmapped_item.flags() & ~Qt.ItemIsUserCheckable) # Not checkable
             
-            # Populate Unmapped with direct children of Root
-            try:
-                if os.path.exists(self.project_root):
-                    for entry in os.scandir(self.project_root):
-                        if entry.is_dir() and not entry.name.startswith("."):
-                            # Add as unmapped folder item
-                            self.add_unmapped_item(unmapped_item, entry.name, entry.path)
-            except Exception:
-                pass
-                
-            unmapped_item.setExpanded(True)
-            
             # 2. Create Empty Categories
+            categories = {}
             for child_type in project_children:
-                self.add_category_row(root_item, child_type, self.project_root, is_root_child=True, sorting_mode=True)
+                categories[child_type] = self.add_category_row(root_item, child_type, self.project_root, is_root_child=True, sorting_mode=True)
+            
+            # 3. Sort direct children of Root by naming convention; leftovers go to Unmapped
+            self.list_folder(self.project_root, lambda subfolders: self.auto_map_folders(unmapped_item, categories, subfolders))
                 
+            unmapped_item.setExpanded(True)
             root_item.setExpanded(True)
 
-        self.calculate_stats()
+        self.schedule_stats()
+
+    def auto_map_folders(self, unmapped_item, categories, subfolders):
+        """
+        Classifies a whole listing in one batch and adds each folder to the
+        category whose naming convention it follows ({entity_type: category item}).
+        Folders that follow none (or all of them, with auto-map off) go to Unmapped.
+        """
+        leftovers = subfolders
+        if self.auto_map_check.isChecked():
+            patterns = name_patterns_for(self.template_combo.currentText())
+            classifier = NameClassifier({t: patterns[t] for t in categories if t in patterns})
+            mapped, leftovers = classifier.split(subfolders)
+            
+            rules = RULE_MAP.get(self.template_combo.currentText(), {})
+            for entity_type, entries in mapped.items():
+                category_item = categories[entity_type]
+                allowed_children = rules.get(entity_type, {}).get("children", [])
+                for name, path in entries:
+                    self.add_instance_row(category_item, entity_type, name, path, allowed_children)
+                category_item.setExpanded(True)
+                
+        for name, path in leftovers:
+            self.add_unmapped_item(unmapped_item, name, path)
+        self.schedule_stats()
 
     def add_unmapped_item(self, parent_item, name, path):
         item = QTreeWidgetItem(parent_item)
@@ -380,6 +784,8 @@ class FolderBuilderDialog(QDialog):
             "name": name,
             "path": path
         })
+        self.unmapped_count += 1
+        self.schedule_stats()
         return item
 
     def get_color_for_entity(self, entity_type):
@@ -430,90 +836,65 @@ class FolderBuilderDialog(QDialog):
         
         # <Direct Children> Option
         combo.addItem(f"<Direct Children of {os.path.basename(parent_path)}>", parent_path)
+        combo.setEnabled(False) # Until the subfolders are listed
+        self.tree.setItemWidget(item, 1, combo)
+        
+        # Scan subfolders (in the background; cached, so remapping does not re-list)
+        self.list_folder(parent_path, lambda subfolders: self._fill_category_combo(item, combo, entity_type, subfolders, force_direct))
+        return item
 
-        # Scan subfolders
-        subfolders = []
-        try:
-            if os.path.exists(parent_path):
-                for entry in os.scandir(parent_path):
-                    if entry.is_dir() and not entry.name.startswith("."):
-                        subfolders.append(entry.name)
-        except Exception:
-            pass
-            
-        subfolders.sort()
-        for f in subfolders:
-            combo.addItem(f, os.path.join(parent_path, f))
+    def _fill_category_combo(self, item, combo, entity_type, subfolders, force_direct):
+        for name, path in subfolders:
+            combo.addItem(name, path)
+        combo.setEnabled(True)
             
         # -- HEURISTIC AUTO-SELECTION --
-        selected_index = 0 
-        
         if force_direct:
             selected_index = 1 # Select Direct Children
-            
         else:
-            # 1. Try to find explicit folder matching name (e.g. "sequences") or Aliases
-            # Check Aliases if defined? (User asked for it, even if we are in sorting mode now? 
-            # Well, single entity uses this path still).
-            # We haven't implemented aliases in this block yet, let's stick to name match for now or basic alias.
-            
-            # Simple alias check if we wanted
-            normalized_type = entity_type.lower()
-            aliases = [normalized_type, normalized_type + "s"]
-            
-            for i in range(combo.count()):
-                text = combo.itemText(i).lower()
-                if text in aliases:
-                    selected_index = i
-                    break
-            
-            if selected_index == 0 and len(subfolders) > 0:
-                 # Default logic: Assume Direct Children if no specific folder found
-                 selected_index = 1
+            # Folder named after the type (e.g. "sequences"), else Direct Children if any
+            folder = guess_category_folder(entity_type, combo.itemData(1), subfolders)
+            selected_index = combo.findData(folder) if folder else 0
 
         combo.setCurrentIndex(selected_index)
         combo.currentIndexChanged.connect(lambda idx, it=item, cb=combo: self.on_category_mapped(it, cb))
         
-        self.tree.setItemWidget(item, 1, combo)
-        
-        # Trigger logic
+        # Trigger logic (every sibling runs this same heuristic, so no cascade here)
         if selected_index != 0:
-            self.on_category_mapped(item, combo)
-            
-        return item
+            self.on_category_mapped(item, combo, apply_to_siblings=False)
+        else:
+            self._on_category_filled(item)
 
-    def on_category_mapped(self, category_item, combo):
+    def _on_category_filled(self, category_item):
+        # Expand the owning instance if this category found nothing (needs attention)
+        parent = category_item.parent()
+        if parent and category_item.childCount() == 0:
+            parent.setExpanded(True)
+
+    def on_category_mapped(self, category_item, combo, apply_to_siblings=True):
         """
         Called when user selects a folder for a Category (e.g. "sequences").
         We then scan that folder and add Instances (e.g. sq01, sq02) as children.
         """
         # Clear existing children (Instances)
-        category_item.takeChildren()
+        self._take_children(category_item)
         
         folder_path = combo.currentData()
         if not folder_path:
-            self.calculate_stats()
+            self._on_category_filled(category_item)
+            self.schedule_stats()
             return
 
         # Scan for Instances
-        instances = []
-        try:
-            if os.path.exists(folder_path):
-                for entry in os.scandir(folder_path):
-                    if entry.is_dir() and not entry.name.startswith("."):
-                        # If we are using <Direct Children>, we must be careful not to include 
-                        # folders that are actually Categories for the Parent.
-                        # But here, 'folder_path' IS the path we are scanning.
-                        # If folder_path == category_parent_path (Direct Children), 
-                        # we might pick up "assets", "shots" folders as instances if they exist?
-                        # It's a risk. But "Build from Folders" usually assumes uniform structure.
-                        # If strictly adhering to template, we could filter out names that match sibling categories?
-                        # For now, let's assume everything is an instance.
-                        instances.append(entry)
-        except Exception:
-            pass
-            
-        instances.sort(key=lambda x: x.name)
+        # If we are using <Direct Children>, folder_path IS the category's parent path,
+        # so "assets"/"shots" folders may show up as instances. "Build from Folders"
+        # assumes a uniform structure, so everything is treated as an instance.
+        self.list_folder(folder_path, lambda instances: self._fill_category_instances(category_item, combo, folder_path, instances, apply_to_siblings))
+
+    def _fill_category_instances(self, category_item, combo, folder_path, instances, apply_to_siblings):
+        if combo.currentData() != folder_path:
+            return # Remapped while this folder was being listed
+        self._take_children(category_item)
         
         # Get Rules to know what children these instances might have
         data = category_item.data(0, Qt.UserRole)
@@ -522,16 +903,17 @@ class FolderBuilderDialog(QDialog):
         rules = RULE_MAP.get(template_name, {})
         allowed_children = rules.get(entity_type, {}).get("children", [])
         
-        for entry in instances:
-            self.add_instance_row(category_item, entity_type, entry.name, entry.path, allowed_children)
+        for name, path in instances:
+            self.add_instance_row(category_item, entity_type, name, path, allowed_children)
             
         category_item.setExpanded(True)
+        self._on_category_filled(category_item)
         
         # Trigger Auto-Apply to siblings
-        if not combo.signalsBlocked(): 
+        if apply_to_siblings: 
              self.auto_apply_to_siblings(category_item, combo.currentText())
         
-        self.calculate_stats()
+        self.schedule_stats()
 
     def add_instance_row(self, parent_item, entity_type, name, path, children_types):
         """
@@ -560,17 +942,14 @@ class FolderBuilderDialog(QDialog):
             "name": name,
             "path": path
         })
+        self.instance_counts[entity_type] = self.instance_counts.get(entity_type, 0) + 1
+        self.schedule_stats()
         
-        # If this instance has children (e.g. Sequence has Shots), add Category rows for them
-        all_children_ok = True
+        # If this instance has children (e.g. Sequence has Shots), add Category rows for them.
+        # Collapsed by default; _on_category_filled expands it if a category finds nothing.
         for child_type in children_types:
-            cat_item = self.add_category_row(item, child_type, path)
-            # Check if this category automatically found instances
-            if cat_item.childCount() == 0:
-                all_children_ok = False
-        
-        # Collapse if all children found (found = has instances), Expand if missing
-        item.setExpanded(not all_children_ok)
+            self.add_category_row(item, child_type, path)
+        item.setExpanded(False)
 
     def handle_drop(self, target_item, folder_path):
         """
@@ -686,19 +1065,22 @@ class FolderBuilderDialog(QDialog):
     def auto_apply_to_siblings(self, category_item, selected_folder_name):
         """
         If user selected 'shots' folder for 'sq01', try to select 'shots' for 'sq02', 'sq03' etc.
+        The combos are set right away; every folder the siblings then need is
+        listed in the background (SiblingPrefetchWorker) and the rows are filled
+        in a single pass once everything is listed.
         """
         # 1. Identify valid scope: Siblings of the Parent Instance
         # Structure: ParentInstance (sq01) -> Category (Shots) -> [Selected]
         # We need to go up: Category -> ParentInstance (sq01) -> GrandParentCategory (Sequences)
-        
         parent_instance = category_item.parent()
         if not parent_instance: return
         
         grand_parent_category = parent_instance.parent()
         if not grand_parent_category: return
         
-        # 2. Iterate over all sibling instances (sq02, sq03...)
+        # 2. Select the same folder in every sibling instance (sq02, sq03...) that has it
         target_category_type = category_item.data(0, Qt.UserRole)['entity_type']
+        targets = []
         
         for i in range(grand_parent_category.childCount()):
             sibling_instance = grand_parent_category.child(i)
@@ -714,21 +1096,79 @@ class FolderBuilderDialog(QDialog):
                     break
             
             if sibling_category_item:
-                # 3. Check if this sibling has a folder with the same name
                 widget = self.tree.itemWidget(sibling_category_item, 1)
                 if isinstance(widget, QComboBox):
-                    # Check if selected_folder_name exists in this combo
                     # The combo items are just names relative to parent path
                     index = widget.findText(selected_folder_name)
                     if index != -1:
-                        # Prevent infinite recursion if we trigger signal
-                        # We can block signals on the combo
+                        # Blocked: the rows are filled below, without cascading again
                         widget.blockSignals(True)
                         widget.setCurrentIndex(index)
                         widget.blockSignals(False)
+                        targets.append((sibling_category_item, widget, widget.currentData()))
                         
-                        # We MUST manually trigger the logic to populate children
-                        self.on_category_mapped(sibling_category_item, widget)
+        if not targets:
+            return
+            
+        # 3. List everything needed, then fill the rows in one pass
+        self.stop_cascade()
+        self.cascade_id += 1
+        self.cascade_targets = targets
+        rules = RULE_MAP.get(self.template_combo.currentText(), {})
+        jobs = [(folder_path, target_category_type) for _, _, folder_path in targets]
+        worker = SiblingPrefetchWorker(self.cascade_id, jobs, rules, self.scan_rules, self.folder_depth, self)
+        
+        if not self.streaming:
+            self.apply_sibling_cascade(self.cascade_id, worker.collect())
+            return
+            
+        worker.progress.connect(self.on_cascade_progress)
+        worker.listed.connect(self.apply_sibling_cascade)
+        self.cascade_worker = worker
+        self.update_scan_controls()
+        self.on_cascade_progress(0, len(jobs))
+        self.cascade_progress.show()
+        worker.start()
+        
+    def on_cascade_progress(self, listed, total):
+        self.cascade_progress.setMaximum(total)
+        self.cascade_progress.setValue(listed)
+        
+    def apply_sibling_cascade(self, cascade_id, listings):
+        """Fills every sibling row of a cascade from its pre-listed folders."""
+        if cascade_id != self.cascade_id:
+            return # Superseded, or the tree was rebuilt
+        self.cascade_worker = None
+        self.cascade_progress.hide()
+        self.update_scan_controls()
+        
+        # Rows now resolve their folders from memory (no listing on the GUI thread)
+        for path, listing in listings.items():
+            self.scan_results[path] = listing
+            self._watch(path)
+            
+        targets, self.cascade_targets = self.cascade_targets, []
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for category_item, combo, folder_path in targets:
+                try:
+                    if combo.currentData() == folder_path:
+                        self.on_category_mapped(category_item, combo, apply_to_siblings=False)
+                except RuntimeError:
+                    pass # Row was removed while its folders were being listed
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        self.schedule_stats()
+        
+    def stop_cascade(self):
+        """Drops a cascade still being listed (its combos keep their new selection)."""
+        self.cascade_id += 1
+        self.cascade_targets = []
+        if self.cascade_worker:
+            self.cascade_worker.stop()
+            self.cascade_worker = None
+        self.cascade_progress.hide()
+        self.update_scan_controls()
 
     def on_item_moved(self, item, target_item):
         """
@@ -775,13 +1215,12 @@ class FolderBuilderDialog(QDialog):
         category_item.setExpanded(True)
         
         # Remove from Unmapped
-        parent = folder_item.parent()
-        parent.removeChild(folder_item)
+        self._remove_row(folder_item)
         
         # Update text of Category to clear "Drag here..." if needed? 
         # Actually "Drag folders here..." is useful to keep.
         
-        self.calculate_stats()
+        self.schedule_stats()
 
     def show_context_menu(self, item, global_pos):
         data = item.data(0, Qt.UserRole)
@@ -833,62 +1272,83 @@ class FolderBuilderDialog(QDialog):
             menu.exec_(global_pos)
 
     def remove_unmapped_item(self, item):
-        parent = item.parent()
-        parent.removeChild(item)
-        self.calculate_stats()
+        self._remove_row(item)
         
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    def _count_rows(self, items, sign):
+        """Adds (sign=1) or removes (sign=-1) the rows of 'items' and their subtrees from the counters."""
+        stack = list(items)
+        while stack:
+            item = stack.pop()
+            data = item.data(0, Qt.UserRole) or {}
+            kind = data.get('node_kind')
+            if kind == 'instance' and data.get('type') != 'project':
+                entity_type = data.get('type')
+                self.instance_counts[entity_type] = self.instance_counts.get(entity_type, 0) + sign
+            elif kind == 'unmapped_item':
+                self.unmapped_count += sign
+            stack.extend(item.child(i) for i in range(item.childCount()))
+        self.schedule_stats()
+        
+    def _take_children(self, item):
+        """takeChildren() that keeps the counters right."""
+        removed = item.takeChildren()
+        if removed:
+            self._count_rows(removed, -1)
+        return removed
+        
+    def _remove_row(self, item):
+        parent = item.parent()
+        if parent:
+            parent.removeChild(item)
+            self._count_rows([item], -1)
+            
+    def schedule_stats(self):
+        """Refreshes the statistics once, on the next event-loop turn."""
+        if not self._stats_pending:
+            self._stats_pending = True
+            QTimer.singleShot(0, self.calculate_stats)
+            
     def calculate_stats(self):
-        """
-        Traverses the tree to count mapped/unmapped entities and updates the log.
-        """
-        root = self.tree.topLevelItem(0)
-        if not root:
-             self.log_edit.setText("No project loaded.")
-             return
+        """Updates the log and status label from the counters."""
+        self._stats_pending = False
+        if not self.tree.topLevelItem(0):
+            self.log_edit.setText("No project loaded.")
+            return
              
-        stats = {
-            "unmapped_count": 0,
-            "mapped_instances": 0
-        }
-        
-        # Find Unmapped Node
-        unmapped_node = None
-        for i in range(root.childCount()):
-            child = root.child(i)
-            if child.data(0, Qt.UserRole).get('node_kind') == 'unmapped_root':
-                unmapped_node = child
-                break
-                
-        if unmapped_node:
-            stats["unmapped_count"] = unmapped_node.childCount()
-            if stats["unmapped_count"] == 0:
-                 # Hide 'Unmapped' node if empty?
-                 # unmapped_node.setHidden(True)
-                 # Or keep it to show "Done"?
-                 pass
-        
-        # Count mapped instances (Level 1)
-        for i in range(root.childCount()):
-            child = root.child(i)
-            if child.data(0, Qt.UserRole).get('node_kind') == 'category':
-                 stats["mapped_instances"] += child.childCount()
-                 
         msg = ""
-        if stats["unmapped_count"] > 0:
-            msg += f"<font color='#ff4444'><b>WARNING: {stats['unmapped_count']} Unmapped Folders remaining.</b></font><br>"
+        if self.unmapped_count > 0:
+            msg += f"<font color='#ff4444'><b>WARNING: {self.unmapped_count} Unmapped Folders remaining.</b></font><br>"
             msg += "Please drag them to a Category or right-click to Remove.<br>"
-            self.status_label.setText(f"Unmapped: {stats['unmapped_count']}")
+            self.status_label.setText(f"Unmapped: {self.unmapped_count}")
             self.status_label.setStyleSheet("color: #ff4444; font-weight: bold;")
         else:
             msg += f"<font color='#55ff55'><b>All folders mapped!</b></font><br>"
             self.status_label.setText("Ready to Build")
             self.status_label.setStyleSheet("color: #55ff55; font-weight: bold;")
             
-        msg += f"Mapped Entities: {stats['mapped_instances']}"
+        counts = {t: n for t, n in self.instance_counts.items() if n}
+        msg += f"Mapped Entities: {sum(counts.values())}"
+        for entity_type, count in counts.items():
+            msg += f"<br>• {entity_type}: {count}"
         self.log_edit.setHtml(msg)
 
     def on_build(self):
-        # 0. Validation: Check for Unmapped Items
+        # 0. Validation: the tree must be fully listed
+        if self.is_scanning():
+            self.status_label.setText("Wait for the folder scan to finish before building.")
+            return
+        if self.scan_stopped:
+            answer = QMessageBox.warning(self, "Incomplete Scan",
+                                         f"The folder scan was stopped: {self.scan_stopped} folders were not listed "
+                                         "and will be built as empty.\nBuild anyway?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if answer != QMessageBox.Yes:
+                return
+        
+        # 1. Validation: Check for Unmapped Items
         root = self.tree.topLevelItem(0)
         if root:
             unmapped_node = None
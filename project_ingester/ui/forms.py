@@ -44,20 +44,61 @@ class CollapsibleBox(QWidget):
     def addRow(self, label, widget):
         self.content_layout.addRow(label, widget)
 
+# Shown by the shot form while a shot has no frame range yet
+SHOT_FRAME_DEFAULTS = {"frame_in": 1001, "frame_out": 1100, "nb_frames": 100}
+
+def set_widget_value(widget, value):
+    """Shows 'value' in an input widget without emitting its change signal."""
+    blocked = widget.blockSignals(True)
+    if isinstance(widget, QTextEdit): widget.setPlainText("" if value is None else str(value))
+    elif isinstance(widget, QLineEdit): widget.setText("" if value is None else str(value))
+    elif isinstance(widget, QSpinBox): widget.setValue(int(value))
+    elif isinstance(widget, QCheckBox): widget.setChecked(bool(value))
+    elif isinstance(widget, QComboBox): widget.setCurrentText(str(value))
+    widget.blockSignals(blocked)
+
 class EntityForm(QObject):
-    """Base class for all entity forms."""
+    """
+    Base class for all entity forms. setup_ui() builds the widgets once;
+    bind() points them at another node of the same type, so the properties
+    panel can reuse a form instead of rebuilding it on every selection.
+    """
+    default_name = ""
+
     def __init__(self, node_frame):
         super().__init__()
         self.node_frame = node_frame
         self.widgets = {}
+        self.name_input = None
 
     log_change = Signal(str, str)
+    property_changed = Signal(object, str) # node frame, key
+
+    @classmethod
+    def layout_key(cls, node_frame):
+        """Forms can only be re-bound between nodes with the same key (same set of widgets)."""
+        return None
 
     def setup_ui(self, layout):
         """Populates the layout with form fields."""
         self.layout = layout
         pass
 
+    def bind(self, node_frame):
+        """Re-points the built form at another node and shows its values."""
+        self.node_frame = node_frame
+        self.load_values()
+
+    def load_values(self):
+        """Fills the widgets from node_frame.properties without writing anything back."""
+        if self.name_input is not None:
+            set_widget_value(self.name_input, self.node_frame.properties.get("name", self.default_name))
+
+    def add_name_row(self, on_changed=None):
+        self.name_input = QLineEdit()
+        self.name_input.textChanged.connect(on_changed or (lambda t: self.on_prop_changed("name", t)))
+        self.layout.addRow("Name:", self.name_input)
+
     def add_row(self, label, widget):
         if isinstance(self.layout, QFormLayout):
             self.layout.addRow(label, widget)
@@ -84,6 +125,7 @@ class EntityForm(QObject):
         # Log the change
         entity_name = self.node_frame.properties.get("name", self.node_frame.node_type)
         self.log_change.emit(f"Updated {entity_name} [{key}]: {old_val} -> {value}", "INFO")
+        self.property_changed.emit(self.node_frame, key)
         
         # User Req: "for other entities change the name field --> changes name parameter also should change description parameter..."
         if key == "name" and self.node_frame.node_type != "project":
@@ -150,6 +192,11 @@ def generate_project_code(project_name: str) -> str:
     return "".join(random.choices(string.ascii_uppercase, k=target_length))
 
 class ProjectForm(EntityForm):
+    @classmethod
+    def layout_key(cls, node_frame):
+        # Custom templates get a free text type instead of the locked dropdown
+        return node_frame.properties.get("is_custom_template", True)
+
     def setup_ui(self, layout):
         super().setup_ui(layout)
         
@@ -163,13 +210,7 @@ class ProjectForm(EntityForm):
         rp_layout.setContentsMargins(0,0,0,0)
         rp_layout.setSpacing(2)
         
-        # Get existing value or default
-        current_data = self.node_frame.properties.get("data")
-        default_root = ""
-        if isinstance(current_data, dict):
-            default_root = current_data.get("root_path", "")
-            
-        self.root_path_edit = QLineEdit(default_root)
+        self.root_path_edit = QLineEdit()
         self.root_path_edit.setPlaceholderText("Select Root Folder...")
         self.root_path_edit.textChanged.connect(self.on_root_path_changed)
         
@@ -183,22 +224,17 @@ class ProjectForm(EntityForm):
         layout.addRow("Root Path:", root_path_container)
         
         # Name
-        name_input = QLineEdit(self.node_frame.properties.get("name", ""))
-        name_input.textChanged.connect(lambda t: self.on_project_name_changed(t))
-        layout.addRow("Name:", name_input)
+        self.add_name_row(self.on_project_name_changed)
         
         # Code (Editable, Auto-filled)
-        self.code_input = QLineEdit(self.node_frame.properties.get("code", ""))
+        self.code_input = QLineEdit()
         self.code_input.textChanged.connect(lambda t: self.on_prop_changed("code", t))
         layout.addRow("Code:", self.code_input)
 
         # Production Type
-        is_custom = self.node_frame.properties.get("is_custom_template", True)
-        current_type = self.node_frame.properties.get("production_type", "short")
-        
-        if is_custom:
+        if self.layout_key(self.node_frame):
             # User request: "make the user to name the field instead of dropdown selection only in custom selection"
-            self.type_input = QLineEdit(current_type)
+            self.type_input = QLineEdit()
             self.type_input.textChanged.connect(self.on_type_changed)
             layout.addRow("Type:", self.type_input)
             
@@ -208,26 +244,7 @@ class ProjectForm(EntityForm):
             self.type_combo = QComboBox()
             
             # Map Config: (Display Name, Internal Value)
-            # 1) Feature film -> movie
-            # 2) Tv show -> tvshow
-            # 3) Shots only -> short
-            # 4) Assets only -> commercial
-            # 5) Custom -> short (default or whatever)
-            
-            type_mapping = [
-                ("Feature film", "featurefilm"), # Some systems use featurefilm, tree.py used movie? Check tree.py again. tree.py used 'movie'.
-                ("Tv show", "tvshow"),
-                ("Shots only", "short"),
-                ("Assets only", "commercial"),
-                ("Custom", "custom")
-            ]
-            
-            # Corrections based on tree.py:
-            # tree.py says: "Feature Film": "movie"
-            # But earlier code used "featurefilm"?
-            # Let's support both or standard. Gazu usually uses 'movie', 'tvshow', 'short'.
-            # I will use the values that match tree.py logic for consistency.
-            
+            # Values match tree.py's template -> production type mapping.
             type_mapping = [
                 ("Feature film", "movie"), 
                 ("Tv show", "tvshow"), 
@@ -239,33 +256,13 @@ class ProjectForm(EntityForm):
             for label, value in type_mapping:
                 self.type_combo.addItem(label, value)
             
-            # Select the correct item based on internal value
-            index = -1
-            for i in range(self.type_combo.count()):
-                if self.type_combo.itemData(i) == current_type:
-                    index = i
-                    break
-            
-            # If not found (e.g. 'featurefilm' vs 'movie' mismatch), try text match or default
-            if index == -1:
-                # Add it as custom invisible or just show raw
-                self.type_combo.addItem(current_type, current_type)
-                index = self.type_combo.count() - 1
-                
-            self.type_combo.setCurrentIndex(index)
             self.type_combo.setEnabled(False) # Locked for templates
             self.type_combo.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             layout.addRow("Type:", self.type_combo)
 
         # Production Style (Dropdown)
         self.style_combo = QComboBox()
-        style_items = ["2d", "3d", "2d3d", "vfx", "stop-motion"]
-        self.style_combo.addItems(style_items)
-        
-        current_style = self.node_frame.properties.get("production_style", "2d3d")
-        if current_style not in style_items: self.style_combo.addItem(current_style)
-        self.style_combo.setCurrentText(current_style)
-        
+        self.style_combo.addItems(["2d", "3d", "2d3d", "vfx", "stop-motion"])
         self.style_combo.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         self.style_combo.currentTextChanged.connect(self.on_style_changed)
         layout.addRow("Style:", self.style_combo)
@@ -275,14 +272,9 @@ class ProjectForm(EntityForm):
         # but user said "Description: {type} using {style} project" which fits in one line often.
         # But let's use QTextEdit as before for better UX if it gets long.
         self.desc_edit = QTextEdit()
-        self.desc_edit.setPlainText(self.node_frame.properties.get("description", ""))
         self.desc_edit.setFixedHeight(60)
         self.desc_edit.textChanged.connect(lambda: self.on_prop_changed("description", self.desc_edit.toPlainText()))
         layout.addRow("Description:", self.desc_edit)
-        
-        # Initialize description if empty and we have data
-        if not self.desc_edit.toPlainText().strip():
-            self.update_description_auto()
 
         # --- Optional Fields (Collapsible with Checkboxes) ---
         
@@ -296,6 +288,7 @@ class ProjectForm(EntityForm):
         layout.addRow(collapsible)
         
         self.optional_toggles = []
+        self.optional_rows = []
         
         # Helper to add toggleable row
         self.add_optional_row(collapsible, "FPS:", "fps", QSpinBox(), 24, lambda w, v: w.setValue(int(v)))
@@ -305,41 +298,70 @@ class ProjectForm(EntityForm):
         self.add_optional_row(collapsible, "Has Avatar:", "has_avatar", QCheckBox(), False, lambda w, v: w.setChecked(bool(v)), lambda w: w.isChecked())
 
         collapsible.setText("Optional Properties")
+        self.load_values()
+
+    def load_values(self):
+        super().load_values()
+        props = self.node_frame.properties
         
+        current_data = props.get("data")
+        set_widget_value(self.root_path_edit, current_data.get("root_path", "") if isinstance(current_data, dict) else "")
+        set_widget_value(self.code_input, props.get("code", ""))
+        
+        current_type = props.get("production_type", "short")
+        if self.type_combo is not None:
+            # Select the item with that internal value; unknown values are shown raw
+            index = self.type_combo.findData(current_type)
+            if index == -1:
+                self.type_combo.addItem(current_type, current_type)
+                index = self.type_combo.count() - 1
+            self.type_combo.setCurrentIndex(index)
+        else:
+            set_widget_value(self.type_input, current_type)
+            
+        current_style = props.get("production_style", "2d3d")
+        if self.style_combo.findText(current_style) == -1: self.style_combo.addItem(current_style)
+        set_widget_value(self.style_combo, current_style)
+        
+        set_widget_value(self.desc_edit, props.get("description", ""))
+        # Initialize description if empty and we have data
+        if not self.desc_edit.toPlainText().strip():
+            self.update_description_auto()
+            
+        set_widget_value(self.master_cb, False)
+        for key, checkbox, widget, default_val, setter in self.optional_rows:
+            is_enabled = props.get(f"use_{key}", False)
+            set_widget_value(checkbox, is_enabled)
+            widget.setEnabled(is_enabled)
+            val = props.get(key, default_val)
+            if setter:
+                blocked = widget.blockSignals(True)
+                setter(widget, val)
+                widget.blockSignals(blocked)
+            else:
+                set_widget_value(widget, val)
         
     def add_optional_row(self, container, label_text, key, widget, default_val, setter=None, getter=None):
         """
         Adds a row with a checkbox to enable/disable the property.
+        Values are filled by load_values().
         """
         row_widget = QWidget()
         row_layout = QHBoxLayout(row_widget)
         row_layout.setContentsMargins(0, 0, 0, 0)
         
         # Checkbox
-        use_key = f"use_{key}"
-        is_enabled = self.node_frame.properties.get(use_key, False)
-        
         checkbox = QCheckBox()
-        checkbox.setChecked(is_enabled)
         checkbox.setFixedSize(20, 20)
         
         # Track for master toggle
         if not hasattr(self, 'optional_toggles'): self.optional_toggles = []
         self.optional_toggles.append(checkbox)
+        if not hasattr(self, 'optional_rows'): self.optional_rows = []
+        self.optional_rows.append((key, checkbox, widget, default_val, setter))
         
         # Widget Setup
-        widget.setEnabled(is_enabled)
         widget.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        
-        # Set Initial Value
-        val = self.node_frame.properties.get(key, default_val)
-        if setter:
-            setter(widget, val)
-        else:
-            # Default setter for common widgets
-            if isinstance(widget, QLineEdit): widget.setText(str(val))
-            elif isinstance(widget, QSpinBox): widget.setValue(int(val))
-            elif isinstance(widget, QCheckBox): widget.setChecked(bool(val))
             
         # Connections
         checkbox.toggled.connect(lambda c: self.on_optional_toggled(c, key, widget))
@@ -380,6 +402,7 @@ class ProjectForm(EntityForm):
         old_name = self.node_frame.properties.get("name")
         self.node_frame.properties["name"] = text
         self.log_change.emit(f"Updated Project [name]: {old_name} -> {text}", "INFO")
+        self.property_changed.emit(self.node_frame, "name")
         
         # Auto-generate code using new logic
         code = generate_project_code(text)
@@ -455,85 +478,192 @@ class ProjectForm(EntityForm):
         # self.node_frame.properties is a dict reference, so this updates it directly.
 
 class EpisodeForm(EntityForm):
+    default_name = "Episode 1"
+
     def setup_ui(self, layout):
         super().setup_ui(layout)
         
         # Mandatory: Name
-        name_input = QLineEdit(self.node_frame.properties.get("name", "Episode 1"))
-        name_input.textChanged.connect(lambda t: self.on_prop_changed("name", t))
-        layout.addRow("Name:", name_input)
+        self.add_name_row()
+        self.load_values()
 
 class SequenceForm(EntityForm):
+    default_name = "SEQ_01"
+
     def setup_ui(self, layout):
         super().setup_ui(layout)
         
         # Mandatory: Name
-        name_input = QLineEdit(self.node_frame.properties.get("name", "SEQ_01"))
-        name_input.textChanged.connect(lambda t: self.on_prop_changed("name", t))
-        layout.addRow("Name:", name_input)
+        self.add_name_row()
+        self.load_values()
 
 class ShotForm(EntityForm):
+    default_name = "SH_010"
+
     def setup_ui(self, layout):
         super().setup_ui(layout)
         
         # Mandatory: Name
-        name_input = QLineEdit(self.node_frame.properties.get("name", "SH_010"))
-        name_input.textChanged.connect(lambda t: self.on_prop_changed("name", t))
-        layout.addRow("Name:", name_input)
+        self.add_name_row()
         
         # Optional
         collapsible = CollapsibleBox("Optional Properties")
         layout.addRow(collapsible)
         
-        frame_in = QSpinBox()
-        frame_in.setRange(-999999, 999999)
-        fi_val = self.node_frame.properties.get("frame_in")
-        if fi_val is None: fi_val = 1001
-        frame_in.setValue(int(fi_val))
-        frame_in.valueChanged.connect(lambda v: self.on_prop_changed("frame_in", v))
-        collapsible.addRow("Frame In:", frame_in)
-        
-        frame_out = QSpinBox()
-        frame_out.setRange(-999999, 999999)
-        fo_val = self.node_frame.properties.get("frame_out")
-        if fo_val is None: fo_val = 1100
-        frame_out.setValue(int(fo_val))
-        frame_out.valueChanged.connect(lambda v: self.on_prop_changed("frame_out", v))
-        collapsible.addRow("Frame Out:", frame_out)
-        
-        nb_frames = QSpinBox()
-        nb_frames.setRange(0, 999999)
-        nb_val = self.node_frame.properties.get("nb_frames")
-        if nb_val is None: nb_val = 100
-        nb_frames.setValue(int(nb_val))
-        nb_frames.valueChanged.connect(lambda v: self.on_prop_changed("nb_frames", v))
-        collapsible.addRow("Nb Frames:", nb_frames)
-        
-        desc_edit = QTextEdit()
-        desc_edit.setPlainText(self.node_frame.properties.get("description", ""))
-        desc_edit.setFixedHeight(60)
-        desc_edit.textChanged.connect(lambda: self.on_prop_changed("description", desc_edit.toPlainText()))
-        collapsible.addRow("Description:", desc_edit)
+        self.frame_in = QSpinBox()
+        self.frame_in.setRange(-999999, 999999)
+        self.frame_in.valueChanged.connect(lambda v: self.on_prop_changed("frame_in", v))
+        collapsible.addRow("Frame In:", self.frame_in)
+        
+        self.frame_out = QSpinBox()
+        self.frame_out.setRange(-999999, 999999)
+        self.frame_out.valueChanged.connect(lambda v: self.on_prop_changed("frame_out", v))
+        collapsible.addRow("Frame Out:", self.frame_out)
+        
+        self.nb_frames = QSpinBox()
+        self.nb_frames.setRange(0, 999999)
+        self.nb_frames.valueChanged.connect(lambda v: self.on_prop_changed("nb_frames", v))
+        collapsible.addRow("Nb Frames:", self.nb_frames)
+        
+        self.desc_edit = QTextEdit()
+        self.desc_edit.setFixedHeight(60)
+        self.desc_edit.textChanged.connect(lambda: self.on_prop_changed("description", self.desc_edit.toPlainText()))
+        collapsible.addRow("Description:", self.desc_edit)
         
         collapsible.setText("Optional Properties")
+        self.load_values()
+
+    def load_values(self):
+        super().load_values()
+        props = self.node_frame.properties
+        for widget, key in ((self.frame_in, "frame_in"), (self.frame_out, "frame_out"), (self.nb_frames, "nb_frames")):
+            value = props.get(key)
+            set_widget_value(widget, SHOT_FRAME_DEFAULTS[key] if value is None else value)
+        set_widget_value(self.desc_edit, props.get("description", ""))
 
 class AssetTypeForm(EntityForm):
+    default_name = "Characters"
+
     def setup_ui(self, layout):
         super().setup_ui(layout)
         
         # Mandatory: Name
-        name_input = QLineEdit(self.node_frame.properties.get("name", "Characters"))
-        name_input.textChanged.connect(lambda t: self.on_prop_changed("name", t))
-        layout.addRow("Name:", name_input)
+        self.add_name_row()
+        self.load_values()
 
 class AssetForm(EntityForm):
+    default_name = "New Asset"
+
     def setup_ui(self, layout):
         super().setup_ui(layout)
         
         # Mandatory: Name
-        name_input = QLineEdit(self.node_frame.properties.get("name", "New Asset"))
-        name_input.textChanged.connect(lambda t: self.on_prop_changed("name", t))
-        layout.addRow("Name:", name_input)
+        self.add_name_row()
+        self.load_values()
+
+class MultiEditForm(EntityForm):
+    """
+    One form for many selected nodes of the same type: frame range (shots),
+    description and custom data are written to all of them at once. A field
+    whose values differ between the nodes shows as mixed until it is edited.
+    """
+    MIXED_TEXT = "(multiple values)"
+
+    def __init__(self, node_frames):
+        super().__init__(node_frames[0])
+        self.node_frames = list(node_frames)
+        self.frame_inputs = {}
+
+    def setup_ui(self, layout):
+        super().setup_ui(layout)
+        
+        self.count_label = QLabel()
+        layout.addRow(self.count_label)
+        
+        if self.node_frame.node_type == "shot":
+            for key, label, minimum in (("frame_in", "Frame In:", -999999), ("frame_out", "Frame Out:", -999999),
+                                        ("nb_frames", "Nb Frames:", 0)):
+                spin = QSpinBox()
+                # The value below the real minimum stands for "mixed"
+                spin.setRange(minimum - 1, 999999)
+                spin.setSpecialValueText(self.MIXED_TEXT)
+                # One bulk write per edit (Enter / focus out), not one per typed digit
+                spin.setKeyboardTracking(False)
+                spin.valueChanged.connect(lambda v, k=key: self.on_shared_changed(k, v))
+                layout.addRow(label, spin)
+                self.frame_inputs[key] = spin
+        
+        # Description: applied with its Set button, not on every keystroke
+        desc_row = QWidget()
+        desc_layout = QHBoxLayout(desc_row)
+        desc_layout.setContentsMargins(0, 0, 0, 0)
+        desc_layout.setSpacing(2)
+        self.desc_edit = QTextEdit()
+        self.desc_edit.setFixedHeight(60)
+        self.desc_set_btn = QPushButton("Set")
+        self.desc_set_btn.clicked.connect(lambda: self.on_shared_changed("description", self.desc_edit.toPlainText()))
+        desc_layout.addWidget(self.desc_edit)
+        desc_layout.addWidget(self.desc_set_btn, 0, Qt.AlignTop)
+        layout.addRow("Description:", desc_row)
+        
+        # Custom data: one key set on every node
+        data_row = QWidget()
+        data_layout = QHBoxLayout(data_row)
+        data_layout.setContentsMargins(0, 0, 0, 0)
+        data_layout.setSpacing(2)
+        self.data_key = QLineEdit()
+        self.data_key.setPlaceholderText("key")
+        self.data_value = QLineEdit()
+        self.data_value.setPlaceholderText("value")
+        set_btn = QPushButton("Set")
+        set_btn.clicked.connect(self.on_data_set)
+        data_layout.addWidget(self.data_key)
+        data_layout.addWidget(self.data_value)
+        data_layout.addWidget(set_btn)
+        layout.addRow("Custom Data:", data_row)
+        
+        self.load_values()
+
+    def bind_nodes(self, node_frames):
+        self.node_frames = list(node_frames)
+        self.bind(self.node_frames[0])
+
+    def shared_value(self, key, default=None):
+        """(True, value) if every node has the same value for 'key', else (False, None)."""
+        values = []
+        for frame in self.node_frames:
+            value = frame.properties.get(key)
+            value = default if value is None else value
+            if values and value != values[0]:
+                return False, None
+            values.append(value)
+        return True, values[0] if values else default
+
+    def load_values(self):
+        self.count_label.setText(f"Editing {len(self.node_frames)} {self.node_frame.node_type} nodes")
+        for key, spin in self.frame_inputs.items():
+            shared, value = self.shared_value(key, SHOT_FRAME_DEFAULTS[key])
+            set_widget_value(spin, value if shared else spin.minimum())
+        shared, value = self.shared_value("description", "")
+        set_widget_value(self.desc_edit, value if shared else "")
+        self.desc_edit.setPlaceholderText("" if shared else self.MIXED_TEXT)
+
+    def on_shared_changed(self, key, value):
+        if key in self.frame_inputs and value == self.frame_inputs[key].minimum():
+            return # Back on "mixed": leave the nodes as they are
+        for frame in self.node_frames:
+            frame.properties[key] = value
+        self.log_change.emit(f"Updated {len(self.node_frames)} {self.node_frame.node_type} nodes [{key}]: {value}", "INFO")
+
+    def on_data_set(self):
+        key = self.data_key.text().strip()
+        if not key: return
+        value = self.data_value.text()
+        for frame in self.node_frames:
+            data = frame.properties.get("data")
+            # A fresh dict per node: loaded nodes may share their 'data'
+            frame.properties["data"] = {**(data if isinstance(data, dict) else {}), key: value}
+        self.log_change.emit(f"Updated {len(self.node_frames)} {self.node_frame.node_type} nodes [data.{key}]: {value}", "INFO")
 
 FORM_MAP = {
     "project": ProjectForm,
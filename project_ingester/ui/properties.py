@@ -1,15 +1,30 @@
 from datetime import datetime
 from ..utils.compat import *
 from ..config import *
-from .forms import FORM_MAP, EntityForm
+from .forms import FORM_MAP, EntityForm, MultiEditForm
+
+# Use functional static tab names as approved
+TAB_TITLES = {
+    "project": "Project Settings",
+    "episode": "Episode Attributes",
+    "sequence": "Sequence Config",
+    "shot": "Shot Metadata",
+    "asset_type": "Type Definition",
+    "asset": "Asset Details"
+}
 
 class PropertiesWidget(QWidget):
     log_message = Signal(str, str)
+    node_changed = Signal(object, str) # node frame, property key edited in a form
 
     def __init__(self, parent=None):
         super().__init__()
         self.current_node_frame = None
         self.current_form = None # Keep reference to prevent GC if needed, though layout holds widgets
+        self.tab_widget = None
+        self.form_pool = {} # (form class, layout key) -> [(page, form)], re-bound on each selection
+        self.multi_edit_forms = {} # node type -> (page, MultiEditForm)
+        self.tab_forms = [] # form shown by each tab, in tab order
         self.setup_ui()
         
     def setup_ui(self):
@@ -41,53 +56,96 @@ class PropertiesWidget(QWidget):
         if not isinstance(node_frames, list):
              node_frames = [node_frames] if node_frames else []
         
-        # Clear previous content
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        if not node_frames:
-            return
-
-        # Always use tabs as per user request
-        tab_widget = QtWidgets.QTabWidget()
-        self.content_layout.addWidget(tab_widget)
+        # The tab widget and the forms are kept and re-bound, not rebuilt per selection
+        if self.tab_widget is None:
+            # Always use tabs as per user request
+            self.tab_widget = QtWidgets.QTabWidget()
+            self.tab_widget.currentChanged.connect(self.on_tab_changed)
+            self.content_layout.addWidget(self.tab_widget)
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_forms = []
+        while self.tab_widget.count():
+            self.tab_widget.removeTab(0)
         
+        tab_forms = []
+        by_type = {}
         for node_frame in node_frames:
-            page = QWidget()
-            page_layout = QVBoxLayout(page)
-            self._populate_form(page_layout, node_frame)
-            
-            title = node_frame.properties.get("name", node_frame.node_type)
+            by_type.setdefault(node_frame.node_type, []).append(node_frame)
             
-            # Use functional static tab names as approved
-            TAB_TITLES = {
-                "project": "Project Settings",
-                "episode": "Episode Attributes",
-                "sequence": "Sequence Config",
-                "shot": "Shot Metadata",
-                "asset_type": "Type Definition",
-                "asset": "Asset Details"
-            }
-            title = TAB_TITLES.get(node_frame.node_type, title)
-            
-            tab_widget.addTab(page, title)
+        # Several nodes of one type: a single form edits their shared fields
+        for node_type, frames in by_type.items():
+            if len(frames) > 1:
+                page, form = self._multi_edit_page(node_type, frames)
+                self.tab_widget.addTab(page, f"{len(frames)} x {TAB_TITLES.get(node_type, node_type)}")
+                tab_forms.append(form)
+        
+        # Per-node tabs, unless the selection is too large to browse that way
+        if len(node_frames) <= PROPERTIES_MAX_TABS:
+            used = {}
+            for node_frame in node_frames:
+                page, form = self._form_page(node_frame, used)
+                
+                title = node_frame.properties.get("name", node_frame.node_type)
+                title = TAB_TITLES.get(node_frame.node_type, title)
+                
+                self.tab_widget.addTab(page, title)
+                tab_forms.append(form)
+                
+        self.tab_forms = tab_forms
+        self.tab_widget.setVisible(bool(node_frames))
+        self.tab_widget.setUpdatesEnabled(True)
 
-    def _populate_form(self, container_layout, node_frame):
+    def _form_page(self, node_frame, used):
+        """A pooled (page, form) for node_frame's type, bound to it. 'used' counts pages taken per pool."""
+        form_class = FORM_MAP.get(node_frame.node_type, EntityForm)
+        key = (form_class, form_class.layout_key(node_frame))
+        pool = self.form_pool.setdefault(key, [])
+        n = used.get(key, 0)
+        used[key] = n + 1
+        if n < len(pool):
+            page, form = pool[n]
+            form.bind(node_frame)
+            return page, form
+        
+        form = form_class(node_frame)
+        page = self._build_page(form)
+        pool.append((page, form))
+        return page, form
+
+    def on_tab_changed(self, index):
+        """
+        The multi-edit tab and the per-node tabs edit the same nodes: a tab
+        re-reads its node(s) when shown, so it never writes back stale values.
+        """
+        if 0 <= index < len(self.tab_forms):
+            self.tab_forms[index].load_values()
+
+    def _multi_edit_page(self, node_type, node_frames):
+        if node_type in self.multi_edit_forms:
+            page, form = self.multi_edit_forms[node_type]
+            form.bind_nodes(node_frames)
+        else:
+            form = MultiEditForm(node_frames)
+            page = self._build_page(form)
+            self.multi_edit_forms[node_type] = (page, form)
+        return page, form
+
+    def _build_page(self, form):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        
         form_widget = QWidget()
         form_layout = QFormLayout(form_widget)
         form_layout.setContentsMargins(5, 5, 5, 5)
         form_layout.setSpacing(5)
         
-        # Instantiate correct form
-        form_class = FORM_MAP.get(node_frame.node_type, EntityForm)
-        form_instance = form_class(node_frame)
-        form_instance.log_change.connect(self.log_message.emit)
-        form_instance.setup_ui(form_layout)
+        form.log_change.connect(self.log_message.emit)
+        form.property_changed.connect(self.node_changed.emit)
+        form.setup_ui(form_layout)
         
-        container_layout.addWidget(form_widget)
-        container_layout.addStretch()
+        page_layout.addWidget(form_widget)
+        page_layout.addStretch()
+        return page
 
     def browse_path(self, line_edit, mode="file"):
          # Keeping this helper might be useful for other forms if referenced, 
@@ -101,8 +101,8 @@ class Theme:
             }}
         """
 
-    def get_node_style(self, state="base", node_type="generic"):
-        # state: base, hover, selected
+    def node_colors(self, state="base", node_type="generic"):
+        """(background, border) of a node; state: base, hover, selected, match (search hit)."""
         bg = self.colors['node_bg']
         border = self.colors['node_border']
         
@@ -126,7 +126,15 @@ class Theme:
         elif state == "selected":
             bg = self.colors['node_bg_sel']
             border = self.colors['node_border_sel']
-            
+        elif state == "match":
+            border = self.colors['node_border_match']
+
+        return bg, border
+
+    def get_node_style(self, state="base", node_type="generic"):
+        # state: base, hover, selected, match
+        bg, border = self.node_colors(state, node_type)
+
         return f"""
             QFrame {{
                 background-color: {bg};
@@ -155,6 +163,58 @@ class Theme:
             }}
         """
 
+    @property
+    def node_tree_style(self):
+        """
+        Stylesheet of every node widget of a tree, set once on the tree. Node state
+        and type come from the frame's dynamic properties 'state' and 'nodeType';
+        later rules win, so selection beats hover, which beats type and match.
+        """
+        bg, border = self.node_colors("base")
+        type_rules = "".join(
+            f"""
+            NodeFrame[nodeType="{key[len('node_bg_'):]}"] {{ background-color: {value}; }}"""
+            for key, value in self.colors.items()
+            if key.startswith("node_bg_") and key not in ("node_bg_hover", "node_bg_sel")
+        )
+        states = {state: self.node_colors(state) for state in ("hover", "selected", "match")}
+        return f"""
+            NodeFrame {{
+                background-color: {bg};
+                border: 1px solid {border};
+                border-radius: 4px;
+            }}{type_rules}
+            NodeFrame[state="match"] {{ border-color: {states['match'][1]}; }}
+            NodeFrame:hover {{
+                background-color: {states['hover'][0]};
+                border-color: {states['hover'][1]};
+            }}
+            NodeFrame[state="selected"] {{
+                background-color: {states['selected'][0]};
+                border-color: {states['selected'][1]};
+            }}
+            NodeFrame QLineEdit {{
+                border: none;
+                background: transparent;
+                color: {self.colors['node_text']};
+                font-weight: bold;
+                font-size: 8px;
+                padding-bottom: 1px;
+            }}
+            NodeFrame QPushButton {{
+                background-color: {self.colors['node_btn_bg']};
+                border: 1px solid {self.colors['node_btn_bg']};
+                border-radius: 7px;
+                color: {self.colors['node_btn_text']};
+                font-weight: bold;
+                font-size: 7px;
+            }}
+            NodeFrame QPushButton:hover {{
+                background-color: {self.colors['node_btn_hover']};
+                border: 1px solid {self.colors['node_btn_hover']};
+            }}
+        """
+
 # 1. Dark Theme (Visual Studio-like)
 DARK_THEME = Theme(
     name="Dark",
@@ -185,6 +245,7 @@ DARK_THEME = Theme(
         'node_border_hover': '#777777',
         'node_bg_sel': '#2c5f8a',
         'node_border_sel': '#4da6ff',
+        'node_border_match': '#ffb300',
         'node_text': '#e0e0e0',
         
         'node_btn_bg': '#0d47a1',
@@ -231,6 +292,7 @@ LIGHT_THEME = Theme(
         'node_border_hover': '#999999',
         'node_bg_sel': '#cce8ff',
         'node_border_sel': '#0078d7',
+        'node_border_match': '#e65100',
         'node_text': '#333333',
         
         'node_btn_bg': '#0078d7',
@@ -277,6 +339,7 @@ HYDRO_THEME = Theme(
         'node_border_hover': '#00e5ff',
         'node_bg_sel': '#004c57',
         'node_border_sel': '#00e5ff',
+        'node_border_match': '#ffd54f',
         'node_text': '#d1ecf1',
         
         'node_btn_bg': '#00acc1',
@@ -315,6 +378,7 @@ CYBER_THEME = Theme(
         'node_border_hover': '#ff00cc',
         'node_bg_sel': '#3d0d52',
         'node_border_sel': '#00fffa',
+        'node_border_match': '#f9f871',
         'node_text': '#ffe6fb',
         
         'node_btn_bg': '#b0008d',
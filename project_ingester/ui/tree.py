@@ -1,9 +1,365 @@
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+import heapq
 import json
 
 from ..utils.compat import *
 from ..config import *
 from ..data.rules import RULE_MAP
+from ..core import bulk
+from ..core.search import NodeSearchIndex
+
+def default_properties(node_type, is_root=False, node_id=""):
+    """Initial properties of a new node: default name/code from its id and type-specific fields."""
+    # Default Naming Logic
+    name_val = node_type.capitalize()
+    local_index = 1
+    
+    if node_id:
+        try:
+            parts = str(node_id).split("::")
+            local_index = int(parts[-1])
+        except:
+            pass
+
+    if node_type == "project":
+        name_val = "proj"
+    elif node_type == "asset_type":
+        name_val = "asset_type"
+    elif node_type == "asset":
+        if local_index <= 1: name_val = "New asset"
+        else: name_val = f"New asset{local_index:02d}"
+    elif node_type == "episode":
+        name_val = f"Episode {local_index:02d}"
+    elif node_type == "sequence":
+        name_val = f"SQ{local_index:03d}"
+    elif node_type == "shot":
+        name_val = f"SH{local_index:03d}"
+         
+    properties = {"name": name_val, "code": ""}
+    
+    # Auto-generate 'code' if not root and has ID
+    # User Req: "nth sequence will be 'seqn' n follows two digit padding"
+    # "same applies for other entities code parameter"
+    if not is_root and node_id:
+        try:
+            # node_id might be "1" or "1::2" etc. We want the last part.
+            # But wait, shot ID "1::1" -> Shot 1 of Seq 1.
+            # If we want unique code, "sh01" might conflict if global?
+            # Usually Shot codes are unique per sequence.
+            # "Shot#1::1" -> "sh01". "Shot#1::2" -> "sh02".
+            # "Shot#2::1" -> "sh01". This looks correct for local context.
+            
+            parts = str(node_id).split("::")
+            local_index = int(parts[-1])
+            
+            prefix_map = {
+                "sequence": "seq",
+                "shot": "sh", # Standard shot prefix
+                "episode": "ep",
+                "asset": "ast",
+                "asset_type": "at"
+            }
+            
+            prefix = prefix_map.get(node_type.lower(), node_type[:3].lower())
+            code_val = f"{prefix}{local_index:02d}"
+            properties["code"] = code_val
+        except:
+            # Fallback if node_id is not parseable
+            pass
+
+    # Initial placeholders
+    properties["data"] = {}
+    
+    if node_type == "project":
+        properties.update({
+            "production_type": "short", 
+            "start_date": datetime.now().strftime("%Y-%m-%d"),
+            "end_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "root_path": "" + name_val.lower().replace(" ", "_"),
+            "production_style": "2d3d",
+            "task_template": [],
+            "asset_types": []
+        })
+        if is_root:
+             properties["code"] = "PRO"
+             
+    elif node_type == "episode":
+        properties.update({
+            "episode_name": "Episode 1",
+            "episode_order": 1
+        })
+        if node_id: 
+             properties["episode_name"] = f"Episode {node_id}"
+             try: properties["episode_order"] = int(node_id)
+             except: pass
+
+    elif node_type == "sequence":
+        # Removed sequence_code and sequence_name as requested
+        pass
+        
+    elif node_type == "shot":
+        # Removed shot_code, output_format, rv_context_group, delivery_tag as requested
+        pass
+        
+    elif node_type == "asset_type":
+         properties.update({
+             "asset_type_code": "AT",
+             "asset_root_path": "",
+             "publish_ruleset": ["standard"],
+             "versioning_mode": ["v001"]
+         })
+         
+    elif node_type == "asset":
+         properties.update({
+             "asset_code": f"AST_{node_id}" if node_id else "AST",
+             "asset_name": "New Asset",
+             "asset_category": ["prop"],
+             "primary_dcc": ["maya"],
+             "render_engine": ["arnold"],
+             "publish_enabled": True,
+             "asset_status": ["concept"]
+         })
+
+    return properties
+
+
+EXPANDER_SIZE = 16
+FRAME_OFFSET = EXPANDER_SIZE + 5   # expander + spacer of HybridNodeContainer
+
+_watermarks = {}  # (text, theme name, pixel ratio) -> QPixmap
+_tree_styles = {}  # theme name -> VisualTree stylesheet
+
+# Node widget rules that do not depend on the theme
+NODE_WIDGET_STYLE = f"""
+    QPushButton#nodeExpander {{
+        background: #424242;
+        color: #bdbdbd;
+        border: 1px solid #616161;
+        border-radius: 8px;
+        font-size: 8px;
+        padding: 0px;
+        text-align: center;
+    }}
+    QPushButton#nodeExpander[leaf="true"] {{ background: #1e1e1e; }}
+    QPushButton#nodeExpander:hover {{
+        background: #616161;
+        border: 1px solid #757575;
+    }}
+    QFrame#nodeSpacer {{ background: transparent; border: none; }}
+    QPushButton#nodeDelete {{
+        background-color: #c62828;
+        border: 1px solid #c62828;
+        border-radius: {int(BTN_SIZE / 2)}px;
+        color: #ffffff;
+    }}
+    QPushButton#nodeDelete:hover {{ background-color: #e53935; }}
+    QLabel#nodeId {{ color: #eeeeee; font-size: 8px; font-weight: bold; background: transparent; }}
+"""
+
+
+def tree_stylesheet(theme):
+    """
+    The one stylesheet of a VisualTree and all its node widgets, built once per
+    theme. Nodes only switch dynamic properties (see NodeFrame._apply_state),
+    so hover, selection and theme changes never re-parse a stylesheet per node.
+    """
+    style = _tree_styles.get(theme.name)
+    if style is None:
+        style = f"""
+            QTreeWidget {{
+                background: transparent;
+                border: none;
+                outline: none;
+            }}
+            QTreeWidget::item {{
+                height: {ROW_HEIGHT}px;
+                background: transparent;
+            }}
+            QTreeWidget::item:hover {{
+                background: transparent;
+            }}
+            QTreeWidget::branch {{
+                border-image: none;
+                image: none;
+                background: transparent;
+            }}
+        """ + theme.node_tree_style + NODE_WIDGET_STYLE
+        _tree_styles[theme.name] = style
+    return style
+
+
+def watermark_pixmap(text, theme=None, ratio=1.0):
+    """
+    The template name written large and faint, rendered once per text and theme
+    into a pixmap just big enough for it (blitting a viewport-sized one costs more).
+    """
+    key = (text, theme.name if theme else None, ratio)
+    pixmap = _watermarks.get(key)
+    if pixmap is None:
+        if len(_watermarks) >= 8:
+            _watermarks.clear()
+        font = QtGui.QFont("Arial", 40, QtGui.QFont.Bold)
+        size = QtGui.QFontMetrics(font).size(0, text.upper())
+        pixmap = QtGui.QPixmap(max(1, int(size.width() * ratio)), max(1, int(size.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(font)
+        
+        # Color based on theme logic or fixed dim color
+        text_color = QColor(255, 255, 255, 20) # Very faint white/gray
+        if theme and 'Light' in theme.name:
+             text_color = QColor(0, 0, 0, 20)
+        
+        painter.setPen(text_color)
+        painter.drawText(QtCore.QRect(QPoint(0, 0), size), Qt.AlignCenter, text.upper())
+        painter.end()
+        _watermarks[key] = pixmap
+    return pixmap
+
+
+def draw_watermark(painter, rect, text, theme=None):
+    pixmap = watermark_pixmap(text, theme, painter.device().devicePixelRatioF())
+    size = pixmap.deviceIndependentSize().toSize()
+    painter.drawPixmap(rect.center() - QPoint(size.width() // 2, size.height() // 2), pixmap)
+
+
+def node_anchors(rect):
+    """
+    Connector end points of the node laid out in row 'rect' (HybridNodeContainer
+    layout): bottom centre of its frame (as a parent), left middle of its expander (as a child).
+    """
+    frame_top = rect.top() + (rect.height() - NODE_HEIGHT) // 2
+    expander_top = frame_top + (NODE_HEIGHT - EXPANDER_SIZE) // 2
+    return (
+        QPoint(rect.left() + FRAME_OFFSET + NODE_WIDTH // 2, frame_top + NODE_HEIGHT),
+        QPoint(rect.left(), expander_top + EXPANDER_SIZE // 2)
+    )
+
+
+def connector_path(parent_rect, child_rect):
+    start_point = node_anchors(parent_rect)[0]
+    end_point = node_anchors(child_rect)[1]
+
+    dy = end_point.y() - start_point.y()
+    dx = end_point.x() - start_point.x()
+    c1 = QPoint(start_point.x(), start_point.y() + int(dy * 0.5))
+    c2 = QPoint(end_point.x() - int(dx * 0.5), end_point.y())
+
+    path = QPainterPath()
+    path.moveTo(start_point)
+    path.cubicTo(c1, c2, end_point)
+    return path
+
+
+def visible_rows(view):
+    """(index, rect) of every row of a tree view intersecting its viewport, top to bottom."""
+    bottom = view.viewport().height()
+    index = view.indexAt(QPoint(1, 0))
+    while index.isValid():
+        rect = view.visualRect(index)
+        if rect.top() > bottom:
+            break
+        yield index, rect
+        index = view.indexBelow(index)
+
+
+class ConnectorCache:
+    """
+    Parent -> child connector paths of a tree view. Only rows on screen are
+    drawn (a child scrolled out of view has no connector, as with hidden node
+    widgets). Paths are kept in content coordinates, so scrolling only
+    translates the painter; the cache is dropped when rows are inserted,
+    removed, expanded or collapsed.
+    """
+    def __init__(self, view):
+        self.view = view
+        self.paths = {}  # index internalId -> QPainterPath
+        model = view.model()
+        for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                       model.layoutChanged, model.modelReset):
+            signal.connect(self.clear)
+        view.expanded.connect(self.clear)
+        view.collapsed.connect(self.clear)
+
+    def clear(self, *args):
+        self.paths = {}
+
+    def paint(self, painter):
+        dx = self.view.horizontalOffset()
+        dy = self.view.verticalOffset()
+        painter.save()
+        painter.translate(-dx, -dy)
+        for index, rect in visible_rows(self.view):
+            parent = index.parent()
+            if not parent.isValid():
+                continue
+            path = self.paths.get(index.internalId())
+            if path is None:
+                parent_rect = self.view.visualRect(parent).translated(dx, dy)
+                path = connector_path(parent_rect, rect.translated(dx, dy))
+                self.paths[index.internalId()] = path
+            painter.drawPath(path)
+        painter.restore()
+
+
+class NodeData:
+    """
+    State of a node without any widget. VisualTree items carry one until their
+    row is first shown; the model/view tree's TreeNode extends it. Offers the
+    NodeFrame calls used by the panel, the forms and build_plan.
+    """
+    def __init__(self, node_type="", is_root=False, rules=None, node_id=""):
+        self.node_type = node_type
+        self.rules = rules or {}
+        self.node_id = node_id
+        self.is_root = is_root
+        self.is_loaded = False
+        self.properties = default_properties(node_type, is_root, node_id) if node_type else {}
+        self.label = node_type.capitalize()
+        self.tooltip = ""
+        self.can_delete = False
+        self._is_selected = False
+        self._is_highlighted = False
+
+    @property
+    def node_frame(self):
+        return self
+
+    def set_label(self, text, tooltip=None):
+        self.label = text
+        if tooltip is not None:
+            self.tooltip = tooltip
+        self._changed()
+
+    def set_selected(self, selected):
+        self._is_selected = selected
+        self._changed()
+
+    def set_highlighted(self, highlighted):
+        if highlighted == self._is_highlighted:
+            return
+        self._is_highlighted = highlighted
+        self._changed()
+
+    def set_delete_visible(self, visible):
+        if visible == self.can_delete:
+            return
+        self.can_delete = visible
+        self._changed()
+
+    def update_expander_icon(self):
+        self._changed()
+
+    def isVisible(self):
+        return False
+
+    def _changed(self):
+        pass
+
 
 class NodeFrame(QFrame):
     add_child_req = Signal()
@@ -18,121 +374,16 @@ class NodeFrame(QFrame):
         self.node_id = node_id
         self.is_loaded = False
         
-        # Default Naming Logic
-        name_val = node_type.capitalize()
-        local_index = 1
-        
-        if self.node_id:
-            try:
-                parts = str(self.node_id).split("::")
-                local_index = int(parts[-1])
-            except:
-                pass
-
-        if node_type == "project":
-            name_val = "proj"
-        elif node_type == "asset_type":
-            name_val = "asset_type"
-        elif node_type == "asset":
-            if local_index <= 1: name_val = "New asset"
-            else: name_val = f"New asset{local_index:02d}"
-        elif node_type == "episode":
-            name_val = f"Episode {local_index:02d}"
-        elif node_type == "sequence":
-            name_val = f"SQ{local_index:03d}"
-        elif node_type == "shot":
-            name_val = f"SH{local_index:03d}"
-             
-        self.properties = {"name": name_val, "code": ""}
-        
-        # Auto-generate 'code' if not root and has ID
-        # User Req: "nth sequence will be 'seqn' n follows two digit padding"
-        # "same applies for other entities code parameter"
-        if not is_root and self.node_id:
-            try:
-                # node_id might be "1" or "1::2" etc. We want the last part.
-                # But wait, shot ID "1::1" -> Shot 1 of Seq 1.
-                # If we want unique code, "sh01" might conflict if global?
-                # Usually Shot codes are unique per sequence.
-                # "Shot#1::1" -> "sh01". "Shot#1::2" -> "sh02".
-                # "Shot#2::1" -> "sh01". This looks correct for local context.
-                
-                parts = str(self.node_id).split("::")
-                local_index = int(parts[-1])
-                
-                prefix_map = {
-                    "sequence": "seq",
-                    "shot": "sh", # Standard shot prefix
-                    "episode": "ep",
-                    "asset": "ast",
-                    "asset_type": "at"
-                }
-                
-                prefix = prefix_map.get(node_type.lower(), node_type[:3].lower())
-                code_val = f"{prefix}{local_index:02d}"
-                self.properties["code"] = code_val
-            except:
-                # Fallback if node_id is not parseable
-                pass
-
-        # Initial placeholders
-        self.properties["data"] = {}
-        
-        if node_type == "project":
-            self.properties.update({
-                "production_type": "short", 
-                "start_date": datetime.now().strftime("%Y-%m-%d"),
-                "end_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
-                "root_path": "" + name_val.lower().replace(" ", "_"),
-                "production_style": "2d3d",
-                "task_template": [],
-                "asset_types": []
-            })
-            if is_root:
-                 self.properties["code"] = "PRO"
-                 
-        elif node_type == "episode":
-            self.properties.update({
-                "episode_name": "Episode 1",
-                "episode_order": 1
-            })
-            if self.node_id: 
-                 self.properties["episode_name"] = f"Episode {self.node_id}"
-                 try: self.properties["episode_order"] = int(self.node_id)
-                 except: pass
-
-        elif node_type == "sequence":
-            # Removed sequence_code and sequence_name as requested
-            pass
-            
-        elif node_type == "shot":
-            # Removed shot_code, output_format, rv_context_group, delivery_tag as requested
-            pass
-            
-        elif node_type == "asset_type":
-             self.properties.update({
-                 "asset_type_code": "AT",
-                 "asset_root_path": "",
-                 "publish_ruleset": ["standard"],
-                 "versioning_mode": ["v001"]
-             })
-             
-        elif node_type == "asset":
-             self.properties.update({
-                 "asset_code": f"AST_{self.node_id}" if self.node_id else "AST",
-                 "asset_name": "New Asset",
-                 "asset_category": ["prop"],
-                 "primary_dcc": ["maya"],
-                 "render_engine": ["arnold"],
-                 "publish_enabled": True,
-                 "asset_status": ["concept"]
-             })
+        self.properties = default_properties(node_type, is_root, node_id)
 
         self.is_root = is_root
         self.setFixedSize(NODE_WIDTH, NODE_HEIGHT)
         self.setMouseTracking(True)
-        self.current_theme = None
         self._is_selected = False
+        self._is_highlighted = False # Search match
+        # Looked up by the tree's shared stylesheet (Theme.node_tree_style)
+        self.setProperty("nodeType", node_type)
+        self.setProperty("state", "base")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(2, 2, 2, 2)
@@ -172,17 +423,8 @@ class NodeFrame(QFrame):
 
             if is_deletable:
                 self.btn_del = self.create_btn("x", "Delete Node")
-                # We can style delete button specifically if needed in theme, 
-                # or just leave it red as exception. For now, let's leave hardcoded red as warning.
-                self.btn_del.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #c62828; 
-                        border: 1px solid #c62828;
-                        border-radius: {int(BTN_SIZE / 2)}px;
-                        color: #ffffff;
-                    }}
-                    QPushButton:hover {{ background-color: #e53935; }}
-                """)
+                # Red whatever the theme (see NODE_WIDGET_STYLE)
+                self.btn_del.setObjectName("nodeDelete")
                 self.btn_del.clicked.connect(self.delete_req.emit)
                 btn_layout.addWidget(self.btn_del)
                 self.btn_del.hide() # Default hidden, controlled by logic logic
@@ -196,18 +438,42 @@ class NodeFrame(QFrame):
             id_layout = QHBoxLayout()
             id_layout.setAlignment(Qt.AlignRight | Qt.AlignBottom)
             self.id_label = QLabel(self.node_id)
-            self.id_label.setStyleSheet("color: #eeeeee; font-size: 8px; font-weight: bold; background: transparent;")
+            self.id_label.setObjectName("nodeId")
             id_layout.addWidget(self.id_label)
             layout.addLayout(id_layout)
 
-    def update_styles(self, theme):
-        self.current_theme = theme
-        self.setStyleSheet(theme.get_node_style("selected" if self._is_selected else "base", self.node_type))
+    def style_state(self):
+        if self._is_selected: return "selected"
+        if self._is_highlighted: return "match"
+        return "base"
+
+    def _apply_state(self):
+        # Re-polishing this frame re-matches the tree's stylesheet, nothing is parsed
+        state = self.style_state()
+        if self.property("state") != state:
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
 
     def set_delete_visible(self, visible):
         if hasattr(self, 'btn_del') and self.btn_del:
             self.btn_del.setVisible(visible)
 
+    def set_label(self, text, tooltip=None):
+        self.name_edit.setText(text)
+        if tooltip is not None:
+            self.name_edit.setToolTip(tooltip)
+
+    def load_data(self, data):
+        """Takes over what a NodeData placeholder gathered before this widget existed."""
+        self.properties = data.properties
+        self.is_loaded = data.is_loaded
+        self._is_selected = data._is_selected
+        self._is_highlighted = data._is_highlighted
+        self.set_label(data.label, data.tooltip or None)
+        self.set_delete_visible(data.can_delete)
+        self._apply_state()
+
 
     def eventFilter(self, source, event):
         if source == self.name_edit and event.type() == QtCore.QEvent.MouseButtonPress:
@@ -222,16 +488,6 @@ class NodeFrame(QFrame):
         btn.setToolTip(tooltip)
         return btn
 
-    def enterEvent(self, event):
-        if not self._is_selected and self.current_theme:
-            self.setStyleSheet(self.current_theme.get_node_style("hover", self.node_type))
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        if not self._is_selected and self.current_theme:
-            self.setStyleSheet(self.current_theme.get_node_style("base", self.node_type))
-        super().leaveEvent(event)
-
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.clicked.emit(self)
@@ -241,98 +497,28 @@ class NodeFrame(QFrame):
 
     def set_selected(self, selected):
         self._is_selected = selected
-        if self.current_theme:
-            state = "selected" if selected else "base"
-            self.setStyleSheet(self.current_theme.get_node_style(state, self.node_type))
-
-class HybridNodeContainer(QWidget):
+        self._apply_state()
+
+    def set_highlighted(self, highlighted):
+        self._is_highlighted = highlighted
+        self._apply_state()
+
+class NodeActions(QWidget):
+    """
+    Context menus and plan actions of one tree node. HybridNodeContainer is the
+    widget-per-node form; the model/view tree creates a bare one per menu request.
+    Needs 'tree', 'item' and 'node_frame'.
+    """
     request_add_child = Signal()
     request_add_sibling = Signal()
     request_delete = Signal()
-    
-    def __init__(self, tree, item, node_type, is_root=False, rules=None, node_id=""):
+    request_add_bulk = Signal()
+
+    def __init__(self, tree, item, node_frame=None):
         super().__init__()
         self.tree = tree
         self.item = item
-        self.is_root = is_root
-
-        self.is_root = is_root
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        layout.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        
-        # Context Menu
-        self.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.customContextMenuRequested.connect(self.on_context_menu)
-
-        self.btn_expand = QPushButton("▼")
-        self.btn_expand.setFixedSize(16, 16)
-        self.btn_expand.setStyleSheet("""
-            QPushButton {
-                background: #424242;
-                color: #bdbdbd;
-                border: 1px solid #616161;
-                border-radius: 8px;
-                font-size: 8px;
-                padding: 0px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background: #616161;
-                border: 1px solid #757575;
-            }
-        """)
-        self.btn_expand.clicked.connect(self.toggle_expand)
-        layout.addWidget(self.btn_expand)
-        
-        spacer = QFrame()
-        spacer.setFixedSize(5, 2)
-        spacer.setStyleSheet("background: transparent; border: none;")
-        layout.addWidget(spacer)
-
-        self.node_frame = NodeFrame(node_type, is_root, rules, node_id)
-        self.node_frame.add_child_req.connect(self.request_add_child.emit)
-        self.node_frame.add_sibling_req.connect(self.request_add_sibling.emit)
-        self.node_frame.delete_req.connect(self.request_delete.emit)
-        layout.addWidget(self.node_frame)
-
-        # Connect name_edit context menu to custom handler
-        self.node_frame.name_edit.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.node_frame.name_edit.customContextMenuRequested.connect(self.on_name_edit_context_menu)
-
-        self.update_expander_icon()
-
-    def toggle_expand(self):
-        is_expanded = self.item.isExpanded()
-        self.item.setExpanded(not is_expanded)
-        self.update_expander_icon()
-
-    def update_expander_icon(self):
-        if self.item.childCount() == 0:
-            self.btn_expand.setText("•")
-            ss = self.btn_expand.styleSheet()
-            self.btn_expand.setStyleSheet(ss.replace("background: #424242", "background: #1e1e1e"))
-        else:
-            if self.item.isExpanded():
-                self.btn_expand.setText("▼")
-                ss = self.btn_expand.styleSheet()
-                self.btn_expand.setStyleSheet(ss.replace("background: #1e1e1e", "background: #424242"))
-            else:
-                self.btn_expand.setText("▶")
-
-    def on_context_menu(self, pos):
-        if self.node_frame.geometry().contains(pos):
-            global_pos = self.mapToGlobal(pos)
-            self._show_node_context_menu(global_pos)
-        else:
-            global_pos = self.mapToGlobal(pos)
-            self._show_background_context_menu(global_pos)
-
-    def on_name_edit_context_menu(self, pos):
-        global_pos = self.node_frame.name_edit.mapToGlobal(pos)
-        self._show_node_context_menu(global_pos)
+        self.node_frame = node_frame
 
     def _show_node_context_menu(self, global_pos):
         menu = QtWidgets.QMenu(self)
@@ -344,6 +530,13 @@ class HybridNodeContainer(QWidget):
             action_viewer.triggered.connect(self.open_viewer)
             menu.addAction(action_viewer)
         else:
+            # Bulk block (counts + naming patterns, expanded at plan time)
+            if self.node_frame.rules.get("children"):
+                action_bulk = QAction("Add Bulk Block...", self)
+                action_bulk.triggered.connect(self.request_add_bulk.emit)
+                menu.addAction(action_bulk)
+                menu.addSeparator()
+            
             # Dry Run Menu
             dry_run_menu = menu.addMenu("Dry-run")
             
@@ -365,6 +558,11 @@ class HybridNodeContainer(QWidget):
             action_gen_hier = QAction("Includes Hierarchy", self)
             action_gen_hier.triggered.connect(lambda: self.run_generate(hierarchy=True))
             gen_menu.addAction(action_gen_hier)
+            
+            # Export Plan (JSON Lines, can be executed by another process)
+            action_export_plan = QAction("Export Plan...", self)
+            action_export_plan.triggered.connect(lambda: self.run_export_plan(hierarchy=True))
+            menu.addAction(action_export_plan)
         
         if QT_VERSION == 6:
             menu.exec(global_pos)
@@ -392,6 +590,18 @@ class HybridNodeContainer(QWidget):
         else:
             menu.exec_(global_pos)
 
+    def target_items(self):
+        """This node's item, or every selected item if this node is part of the selection."""
+        selected = getattr(self.tree.parent(), 'selected_nodes', [])
+        if self.node_frame not in selected:
+            return [self.item]
+        items = []
+        for frame in selected:
+            item = self.tree.item_for_frame(frame)
+            if item is not None:
+                items.append(item)
+        return items or [self.item]
+
     def run_dry_run(self, hierarchy=False):
         from ..core.setup import ProjectManager
         import json
@@ -402,6 +612,8 @@ class HybridNodeContainer(QWidget):
         output_lines.append(f"========================================")
         output_lines.append(f"[DRY-RUN] Started for: {node_name}")
         output_lines.append(f"Mode: {'Hierarchy' if hierarchy else 'Selected Only'}")
+        if len(self.target_items()) > 1:
+            output_lines.append(f"Roots: {len(self.target_items())} selected nodes")
         
         try:
             # We use a dummy logger to avoid polluting the main console with 'Resolving...' messages
@@ -420,7 +632,7 @@ class HybridNodeContainer(QWidget):
                  # We'll assume user might be connected or we proceed offline (best effort).
                  pass
 
-            plan = manager.build_plan(self.item, self.tree, hierarchy=hierarchy)
+            plan = manager.build_plans(self.target_items(), self.tree, hierarchy=hierarchy)
             
             if not plan:
                 output_lines.append("No entities found to generate.")
@@ -464,12 +676,28 @@ class HybridNodeContainer(QWidget):
         from ..core.setup import ProjectManager
         try:
             manager = ProjectManager(log_callback=self.log_to_console)
-            manager.process_node(self.item, self.tree, hierarchy=hierarchy)
+            manager.process_nodes(self.target_items(), self.tree, hierarchy=hierarchy)
         except Exception as e:
             self.log_to_console(f"Generate failed: {e}", "ERROR")
             import traceback
             self.log_to_console(traceback.format_exc(), "ERROR")
 
+    def run_export_plan(self, hierarchy=True):
+        from ..core.setup import ProjectManager
+        from ..core.plan_io import PlanWriter
+        
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Plan", "", "Plan Files (*.jsonl)")
+        if not filename: return
+        
+        try:
+            manager = ProjectManager(log_callback=lambda m, l: None)
+            # Steps are streamed to disk as they are resolved
+            with PlanWriter(filename) as writer:
+                manager.build_plan(self.item, self.tree, hierarchy=hierarchy, sink=writer)
+            self.log_to_console(f"Exported plan ({len(writer)} steps) to: {filename}", "SUCCESS")
+        except Exception as e:
+            self.log_to_console(f"Plan export failed: {e}", "ERROR")
+
     def log_to_console(self, message, level="INFO"):
         # We need to bubble this up to ProjectStructureWidget -> MainWindow -> Console
         # HybridNodeContainer -> VisualTree -> ProjectStructureWidget
@@ -477,6 +705,73 @@ class HybridNodeContainer(QWidget):
              self.tree.log_requested.emit(message, level)
 
 
+class HybridNodeContainer(NodeActions):
+    def __init__(self, tree, item, node_type, is_root=False, rules=None, node_id=""):
+        super().__init__(tree, item)
+        self.is_root = is_root
+
+        self.is_root = is_root
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        
+        # Context Menu
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.on_context_menu)
+
+        self.btn_expand = QPushButton("▼")
+        self.btn_expand.setObjectName("nodeExpander")
+        self.btn_expand.setFixedSize(16, 16)
+        self.btn_expand.clicked.connect(self.toggle_expand)
+        layout.addWidget(self.btn_expand)
+        
+        spacer = QFrame()
+        spacer.setFixedSize(5, 2)
+        spacer.setObjectName("nodeSpacer")
+        layout.addWidget(spacer)
+
+        self.node_frame = NodeFrame(node_type, is_root, rules, node_id)
+        self.node_frame.add_child_req.connect(self.request_add_child.emit)
+        self.node_frame.add_sibling_req.connect(self.request_add_sibling.emit)
+        self.node_frame.delete_req.connect(self.request_delete.emit)
+        layout.addWidget(self.node_frame)
+
+        # Connect name_edit context menu to custom handler
+        self.node_frame.name_edit.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.node_frame.name_edit.customContextMenuRequested.connect(self.on_name_edit_context_menu)
+
+        self.update_expander_icon()
+
+    def toggle_expand(self):
+        is_expanded = self.item.isExpanded()
+        self.item.setExpanded(not is_expanded)
+        self.update_expander_icon()
+
+    def update_expander_icon(self):
+        leaf = self.item.childCount() == 0
+        if leaf:
+            self.btn_expand.setText("•")
+        else:
+            self.btn_expand.setText("▼" if self.item.isExpanded() else "▶")
+        if self.btn_expand.property("leaf") != leaf:
+            self.btn_expand.setProperty("leaf", leaf)
+            self.btn_expand.style().unpolish(self.btn_expand)
+            self.btn_expand.style().polish(self.btn_expand)
+
+    def on_context_menu(self, pos):
+        if self.node_frame.geometry().contains(pos):
+            global_pos = self.mapToGlobal(pos)
+            self._show_node_context_menu(global_pos)
+        else:
+            global_pos = self.mapToGlobal(pos)
+            self._show_background_context_menu(global_pos)
+
+    def on_name_edit_context_menu(self, pos):
+        global_pos = self.node_frame.name_edit.mapToGlobal(pos)
+        self._show_node_context_menu(global_pos)
+
 class VisualTree(QtWidgets.QTreeWidget):
     customItemClicked = Signal(object)
     selectionRectRequested = Signal(object, object)
@@ -745,6 +1040,12 @@ class VisualTree(QtWidgets.QTreeWidget):
         self.customContextMenuRequested.connect(self.on_context_menu)
         
         self.current_theme = None
+        self.connectors = ConnectorCache(self)
+
+        # Node widgets are built when their row first comes into view (see materialize)
+        self.widget_factory = None
+        self.itemExpanded.connect(lambda item: self.materialize_visible())
+        self.verticalScrollBar().valueChanged.connect(lambda value: self.materialize_visible())
 
         # Set up custom branch drawing
         self.setAllColumnsShowFocus(True)
@@ -758,32 +1059,10 @@ class VisualTree(QtWidgets.QTreeWidget):
 
     def set_theme(self, theme):
         self.current_theme = theme
-        # Set up stylesheet for transparent background and no borders
-        self.setStyleSheet(f"""
-            QTreeWidget {{
-                background: transparent;
-                border: none;
-                outline: none;
-            }}
-            QTreeWidget::item {{
-                height: {ROW_HEIGHT}px;
-                background: transparent;
-            }}
-            QTreeWidget::item:hover {{
-                background: transparent;
-            }}
-            QTreeWidget::branch {{
-                border-image: none;
-                image: none;
-                background: transparent;
-            }}
-        """)
+        # Transparent tree, and the node widgets' look for this theme
+        self.setStyleSheet(tree_stylesheet(theme))
         # Update connection lines color
         self.viewport().update()
-        
-        # Update all node frames
-        for frame in self.get_all_node_frames():
-            frame.update_styles(theme)
 
     def on_context_menu(self, pos):
         item = self.itemAt(pos)
@@ -861,6 +1140,36 @@ class VisualTree(QtWidgets.QTreeWidget):
     def drawBranches(self, painter, rect, index):
         pass
 
+    def itemWidget(self, item, column):
+        # Rows not shown yet have no widget, only the NodeData they will be built from
+        widget = super().itemWidget(item, column)
+        if widget is None and column == 0:
+            return getattr(item, 'node_data', None)
+        return widget
+
+    def materialize(self, item):
+        """Builds the widget of a row that so far only carried a NodeData."""
+        data = getattr(item, 'node_data', None)
+        if data is None or self.widget_factory is None:
+            return None
+        item.node_data = None
+        widget = self.widget_factory(item, data)
+        self.setItemWidget(item, 0, widget)
+        widget.update_expander_icon()
+        return widget
+
+    def materialize_visible(self):
+        if not self.updatesEnabled():
+            return
+        for index, rect in visible_rows(self):
+            item = self.itemFromIndex(index)
+            if getattr(item, 'node_data', None) is not None:
+                self.materialize(item)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.materialize_visible()
+
     def get_all_node_frames(self):
         frames = []
         iterator = QtWidgets.QTreeWidgetItemIterator(self)
@@ -872,6 +1181,26 @@ class VisualTree(QtWidgets.QTreeWidget):
             iterator += 1
         return frames
 
+    def item_for_frame(self, frame):
+        # A NodeData placeholder has no container (its row was never shown)
+        container = frame.parent() if isinstance(frame, QWidget) else None
+        if isinstance(container, HybridNodeContainer):
+            return container.item
+        return None
+
+    def frames_in_rect(self, rect):
+        """Node frames intersecting 'rect' (tree coordinates); only visible rows are tested."""
+        hits = []
+        for index, row_rect in visible_rows(self):
+            widget = self.itemWidget(self.itemFromIndex(index), 0)
+            if not isinstance(widget, HybridNodeContainer):
+                continue
+            frame = widget.node_frame
+            frame_pos = frame.mapTo(self, QPoint(0, 0))
+            if rect.intersects(QtCore.QRect(frame_pos, frame.size())):
+                hits.append(frame)
+        return hits
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             pos = event.position().toPoint() if QT_VERSION >= 6 else event.pos()
@@ -907,20 +1236,7 @@ class VisualTree(QtWidgets.QTreeWidget):
                 
                 # --- WATERMARK ---
                 if self.watermark_text:
-                    painter.save()
-                    font = QtGui.QFont("Arial", 40, QtGui.QFont.Bold)
-                    painter.setFont(font)
-                    
-                    # Color based on theme logic or fixed dim color
-                    text_color = QColor(255, 255, 255, 20) # Very faint white/gray
-                    if self.current_theme and 'Light' in self.current_theme.name:
-                         text_color = QColor(0, 0, 0, 20)
-                    
-                    painter.setPen(text_color)
-                    
-                    rect = self.viewport().rect()
-                    painter.drawText(rect, Qt.AlignCenter, self.watermark_text.upper())
-                    painter.restore()
+                    draw_watermark(painter, self.viewport().rect(), self.watermark_text, self.current_theme)
                 # -----------------
                 
                 line_color = "#546e7a" # Fallback
@@ -932,58 +1248,50 @@ class VisualTree(QtWidgets.QTreeWidget):
                 pen.setStyle(Qt.SolidLine)
                 painter.setPen(pen)
                 
-                count = self.topLevelItemCount()
-                for i in range(count):
-                    self.draw_recursive(painter, self.topLevelItem(i))
+                self.connectors.paint(painter)
             finally:
                 painter.end()
-                
-    def draw_recursive(self, painter, item):
-        child_count = item.childCount()
-        for i in range(child_count):
-            child = item.child(i)
-            self.draw_connector(painter, item, child)
-            if item.isExpanded():
-                self.draw_recursive(painter, child)
-                
-    def draw_connector(self, painter, parent, child):
-        parent_w = self.itemWidget(parent, 0)
-        child_w = self.itemWidget(child, 0)
-        if not parent_w or not child_w:
-            return
-        if not child_w.isVisible():
-            return
-        
-        if hasattr(parent_w, 'node_frame'):
-            # Logic without save/restore as we don't modify painter state
-            p_frame = parent_w.node_frame
-            p_origin = p_frame.mapTo(self.viewport(), QPoint(int(p_frame.width() / 2), p_frame.height()))
-            start_point = p_origin
-            
-            c_btn = child_w.btn_expand
-            c_origin = c_btn.mapTo(self.viewport(), QPoint(0, int(c_btn.height() / 2)))
-            end_point = c_origin
-            
-            dy = end_point.y() - start_point.y()
-            dx = end_point.x() - start_point.x()
-            c1 = QPoint(start_point.x(), start_point.y() + int(dy * 0.5))
-            c2 = QPoint(end_point.x() - int(dx * 0.5), end_point.y())
 
-            path = QPainterPath()
-            path.moveTo(start_point)
-            path.cubicTo(c1, c2, end_point)
-            painter.drawPath(path)
+class SiblingNumbers:
+    """
+    Allocates the last part of the ids of one parent's children: numbers freed
+    by deletions are handed out again (lowest first), else the next new one.
+    Ids never collide, whatever the order in which siblings are deleted.
+    """
+    def __init__(self):
+        self.next = 1
+        self.free = []  # heap of released numbers
+
+    def take(self):
+        if self.free:
+            return heapq.heappop(self.free)
+        number = self.next
+        self.next += 1
+        return number
+
+    def release(self, number):
+        heapq.heappush(self.free, number)
+
 
 class ProjectStructureWidget(QWidget):
     node_selected = Signal(object)
     log_message = Signal(str, str)
     viewer_requested = Signal(dict, str) # Bubble up
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, view_mode=None):
         super().__init__(parent)
         self.current_template = "Custom"
         self.current_theme = None
-        self.selected_nodes = []
+        self._selection = {} # Selected node frames -> None, in selection order
+        self.view_mode = view_mode or TREE_VIEW_MODE
+        self._batch_parents = None # Parents touched inside batch_insert(), in order
+        self._batch_items = None # Items added inside batch_insert(), indexed when it ends
+        self.nodes = {} # node_id -> item, every node in the tree
+        self.nodes_by_type = {} # node_type -> {node_id: item}
+        self._sibling_numbers = {} # parent node_id -> SiblingNumbers of its children
+        self.search_index = NodeSearchIndex()
+        self._matches = [] # Items highlighted by the search box
+        self._match_pos = 0
         self.setup_ui()
         
     def set_theme(self, theme):
@@ -1000,7 +1308,30 @@ class ProjectStructureWidget(QWidget):
         self.header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.header_label)
         
-        self.tree = VisualTree()
+        # Search box: jumps through the nodes matching a name, code or id
+        search_row = QWidget()
+        search_layout = QHBoxLayout(search_row)
+        search_layout.setContentsMargins(4, 4, 4, 0)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Find name, code or id...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.search)
+        self.search_input.returnPressed.connect(self.next_match)
+        self.search_count = QLabel("")
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.search_count)
+        layout.addWidget(search_row)
+        
+        if self.view_mode == "model":
+            from .tree_model import ModelVisualTree
+            self.tree = ModelVisualTree()
+            # Nodes are painted, so clicks and buttons arrive through the view
+            self.tree.customItemClicked.connect(self.on_node_clicked)
+            self.tree.node_action_requested.connect(self.on_node_action)
+            self.tree.node_renamed.connect(self.index_node)
+        else:
+            self.tree = VisualTree()
+            self.tree.widget_factory = self._create_node_widget
         self.tree.selectionRectRequested.connect(self.on_rubberband_selection)
         self.tree.log_requested.connect(self.log_message.emit)
         self.tree.viewer_requested.connect(self.viewer_requested.emit)
@@ -1017,7 +1348,7 @@ class ProjectStructureWidget(QWidget):
         self.current_template = template_name
         self.tree.watermark_text = template_name # Set Watermark
         self.tree.viewport().update() # Trigger repaint
-        self.tree.clear()
+        self.clear_tree()
         rules = RULE_MAP.get(template_name, {})
         project_rules = rules.get("project", {})
         
@@ -1037,6 +1368,17 @@ class ProjectStructureWidget(QWidget):
             
         self.populate_default_structure(item, "project")
 
+    def clear_tree(self):
+        """Removes every node, with their registry and search entries."""
+        self.tree.clear()
+        self.nodes = {}
+        self.nodes_by_type = {}
+        self._sibling_numbers = {}
+        self.search_index.clear()
+        self._matches = []
+        self._match_pos = 0
+        self._update_search_count()
+
     def populate_default_structure(self, parent_item, parent_type):
         full_rules = RULE_MAP.get(self.current_template, {})
         parent_rules = full_rules.get(parent_type, {})
@@ -1046,87 +1388,285 @@ class ProjectStructureWidget(QWidget):
             new_item = self.add_node(parent_item, child_type)
             self.populate_default_structure(new_item, child_type)
 
-    def add_node(self, parent_item, node_type, is_root=False, rules=None):
-        item = QtWidgets.QTreeWidgetItem(parent_item if parent_item else self.tree)
-        item.setSizeHint(0, QSize(NODE_WIDTH + 80, ROW_HEIGHT))
+    def _new_child_id(self, parent_item):
+        parent_id = self.tree.itemWidget(parent_item, 0).node_frame.node_id
+        numbers = self._sibling_numbers.get(parent_id)
+        if numbers is None:
+            numbers = self._sibling_numbers[parent_id] = SiblingNumbers()
+        sibling_num = numbers.take()
         
+        if not parent_id: return str(sibling_num)
+        return f"{parent_id}::{sibling_num}"
+
+    def _release_id(self, parent_item, node_id):
+        parent_id = self.tree.itemWidget(parent_item, 0).node_frame.node_id
+        numbers = self._sibling_numbers.get(parent_id)
+        if numbers is not None:
+            numbers.release(int(node_id.split("::")[-1]))
+
+    def add_node(self, parent_item, node_type, is_root=False, rules=None):
         if not rules:
             full_rules = RULE_MAP.get(self.current_template, {})
             rules = full_rules.get(node_type, {})
 
-        node_id = ""
-        if not is_root and parent_item:
-             count = parent_item.childCount()
-             idx = parent_item.indexOfChild(item)
-             sibling_num = idx + 1
-             parent_widget = self.tree.itemWidget(parent_item, 0)
-             parent_id = ""
-             if parent_widget and hasattr(parent_widget, 'node_frame'):
-                  parent_id = parent_widget.node_frame.node_id
-             
-             if not parent_id: node_id = str(sibling_num)
-             else: node_id = f"{parent_id}::{sibling_num}"
+        if self.view_mode == "model":
+            node_id = ""
+            if not is_root and parent_item:
+                 node_id = self._new_child_id(parent_item)
+            item = self.tree.add_node(parent_item, node_type, is_root, rules, node_id)
+        else:
+            item = QtWidgets.QTreeWidgetItem(parent_item if parent_item else self.tree)
+            item.setSizeHint(0, QSize(NODE_WIDTH + 80, ROW_HEIGHT))
+
+            node_id = ""
+            if not is_root and parent_item:
+                 node_id = self._new_child_id(parent_item)
+
+            # The item carries its data; the widget is built now only if the row can be
+            # on screen, else when it is first scrolled or expanded into view
+            item.node_data = NodeData(node_type, is_root, rules, node_id)
+            if self._batch_parents is None and self._in_expanded_branch(parent_item):
+                self.tree.materialize(item)
+        
+        self._register(item)
+        if self._batch_items is not None:
+            self._batch_items.append(item) # Names are applied after add_node while loading
+        else:
+            self.index_node(item)
+        
+        if parent_item:
+            if self._batch_parents is not None:
+                self._batch_parents[parent_item] = None
+            else:
+                self._finish_children(parent_item, appended=True)
+            
+        return item
 
-        widget = HybridNodeContainer(self.tree, item, node_type, is_root, rules, node_id)
-        if self.current_theme:
-            widget.node_frame.update_styles(self.current_theme)
+    def _create_node_widget(self, item, data):
+        """VisualTree.widget_factory: the HybridNodeContainer of a row coming into view."""
+        node_type = data.node_type
+        widget = HybridNodeContainer(self.tree, item, node_type, data.is_root, data.rules, data.node_id)
+        widget.node_frame.load_data(data)
             
         widget.request_add_child.connect(lambda: self.on_add_child(item, node_type))
         widget.request_add_sibling.connect(lambda: self.on_add_sibling(item, node_type))
         widget.request_delete.connect(lambda: self.on_delete_node(item))
+        widget.request_add_bulk.connect(lambda: self.on_add_bulk(item, node_type))
         widget.node_frame.clicked.connect(self.on_node_clicked)
-        
-        self.tree.setItemWidget(item, 0, widget)
-        
-        if parent_item:
-            parent_item.setExpanded(True)
-            parent_widget = self.tree.itemWidget(parent_item, 0)
-            if parent_widget: parent_widget.update_expander_icon()
+        return widget
+
+    def _in_expanded_branch(self, parent_item):
+        # A new child is shown once its parent is expanded (add_node does that), so only
+        # the ancestors above the parent can hide it
+        ancestor = parent_item.parent() if parent_item else None
+        while ancestor is not None:
+            if not ancestor.isExpanded():
+                return False
+            ancestor = ancestor.parent()
+        return True
+
+    def _finish_children(self, parent_item, appended=False):
+        parent_item.setExpanded(True)
+        parent_widget = self.tree.itemWidget(parent_item, 0)
+        if parent_widget: parent_widget.update_expander_icon()
+        if appended:
+            # Only the new last child and the one it follows can change
+            count = parent_item.childCount()
+            self._update_delete_button(parent_item, count - 1)
+            if count > 1: self._update_delete_button(parent_item, count - 2)
+        else:
             self.refresh_siblings_buttons(parent_item)
-            
-
-            
-        return item
 
+    @contextmanager
+    def batch_insert(self):
+        """
+        Groups many add_node calls (loading a project, populating from folders).
+        Painting and tree signals are suspended, the model tree reports a single
+        reset, and expansion, expander icons and sibling buttons are settled once
+        per touched parent at the end instead of after every insert. Widget tree
+        rows get their node widgets only once they are on screen. New nodes are
+        indexed for search at the end, with the names applied meanwhile.
+        """
+        if self._batch_parents is not None:
+            yield
+            return
+        self._batch_parents = {}
+        self._batch_items = []
+        self.tree.setUpdatesEnabled(False)
+        was_blocked = self.tree.blockSignals(True)
+        if self.view_mode == "model":
+            self.tree.tree_model.begin_batch()
+        try:
+            yield
+        finally:
+            parents, self._batch_parents = self._batch_parents, None
+            items, self._batch_items = self._batch_items, None
+            if self.view_mode == "model":
+                self.tree.tree_model.end_batch()
+            for parent_item in parents:
+                self._finish_children(parent_item)
+            for item in items:
+                self.index_node(item)
+            self.tree.blockSignals(was_blocked)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.doItemsLayout()
+            if self.view_mode != "model":
+                self.tree.materialize_visible()
+
+
+    def node_item(self, node_id):
+        """The item of the node with this id, or None."""
+        return self.nodes.get(node_id)
+
+    def items_of_type(self, node_type):
+        return list(self.nodes_by_type.get(node_type, {}).values())
+
+    def node_frames(self, node_type=None):
+        """Node frames (NodeData for rows not built yet) from the registry, without walking the tree."""
+        items = self.nodes.values() if node_type is None else self.nodes_by_type.get(node_type, {}).values()
+        return [self.tree.itemWidget(item, 0).node_frame for item in items]
+
+    def index_node(self, item):
+        """(Re)indexes a node for the search box under its current name, code and id."""
+        frame = self.tree.itemWidget(item, 0).node_frame
+        self.search_index.add(item, frame.properties.get("name"), frame.properties.get("code"), frame.node_id)
+
+    def _register(self, item):
+        frame = self.tree.itemWidget(item, 0).node_frame
+        self.nodes[frame.node_id] = item
+        self.nodes_by_type.setdefault(frame.node_type, {})[frame.node_id] = item
+
+    def _forget(self, item):
+        # The item and its whole branch leave the tree
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            frame = self.tree.itemWidget(current, 0).node_frame
+            if self.nodes.get(frame.node_id) is current:
+                del self.nodes[frame.node_id]
+                del self.nodes_by_type[frame.node_type][frame.node_id]
+            self._sibling_numbers.pop(frame.node_id, None)
+            self.search_index.remove(current)
+            stack.extend(current.child(i) for i in range(current.childCount()))
+        if self._matches:
+            self._matches = [match for match in self._matches if match in self.search_index]
+            self._match_pos = min(self._match_pos, max(len(self._matches) - 1, 0))
+            self._update_search_count()
+
+    def on_node_property_changed(self, node_frame, key):
+        """Properties panel edits: the label and search entry follow the name and code."""
+        if key not in ("name", "code"): return
+        item = self.tree.item_for_frame(node_frame)
+        if item is None or item not in self.search_index: return
+        if key == "name":
+            node_frame.set_label(node_frame.properties.get("name", ""))
+        self.index_node(item)
+
+    def search(self, text):
+        """
+        Highlights the nodes whose name, code or id starts with or contains
+        'text' (the first SEARCH_MAX_RESULTS) and jumps to the first one.
+        Answered by the search index, never by walking the tree.
+        """
+        matches = self.search_index.find(text)
+        keep = set(matches)
+        for item in self._matches:
+            if item not in keep:
+                self.tree.itemWidget(item, 0).node_frame.set_highlighted(False)
+        for item in matches:
+            self.tree.itemWidget(item, 0).node_frame.set_highlighted(True)
+        self._matches = matches
+        self._match_pos = 0
+        self._update_search_count()
+        if matches:
+            self.reveal_node(matches[0])
+        return matches
+
+    def next_match(self):
+        if not self._matches: return
+        self._match_pos = (self._match_pos + 1) % len(self._matches)
+        self._update_search_count()
+        self.reveal_node(self._matches[self._match_pos])
+
+    def _update_search_count(self):
+        if not self.search_input.text().strip():
+            self.search_count.setText("")
+        elif not self._matches:
+            self.search_count.setText("No match")
+        else:
+            more = "+" if len(self._matches) >= SEARCH_MAX_RESULTS else ""
+            self.search_count.setText(f"{self._match_pos + 1}/{len(self._matches)}{more}")
+
+    def reveal_node(self, item):
+        """Expands the ancestors of 'item' and scrolls it into view."""
+        ancestor = item.parent()
+        while ancestor is not None:
+            if not ancestor.isExpanded():
+                ancestor.setExpanded(True)
+                self.tree.itemWidget(ancestor, 0).update_expander_icon()
+            ancestor = ancestor.parent()
+        self.tree.scrollToItem(item)
+        if self.view_mode != "model":
+            self.tree.materialize_visible()
+
+    def on_node_action(self, action, item):
+        """Node buttons and menu entries of the model/view tree."""
+        if action == "add_child": self.on_add_child(item, item.node_type)
+        elif action == "add_sibling": self.on_add_sibling(item, item.node_type)
+        elif action == "delete": self.on_delete_node(item)
+        elif action == "add_bulk": self.on_add_bulk(item, item.node_type)
+
+    @property
+    def selected_nodes(self):
+        """Selected node frames, in selection order."""
+        return list(self._selection)
 
     def on_node_clicked(self, node_frame):
         mods = QApplication.keyboardModifiers()
         if mods & Qt.ControlModifier:
-            if node_frame in self.selected_nodes: self.deselect_node(node_frame)
+            if node_frame in self._selection: self.deselect_node(node_frame)
             else: self.select_node(node_frame, add=True)
         else:
-            self.clear_selection()
-            self.select_node(node_frame, add=True)
+            self.select_node(node_frame)
 
     def select_node(self, node_frame, add=False):
-        if not add: self.clear_selection()
-        if node_frame not in self.selected_nodes:
-            self.selected_nodes.append(node_frame)
-            node_frame.set_selected(True)
-            self.log_message.emit(f"Selected Node: {node_frame.properties.get('name', 'Unknown')}", "INFO")
-        self.node_selected.emit(self.selected_nodes)
+        self.set_selection([node_frame], add=add)
 
     def deselect_node(self, node_frame):
-         if node_frame in self.selected_nodes:
-             self.selected_nodes.remove(node_frame)
-             node_frame.set_selected(False)
-         self.node_selected.emit(self.selected_nodes)
+        selection = dict(self._selection)
+        selection.pop(node_frame, None)
+        self._apply_selection(selection)
              
     def clear_selection(self):
-         for n in self.selected_nodes:
-             try:
-                 if n and n.isVisible(): n.set_selected(False)
-             except RuntimeError: pass
-         self.selected_nodes = []
-         self.node_selected.emit(self.selected_nodes)
+        self._apply_selection({})
+
+    def set_selection(self, node_frames, add=False):
+        """One selection gesture: replaces (or extends) the selection and notifies once."""
+        selection = dict(self._selection) if add else {}
+        for frame in node_frames:
+            selection[frame] = None
+        self._apply_selection(selection)
+
+    def _apply_selection(self, selection):
+        previous = self._selection
+        self._selection = selection
+        for frame in previous:
+            if frame not in selection:
+                try:
+                    frame.set_selected(False)
+                except RuntimeError: pass # Widget deleted with its item
+        added = [frame for frame in selection if frame not in previous]
+        for frame in added:
+            frame.set_selected(True)
+            
+        if len(added) == 1:
+            self.log_message.emit(f"Selected Node: {added[0].properties.get('name', 'Unknown')}", "INFO")
+        elif added:
+            self.log_message.emit(f"Selected {len(added)} nodes", "INFO")
+        self.node_selected.emit(self.selected_nodes)
          
     def on_rubberband_selection(self, rect, modifiers):
-        if not (modifiers & Qt.ControlModifier): self.clear_selection()
-        all_frames = self.tree.get_all_node_frames()
-        for frame in all_frames:
-             frame_pos = frame.mapTo(self.tree, QPoint(0,0))
-             frame_rect = QtCore.QRect(frame_pos, frame.size())
-             if rect.intersects(frame_rect): self.select_node(frame, add=True)
+        self.set_selection(self.tree.frames_in_rect(rect), add=bool(modifiers & Qt.ControlModifier))
 
     def on_add_child(self, parent_item, parent_type):
         full_rules = RULE_MAP.get(self.current_template, {})
@@ -1148,6 +1688,33 @@ class ProjectStructureWidget(QWidget):
             if QT_VERSION == 6: menu.exec(pos)
             else: menu.exec_(pos)
         
+    def on_add_bulk(self, parent_item, parent_type):
+        from .dialogs import BulkSpecDialog
+        dialog = BulkSpecDialog(RULE_MAP.get(self.current_template, {}), parent_type, self)
+        result = dialog.exec() if QT_VERSION == 6 else dialog.exec_()
+        if result and dialog.get_spec():
+            self.add_bulk_node(parent_item, dialog.get_spec())
+
+    def add_bulk_node(self, parent_item, spec):
+        """
+        Adds a collapsed summary node standing for a whole bulk block.
+        The block is only expanded (lazily) when a plan is built.
+        """
+        spec = bulk.normalize_spec(spec)
+        item = self.add_node(parent_item, spec['type'], rules={"children": [], "deletable": True})
+        widget = self.tree.itemWidget(item, 0)
+        if widget and widget.node_frame:
+            label = bulk.short_label(spec)
+            widget.node_frame.properties['name'] = label
+            widget.node_frame.properties['bulk_spec'] = spec
+            widget.node_frame.set_label(label, bulk.describe(spec))
+            self.index_node(item)
+            if self._batch_parents is None and parent_item:
+                # Bulk blocks can always be deleted
+                self._update_delete_button(parent_item, parent_item.childCount() - 1)
+        self.log_message.emit(f"Added bulk block: {bulk.describe(spec)}", "INFO")
+        return item
+
     def on_add_sibling(self, item, node_type):
         parent_item = item.parent()
         if not parent_item: return 
@@ -1156,47 +1723,58 @@ class ProjectStructureWidget(QWidget):
     def on_delete_node(self, item):
         parent = item.parent()
         if parent:
+            was_last = parent.child(parent.childCount() - 1) is item
+            self._release_id(parent, self.tree.itemWidget(item, 0).node_frame.node_id)
+            self._forget(item)
             parent.removeChild(item)
             parent_widget = self.tree.itemWidget(parent, 0)
             if parent_widget: parent_widget.update_expander_icon()
-            self.refresh_siblings_buttons(parent)
+            # Only removing the last child makes another one the last
+            if was_last and parent.childCount():
+                self._update_delete_button(parent, parent.childCount() - 1)
 
     def refresh_siblings_buttons(self, parent_item):
         if not parent_item: return
-        child_count = parent_item.childCount()
-        for i in range(child_count):
-            child = parent_item.child(i)
-            widget = self.tree.itemWidget(child, 0)
-            if widget and hasattr(widget, 'node_frame'):
-                # Rule: First sibling (index 0) cannot be deleted.
-                # Rule: Only the LAST added sibling (latest) can be deleted.
-                is_last_sibling = (i == child_count - 1)
-                can_delete = (i > 0) and is_last_sibling
-                widget.node_frame.set_delete_visible(can_delete)
+        for i in range(parent_item.childCount()):
+            self._update_delete_button(parent_item, i)
+
+    def _update_delete_button(self, parent_item, index):
+        frame = self.tree.itemWidget(parent_item.child(index), 0).node_frame
+        # Rule: First sibling (index 0) cannot be deleted.
+        # Rule: Only the LAST added sibling (latest) can be deleted.
+        can_delete = index > 0 and index == parent_item.childCount() - 1
+        if 'bulk_spec' in frame.properties: can_delete = True
+        frame.set_delete_visible(can_delete)
 
     def populate_from_structure(self, data):
         """
         Rebuilds the tree based on the nested dictionary returned by FolderMapper.
         data format: { 'type':..., 'name':..., 'children': [ ... ] }
         """
-        self.tree.clear()
+        self.clear_tree()
         
-        # 1. Root
-        root_type = data.get('type', 'project')
-        # Ensure rules exist? We assume template is already set or we should set it?
-        # The App should sets template before calling this if needed.
-        
-        root_item = self.add_node(None, root_type, is_root=True)
-        self._apply_data_to_node(root_item, data)
-        self.tree.expandItem(root_item)
-        
-        # 2. Children
-        self._recursive_populate(root_item, data.get('children', []))
+        with self.batch_insert():
+            # 1. Root
+            root_type = data.get('type', 'project')
+            # Ensure rules exist? We assume template is already set or we should set it?
+            # The App should sets template before calling this if needed.
+            
+            root_item = self.add_node(None, root_type, is_root=True)
+            self._apply_data_to_node(root_item, data)
+            self.tree.expandItem(root_item)
+            
+            # 2. Children
+            self._recursive_populate(root_item, data.get('children', []))
         
     def _recursive_populate(self, parent_item, children_data):
         for child in children_data:
             node_type = child.get('type')
             
+            # Bulk blocks stay collapsed into a single summary node
+            if child.get('bulk_spec'):
+                self.add_bulk_node(parent_item, child['bulk_spec'])
+                continue
+            
             # Check if allowed by rules? 
             # add_node checks NOTHING regarding validity usually, it just adds.
             # But the UI buttons invoke 'on_add_child' which checks rules.
@@ -1213,7 +1791,7 @@ class ProjectStructureWidget(QWidget):
         if widget and widget.node_frame:
             name = data.get('name', 'Unknown')
             widget.node_frame.properties['name'] = name
-            widget.node_frame.name_edit.setText(name)
+            widget.node_frame.set_label(name)
             
             # Update Code if possible? 
             # The node_frame might have auto-generated a code based on "New Asset".
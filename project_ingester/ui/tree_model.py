@@ -0,0 +1,622 @@
+from ..utils.compat import *
+from ..config import *
+from .tree import (draw_watermark, visible_rows, ConnectorCache, NodeActions, NodeData,
+                   VisualTree, EXPANDER_SIZE, FRAME_OFFSET)
+from .themes import DARK_THEME
+
+# ============================================================================
+# MODEL/VIEW PROJECT TREE
+# ============================================================================
+# Same look and behaviour as VisualTree, but without a widget per node:
+#   TreeNode           NodeData with children: plain Python, one per entity
+#   ProjectTreeModel   QAbstractItemModel over the TreeNodes
+#   NodeDelegate       paints the expander, node frame, buttons and id;
+#                      a QLineEdit only exists while a name is being edited
+#   ModelVisualTree    QTreeView with the connectors, watermark, rubber band
+#                      and context menus of VisualTree
+# TreeNode offers both the QTreeWidgetItem calls (childCount, child, parent...)
+# and the node widget ones (node_frame, properties, set_label...), so
+# ProjectStructureWidget, the property forms and build_plan use it unchanged.
+
+LABEL_HEIGHT = 18
+BUTTON_SPACING = 2
+DELETE_COLOR = "#c62828"
+DELETE_HOVER_COLOR = "#e53935"
+LOADED_FLAGS = Qt.ItemIsEnabled
+EDITABLE_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+
+class TreeNode(NodeData):
+    def __init__(self, node_type="", is_root=False, rules=None, node_id=""):
+        super().__init__(node_type, is_root, rules, node_id)
+        self.expanded = False
+
+        self.children = []
+        self.parent_node = None
+        self.row = 0
+        self.model = None
+
+    # --- Node widget API: NodeData, repainted through the model ---
+    def isVisible(self):
+        return self.model is not None
+
+    def _changed(self):
+        if self.model is not None:
+            self.model.node_changed(self)
+
+    # --- QTreeWidgetItem API ---
+    def childCount(self):
+        return len(self.children)
+
+    def child(self, i):
+        return self.children[i]
+
+    def parent(self):
+        # Top-level nodes hang off the model's invisible root, like QTreeWidgetItem
+        if self.parent_node is None or self.parent_node.parent_node is None:
+            return None
+        return self.parent_node
+
+    def indexOfChild(self, node):
+        return node.row if node.parent_node is self else -1
+
+    def isExpanded(self):
+        return self.expanded
+
+    def setExpanded(self, expanded):
+        if self.model is not None:
+            self.model.set_expanded(self, expanded)
+        else:
+            self.expanded = expanded
+
+    def removeChild(self, node):
+        if self.model is not None:
+            self.model.remove_node(node)
+
+
+class ProjectTreeModel(QtCore.QAbstractItemModel):
+    expansion_requested = Signal(object, bool)  # QModelIndex, expanded
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = TreeNode()
+        self.batching = False
+
+    def index_of(self, node):
+        if node is None or node is self.root or node.model is not self:
+            return QtCore.QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def node_at(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    # --- QAbstractItemModel ---
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        node = self.node_at(parent)
+        if column != 0 or not 0 <= row < len(node.children):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        return self.index_of(index.internalPointer().parent_node)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node_at(parent).children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.label
+        if role == Qt.EditRole:
+            return node.properties.get("name", node.label)
+        if role == Qt.ToolTipRole:
+            return node.tooltip or None
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        node = index.internalPointer()
+        node.properties["name"] = value
+        node.label = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        # Asked for every row on each layout, so the combinations are precomputed
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalPointer().is_loaded:
+            return LOADED_FLAGS
+        return EDITABLE_FLAGS
+
+    # --- Structure ---
+    def begin_batch(self):
+        """Structural changes until end_batch() are reported as a single model reset."""
+        if not self.batching:
+            self.batching = True
+            self.beginResetModel()
+
+    def end_batch(self):
+        if self.batching:
+            self.batching = False
+            self.endResetModel()
+
+    def add_node(self, parent_node, node):
+        parent_node = parent_node or self.root
+        row = len(parent_node.children)
+        if not self.batching:
+            self.beginInsertRows(self.index_of(parent_node), row, row)
+        node.parent_node = parent_node
+        node.row = row
+        node.model = self
+        parent_node.children.append(node)
+        if not self.batching:
+            self.endInsertRows()
+        return node
+
+    def add_nodes(self, parent_node, nodes):
+        """Appends several nodes (with any children they already hold) in one insertion."""
+        parent_node = parent_node or self.root
+        if not nodes:
+            return nodes
+        first = len(parent_node.children)
+        if not self.batching:
+            self.beginInsertRows(self.index_of(parent_node), first, first + len(nodes) - 1)
+        for row, node in enumerate(nodes, first):
+            node.parent_node = parent_node
+            node.row = row
+            parent_node.children.append(node)
+            self._attach(node)
+        if not self.batching:
+            self.endInsertRows()
+        return nodes
+
+    def remove_node(self, node):
+        parent_node = node.parent_node
+        if not self.batching:
+            self.beginRemoveRows(self.index_of(parent_node), node.row, node.row)
+        del parent_node.children[node.row]
+        for row in range(node.row, len(parent_node.children)):
+            parent_node.children[row].row = row
+        if not self.batching:
+            self.endRemoveRows()
+        self._detach(node)
+
+    def clear(self):
+        if not self.batching:
+            self.beginResetModel()
+        for node in self.root.children:
+            self._detach(node)
+        self.root.children = []
+        if not self.batching:
+            self.endResetModel()
+
+    def _attach(self, node):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.model = self
+            for row, child in enumerate(current.children):
+                child.parent_node = current
+                child.row = row
+                stack.append(child)
+
+    def _detach(self, node):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.model = None
+            stack.extend(current.children)
+
+    def node_changed(self, node):
+        if self.batching:
+            return
+        index = self.index_of(node)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def set_expanded(self, node, expanded):
+        # The view keeps 'expanded' in sync, so re-expanding on every child insert is a no-op
+        if node.expanded == expanded:
+            return
+        node.expanded = expanded
+        index = self.index_of(node)
+        if index.isValid() and not self.batching:
+            self.expansion_requested.emit(index, expanded)
+
+
+def node_buttons(node):
+    """(action, text) of the buttons on a node, in NodeFrame's order (hidden ones left out)."""
+    can_add_child = bool(node.rules.get("children"))
+    if node.is_root:
+        return [("add_child", "+")] if can_add_child else []
+    buttons = [("add_sibling", "S")]
+    if can_add_child:
+        buttons.append(("add_child", "+"))
+    if node.rules.get("deletable", True) and node.can_delete:
+        buttons.append(("delete", "x"))
+    return buttons
+
+
+def node_geometry(rect, node):
+    """Rects of a painted node inside its row rect, laid out like HybridNodeContainer."""
+    frame = QtCore.QRect(rect.left() + FRAME_OFFSET, rect.top() + (rect.height() - NODE_HEIGHT) // 2,
+                         NODE_WIDTH, NODE_HEIGHT)
+    expander = QtCore.QRect(rect.left(), frame.top() + (NODE_HEIGHT - EXPANDER_SIZE) // 2,
+                            EXPANDER_SIZE, EXPANDER_SIZE)
+    label = QtCore.QRect(frame.left() + 2, frame.top() + 2, NODE_WIDTH - 4, LABEL_HEIGHT)
+
+    actions = node_buttons(node)
+    width = len(actions) * BTN_SIZE + max(0, len(actions) - 1) * BUTTON_SPACING
+    x = frame.left() + (NODE_WIDTH - width) // 2
+    y = label.bottom() + 2
+    buttons = []
+    for action, text in actions:
+        buttons.append((action, text, QtCore.QRect(x, y, BTN_SIZE, BTN_SIZE)))
+        x += BTN_SIZE + BUTTON_SPACING
+
+    return {"expander": expander, "frame": frame, "label": label, "buttons": buttons}
+
+
+def _pixel_font(size, bold=True):
+    font = QtGui.QFont()
+    font.setPixelSize(size)
+    font.setBold(bold)
+    return font
+
+
+class NodeDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.label_font = _pixel_font(8)
+        self.button_font = _pixel_font(7)
+        self.id_font = _pixel_font(8)
+
+    def sizeHint(self, option, index):
+        return QSize(NODE_WIDTH + 80, ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        node = index.internalPointer()
+        colors = (self.view.current_theme or DARK_THEME).colors
+        geometry = node_geometry(option.rect, node)
+        hover = self.view.hover_pos
+        frame = geometry["frame"]
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Expander
+        expander = geometry["expander"]
+        leaf = not node.children
+        painter.setPen(QColor("#616161"))
+        painter.setBrush(QColor("#1e1e1e" if leaf else "#424242"))
+        painter.drawEllipse(expander.adjusted(0, 0, -1, -1))
+        painter.setPen(QColor("#bdbdbd"))
+        painter.setFont(self.label_font)
+        painter.drawText(expander, Qt.AlignCenter, "•" if leaf else ("▼" if node.expanded else "▶"))
+
+        # Frame
+        if node._is_selected:
+            state = "selected"
+        elif hover is not None and frame.contains(hover):
+            state = "hover"
+        elif node._is_highlighted:
+            state = "match"
+        else:
+            state = "base"
+        bg, border = (self.view.current_theme or DARK_THEME).node_colors(state, node.node_type)
+        painter.setPen(QColor(border))
+        painter.setBrush(QColor(bg))
+        painter.drawRoundedRect(frame.adjusted(0, 0, -1, -1), 4, 4)
+
+        # Name (not drawn under an open editor)
+        if not (option.state & QtWidgets.QStyle.State_Editing):
+            label = geometry["label"]
+            painter.setPen(QColor(colors['node_text']))
+            painter.setFont(self.label_font)
+            text = painter.fontMetrics().elidedText(node.label, Qt.ElideRight, label.width())
+            painter.drawText(label, Qt.AlignCenter, text)
+
+        # Buttons
+        painter.setFont(self.button_font)
+        for action, text, rect in geometry["buttons"]:
+            hovered = hover is not None and rect.contains(hover)
+            if action == "delete":
+                fill = DELETE_HOVER_COLOR if hovered else DELETE_COLOR
+                text_color = "#ffffff"
+            else:
+                fill = colors['node_btn_hover'] if hovered else colors['node_btn_bg']
+                text_color = colors['node_btn_text']
+            painter.setPen(QColor(fill))
+            painter.setBrush(QColor(fill))
+            painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 2, 2)
+            painter.setPen(QColor(text_color))
+            painter.drawText(rect, Qt.AlignCenter, text)
+
+        # Id (boxed: the node stylesheet also frames the id QLabel)
+        if node.node_id:
+            painter.setFont(self.id_font)
+            text = str(node.node_id)
+            width = painter.fontMetrics().horizontalAdvance(text) + 6
+            box = QtCore.QRect(frame.right() - 3 - width, frame.bottom() - 13, width, 11)
+            painter.setPen(QColor(border))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(box, 4, 4)
+            painter.setPen(QColor("#eeeeee"))
+            painter.drawText(box, Qt.AlignCenter, text)
+
+        painter.restore()
+
+    # --- Name editor (created for the node being edited only) ---
+    def createEditor(self, parent, option, index):
+        colors = (self.view.current_theme or DARK_THEME).colors
+        editor = QLineEdit(parent)
+        editor.setFrame(False)
+        editor.setAlignment(Qt.AlignCenter)
+        editor.setStyleSheet(
+            f"QLineEdit {{ background: {colors['bg_input']}; color: {colors['text_main']};"
+            f" border: 1px solid {colors['accent']}; font-weight: bold; font-size: 8px; }}"
+        )
+        return editor
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(node_geometry(option.rect, index.internalPointer())["label"])
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(Qt.EditRole))
+        editor.selectAll()
+
+    def setModelData(self, editor, model, index):
+        text = editor.text().strip()
+        node = index.internalPointer()
+        old_name = node.properties.get("name")
+        if text and text != old_name and model.setData(index, text, Qt.EditRole):
+            self.view.log_requested.emit(f"Updated {old_name} [name]: {old_name} -> {text}", "INFO")
+            self.view.node_renamed.emit(node)
+
+
+class ModelVisualTree(QtWidgets.QTreeView):
+    customItemClicked = Signal(object)
+    selectionRectRequested = Signal(object, object)
+    log_requested = Signal(str, str)
+    viewer_requested = Signal(dict, str) # params, type
+    node_action_requested = Signal(str, object) # action, node
+    node_renamed = Signal(object) # node, after an inline name edit
+
+    def __init__(self):
+        super().__init__()
+        self.watermark_text = "Custom"
+        self.current_theme = None
+        self.hover_pos = None
+        self._hover_index = QtCore.QPersistentModelIndex()
+        self.origin = QtCore.QPoint()
+        self.rubberband = QtWidgets.QRubberBand(QtWidgets.QRubberBand.Rectangle, self)
+
+        self.tree_model = ProjectTreeModel(self)
+        self.setModel(self.tree_model)
+        self.tree_model.expansion_requested.connect(self.setExpanded)
+        self.tree_model.modelReset.connect(self._restore_expanded)
+        self.expanded.connect(lambda index: self._on_expanded(index, True))
+        self.collapsed.connect(lambda index: self._on_expanded(index, False))
+
+        self.connectors = ConnectorCache(self)
+        self.delegate = NodeDelegate(self)
+        self.setItemDelegate(self.delegate)
+
+        self.setUniformRowHeights(True)
+        self.setIndentation(NODE_WIDTH + 20)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.setExpandsOnDoubleClick(False)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self.setRootIsDecorated(False)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.on_context_menu)
+        self.header().hide()
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+
+    def set_theme(self, theme):
+        self.current_theme = theme
+        self.setStyleSheet("""
+            QTreeView {
+                background: transparent;
+                border: none;
+                outline: none;
+            }
+        """)
+        # Nodes and connectors are painted from the theme
+        self.viewport().update()
+
+    # --- QTreeWidget-style API used by ProjectStructureWidget, MainWindow and build_plan ---
+    def add_node(self, parent_item, node_type, is_root=False, rules=None, node_id=""):
+        return self.tree_model.add_node(parent_item, TreeNode(node_type, is_root, rules, node_id))
+
+    def clear(self):
+        self.tree_model.clear()
+
+    def itemWidget(self, item, column):
+        return item
+
+    def invisibleRootItem(self):
+        return self.tree_model.root
+
+    def topLevelItemCount(self):
+        return self.tree_model.root.childCount()
+
+    def topLevelItem(self, i):
+        return self.tree_model.root.child(i)
+
+    def expandItem(self, item):
+        item.setExpanded(True)
+
+    def scrollToItem(self, item, hint=QtWidgets.QAbstractItemView.EnsureVisible):
+        self.scrollTo(self.tree_model.index_of(item), hint)
+
+    def item_for_frame(self, frame):
+        return frame
+
+    def get_all_node_frames(self):
+        frames = []
+        stack = list(reversed(self.tree_model.root.children))
+        while stack:
+            node = stack.pop()
+            frames.append(node)
+            stack.extend(reversed(node.children))
+        return frames
+
+    def frames_in_rect(self, rect):
+        """Nodes whose frame intersects 'rect' (tree coordinates); only visible rows are tested."""
+        rect = rect.translated(-self.viewport().pos())
+        hits = []
+        for index, row_rect in self.visible_rows():
+            node = index.internalPointer()
+            if rect.intersects(node_geometry(row_rect, node)["frame"]):
+                hits.append(node)
+        return hits
+
+    # Export works on the QTreeWidget-style accessors above
+    export_structure_to_json = VisualTree.export_structure_to_json
+    _recursive_serialize = VisualTree._recursive_serialize
+
+    def _on_expanded(self, index, expanded):
+        index.internalPointer().expanded = expanded
+
+    def _restore_expanded(self):
+        """A reset (end of a batch) forgets expansion; re-expand the nodes flagged meanwhile."""
+        stack = list(self.tree_model.root.children)
+        while stack:
+            node = stack.pop()
+            if node.children:
+                if node.expanded:
+                    self.setExpanded(self.tree_model.index_of(node), True)
+                stack.extend(node.children)
+
+    def visible_rows(self):
+        return visible_rows(self)
+
+    def hit_test(self, pos):
+        """(node, part) under 'pos' (viewport coordinates); part is a button action, 'expander', 'frame' or None."""
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None, None
+        node = index.internalPointer()
+        geometry = node_geometry(self.visualRect(index), node)
+        for action, _, rect in geometry["buttons"]:
+            if rect.contains(pos):
+                return node, action
+        if geometry["expander"].contains(pos):
+            return node, "expander"
+        if geometry["frame"].contains(pos):
+            return node, "frame"
+        return node, None
+
+    # --- Mouse ---
+    def mousePressEvent(self, event):
+        pos = event.position().toPoint() if QT_VERSION >= 6 else event.pos()
+        if event.button() == Qt.LeftButton:
+            node, part = self.hit_test(pos)
+            if part == "expander":
+                if node.children:
+                    node.setExpanded(not node.expanded)
+                return
+            if part == "frame":
+                self.customItemClicked.emit(node)
+                return
+            if part:
+                self.node_action_requested.emit(part, node)
+                return
+            self.origin = pos
+            self.rubberband.setGeometry(QtCore.QRect(self.origin, QSize()))
+            self.rubberband.show()
+            return
+        super().mousePressEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        pos = event.position().toPoint() if QT_VERSION >= 6 else event.pos()
+        node, part = self.hit_test(pos)
+        if part == "frame" and not node.is_loaded:
+            self.edit(self.tree_model.index_of(node))
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint() if QT_VERSION >= 6 else event.pos()
+        self.hover_pos = pos
+        index = self.indexAt(pos)
+        if self._hover_index.isValid() and self._hover_index != index:
+            self.update(QtCore.QModelIndex(self._hover_index))
+        self._hover_index = QtCore.QPersistentModelIndex(index)
+        if index.isValid():
+            self.update(index)
+
+        if not self.origin.isNull() and self.rubberband.isVisible():
+            self.rubberband.setGeometry(QtCore.QRect(self.origin, pos).normalized())
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if self.rubberband.isVisible():
+            rect = self.rubberband.geometry()
+            self.rubberband.hide()
+            self.selectionRectRequested.emit(rect, QApplication.keyboardModifiers())
+        super().mouseReleaseEvent(event)
+
+    def leaveEvent(self, event):
+        self.hover_pos = None
+        if self._hover_index.isValid():
+            self.update(QtCore.QModelIndex(self._hover_index))
+        self._hover_index = QtCore.QPersistentModelIndex()
+        super().leaveEvent(event)
+
+    # --- Context menus (same entries as HybridNodeContainer) ---
+    def on_context_menu(self, pos):
+        node, part = self.hit_test(pos)
+        global_pos = self.viewport().mapToGlobal(pos)
+        actions = NodeActions(self, node, node)
+        actions.request_add_bulk.connect(lambda: self.node_action_requested.emit("add_bulk", node))
+        try:
+            if node is not None and part not in (None, "expander"):
+                actions._show_node_context_menu(global_pos)
+            else:
+                actions._show_background_context_menu(global_pos)
+        finally:
+            actions.deleteLater()
+
+    # --- Painting ---
+    def drawBranches(self, painter, rect, index):
+        pass
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+
+        painter = QPainter()
+        if painter.begin(self.viewport()):
+            try:
+                painter.setRenderHint(QPainter.Antialiasing)
+
+                if self.watermark_text:
+                    draw_watermark(painter, self.viewport().rect(), self.watermark_text, self.current_theme)
+
+                line_color = "#546e7a" # Fallback
+                if self.current_theme:
+                    line_color = self.current_theme.colors['border']
+                pen = QPen(QColor(line_color))
+                pen.setWidth(2)
+                pen.setStyle(Qt.SolidLine)
+                painter.setPen(pen)
+
+                self.connectors.paint(painter)
+            finally:
+                painter.end()
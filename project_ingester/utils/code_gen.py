@@ -1,4 +1,5 @@
 import re
+import bisect
 
 def slugify_name(name):
     """
@@ -45,6 +46,118 @@ def generate_project_code(name):
         no_spaces = re.sub(r'\s', '', sanitized)
         return no_spaces[:5].upper()
 
+# Prefixes made only of letters/underscores can be looked up in the
+# leading-letters index; anything else falls back to a regex scan.
+_INDEXABLE_PREFIX = re.compile(r"[^\W\d]*")
+_LEADING_NUMBER = re.compile(r"^(\D*)(\d+)")
+
+class CodeAllocator:
+    """
+    Allocates incremental codes ("ep01", "seq03", ...) from a set of existing codes.
+    
+    Built once per plan: existing codes are indexed up-front into a per-prefix
+    max-number table and a taken-set, so each allocation is O(1) instead of a
+    regex scan over every existing code.
+    
+    existing_codes: iterable of strings like ["seq01", "SEQ02"]
+    padding: zero padding of the number part (default 2 -> "seq03")
+    reserved: optional {prefix: [numbers]} that must never be handed out
+    """
+    def __init__(self, existing_codes=None, padding=2, reserved=None):
+        self.padding = padding
+        self._codes = []
+        self._max = {}        # prefix (lower) -> highest number seen
+        self._scanned = {}    # non-indexable prefix -> highest number seen
+        self._taken = set()   # (prefix, number)
+        self._reserved = {}   # prefix -> sorted list of reserved numbers
+        self._cursor = {}     # prefix -> last number handed out by next_code()
+        
+        for code in existing_codes or []:
+            self.add(code)
+        for prefix, numbers in (reserved or {}).items():
+            self.reserve(prefix, numbers)
+
+    def add(self, code):
+        """Index an existing code (e.g. one created by another process)."""
+        if not code: return
+        self._codes.append(code)
+        self._scanned.clear()
+        
+        match = _LEADING_NUMBER.match(code)
+        if not match: return
+        key = match.group(1).lower()
+        num = int(match.group(2))
+        self._taken.add((key, num))
+        if num > self._max.get(key, 0):
+            self._max[key] = num
+
+    def reserve(self, prefix, numbers):
+        """Mark numbers as unavailable (gaps kept free for later use)."""
+        key = prefix.lower()
+        merged = set(self._reserved.get(key, []))
+        merged.update(int(n) for n in numbers)
+        self._reserved[key] = sorted(merged)
+
+    def is_taken(self, code):
+        match = _LEADING_NUMBER.match(code or "")
+        if not match: return False
+        key, num = match.group(1).lower(), int(match.group(2))
+        return (key, num) in self._taken or self._is_reserved(key, num)
+
+    def _is_reserved(self, key, num):
+        reserved = self._reserved.get(key)
+        if not reserved: return False
+        i = bisect.bisect_left(reserved, num)
+        return i < len(reserved) and reserved[i] == num
+
+    def max_number(self, prefix):
+        """Highest number already used with this prefix (0 if none)."""
+        if _INDEXABLE_PREFIX.fullmatch(prefix):
+            return self._max.get(prefix.lower(), 0)
+        
+        # Same matching rules as the historical regex scan, computed once per prefix
+        if prefix not in self._scanned:
+            pattern = re.compile(rf"^{prefix}(\d+)", re.IGNORECASE)
+            max_num = 0
+            for code in self._codes:
+                match = pattern.search(code)
+                if match:
+                    max_num = max(max_num, int(match.group(1)))
+            self._scanned[prefix] = max_num
+        return self._scanned[prefix]
+
+    def format(self, prefix, number):
+        return f"{prefix}{number:0{self.padding}d}"
+
+    def code_for(self, prefix, offset=0):
+        """
+        The code 'offset' places after the highest existing one, without
+        allocating it. Reserved numbers are skipped.
+        """
+        base = self.max_number(prefix)
+        num = base + 1 + offset
+        reserved = self._reserved.get(prefix.lower())
+        if reserved:
+            # Push past every reserved number between base and num
+            lo = bisect.bisect_right(reserved, base)
+            skipped = 0
+            while True:
+                hits = bisect.bisect_right(reserved, num) - lo
+                if hits == skipped: break
+                num += hits - skipped
+                skipped = hits
+        return self.format(prefix, num)
+
+    def next_code(self, prefix):
+        """Allocate and return the next free code for prefix."""
+        key = prefix.lower()
+        num = max(self.max_number(prefix), self._cursor.get(key, 0)) + 1
+        while self._is_reserved(key, num) or (key, num) in self._taken:
+            num += 1
+        self._cursor[key] = num
+        self._taken.add((key, num))
+        return self.format(prefix, num)
+
 def generate_incremental_code(prefix, existing_codes, current_count=0):
     """
     Find the next available number.
@@ -53,27 +166,10 @@ def generate_incremental_code(prefix, existing_codes, current_count=0):
     current_count: how many we have already planned to create in this session
     
     Returns: string code (e.g. "seq03")
-    """
-    max_num = 0
-    # Match prefix followed by digits (case insensitive)
-    # e.g. prefix="seq", match "seq01", "SEQ03"
-    pattern = re.compile(rf"^{prefix}(\d+)", re.IGNORECASE)
     
-    safe_existing = existing_codes or []
-    
-    for code in safe_existing:
-        if not code: continue
-        match = pattern.search(code)
-        if match:
-            try:
-                num = int(match.group(1))
-                if num > max_num:
-                    max_num = num
-            except ValueError:
-                pass
-                
-    next_num = max_num + 1 + current_count
-    return f"{prefix}{next_num:02d}"
+    For bulk planning build a CodeAllocator once and call code_for() instead.
+    """
+    return CodeAllocator(existing_codes).code_for(prefix, current_count)
 
 def generate_shot_code(sequence_code, shot_number):
     """
@@ -0,0 +1,69 @@
+"""
+Scanner benchmark: counts os.scandir calls and wall time of FolderMapper on a
+generated show, for the serial and the parallel mode.
+
+    python tests/benchmark_scanner.py [sequences] [shots_per_sequence] [latency_ms]
+
+latency_ms adds an artificial delay to every listing to mimic NFS/SMB mounts.
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_ingester.core.scanner import FolderMapper
+from project_ingester.core.scan_cache import ScanCache
+
+def build_show(root, sequences, shots):
+    # Custom template, everything mapped to the project root:
+    # root/EP01/SQ###/SH####, root/SQ###/SH####, root/Characters/Asset###
+    for s in range(sequences):
+        for h in range(shots):
+            os.makedirs(os.path.join(root, "EP01", f"SQ{s:03d}", f"SH{h:04d}"))
+            os.makedirs(os.path.join(root, f"SQ{s + 500:03d}", f"SH{h:04d}"))
+    for a in range(shots):
+        os.makedirs(os.path.join(root, "Characters", f"Asset{a:03d}"))
+
+def count_nodes(node):
+    return 1 + sum(count_nodes(c) for c in node['children'])
+
+def run(mapper, mappings, latency):
+    calls = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        if latency: time.sleep(latency)
+        return real_scandir(path)
+
+    start = time.perf_counter()
+    with patch("project_ingester.core.scanner.os.scandir", side_effect=counting_scandir):
+        result = mapper.scan_structure("Custom", mappings)
+    return result, calls, time.perf_counter() - start
+
+def main():
+    sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 0.0) / 1000.0
+
+    tmp = tempfile.mkdtemp()
+    try:
+        root = os.path.join(tmp, "Show")
+        build_show(root, sequences, shots)
+        mappings = {"project": root, "episode": root, "sequence": root, "asset_type": root}
+
+        # A fresh cache per mode: otherwise the parallel run is served from the serial one's listings
+        for label, workers in (("serial", 1), ("parallel x16", 16)):
+            mapper = FolderMapper(workers=workers, cache=ScanCache())
+            result, calls, elapsed = run(mapper, mappings, latency)
+            print(f"{label:>13}: {len(calls):6d} scandir calls, {len(set(calls)):6d} distinct dirs, "
+                  f"{count_nodes(result):6d} nodes, {elapsed * 1000:8.1f} ms")
+    finally:
+        shutil.rmtree(tmp)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Project tree build benchmark: wall time of populate_from_structure for a show
+with many shots per sequence, batched (batch_insert) against the previous
+node-by-node path (expand, expander icon and sibling buttons after every insert),
+with the number of node widgets each leaves behind (rows off screen keep only
+their NodeData), plus the console cost of logging loaded properties per node
+against once.
+
+    QT_QPA_PLATFORM=offscreen python tests/benchmark_tree_build.py [sequences] [shots_per_sequence] [widgets|model]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_ingester.utils.compat import QApplication
+from project_ingester.ui.tree import ProjectStructureWidget, HybridNodeContainer
+from project_ingester.ui.console import ConsoleWidget
+from project_ingester.ui.themes import DARK_THEME
+
+def build_structure(sequences, shots):
+    return {
+        "type": "project", "name": "bench", "path": "/tmp/bench",
+        "children": [{
+            "type": "sequence", "name": f"SQ{s:03d}",
+            "children": [{"type": "shot", "name": f"SH{h:04d}", "children": []} for h in range(shots)],
+        } for s in range(sequences)],
+    }
+
+def node_by_node(panel, data):
+    """populate_from_structure as it was, without batch_insert."""
+    panel.tree.clear()
+    root_item = panel.add_node(None, data["type"], is_root=True)
+    panel._apply_data_to_node(root_item, data)
+    panel.tree.expandItem(root_item)
+    panel._recursive_populate(root_item, data["children"])
+
+def time_build(app, mode, data, build):
+    panel = ProjectStructureWidget(view_mode=mode)
+    panel.set_theme(DARK_THEME)
+    panel.current_template = "Shots Only"
+    panel.resize(800, 900)
+    panel.show()
+    app.processEvents()
+    start = time.perf_counter()
+    build(panel, data)
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    widgets = len(panel.tree.viewport().findChildren(HybridNodeContainer))
+    panel.close()
+    panel.deleteLater()
+    app.processEvents()
+    return elapsed * 1000, widgets
+
+def time_console(app, lines, per_node):
+    console = ConsoleWidget()
+    start = time.perf_counter()
+    if per_node:
+        for name, props in lines:
+            console.log(name, "DEBUG")
+            console.log(props, "DEBUG")
+    else:
+        console.log("\n".join(f"{name}\n{props}" for name, props in lines), "DEBUG")
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    mode = sys.argv[3] if len(sys.argv) > 3 else "widgets"
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    data = build_structure(sequences, shots)
+    nodes = 1 + sequences * (1 + shots)
+    print(f"{nodes} nodes ({sequences} sequences x {shots} shots), {mode} tree")
+
+    # Warm up styles and fonts so the first timed build does not pay for them
+    time_build(app, mode, build_structure(1, 5), node_by_node)
+
+    legacy, legacy_widgets = time_build(app, mode, data, node_by_node)
+    batched, batched_widgets = time_build(app, mode, data, lambda panel, d: panel.populate_from_structure(d))
+    print(f"{'node by node':>28}: {legacy:9.1f} ms, {legacy_widgets} node widgets")
+    print(f"{'batch_insert':>28}: {batched:9.1f} ms, {batched_widgets} node widgets  ({legacy / batched:.1f}x)")
+
+    lines = [(f"Loading shot: SH{i:04d}", "  name: x\n  code: y\n  frame_in: 1001") for i in range(nodes)]
+    print(f"{'console, 2 logs per node':>28}: {time_console(app, lines, True):9.1f} ms")
+    print(f"{'console, one log':>28}: {time_console(app, lines, False):9.1f} ms")
+
+if __name__ == '__main__':
+    main()
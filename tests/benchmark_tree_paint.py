@@ -0,0 +1,109 @@
+"""
+Project tree paint benchmark: time per frame of the connector and watermark
+passes of VisualTree while scrolling, compared with the previous full-tree walk
+(itemWidget + mapTo + a new QPainterPath for every expanded parent/child pair).
+
+    QT_QPA_PLATFORM=offscreen python tests/benchmark_tree_paint.py [sequences] [shots_per_sequence] [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_ingester.utils.compat import QApplication, QtGui, QtCore, QPainter, QPainterPath, QPoint, Qt
+from project_ingester.ui.tree import ProjectStructureWidget, draw_watermark
+from project_ingester.ui.themes import DARK_THEME
+
+def legacy_connectors(tree, painter):
+    """Connector pass as it was: walks every expanded item, whether on screen or not."""
+    def draw(parent, child):
+        parent_w = tree.itemWidget(parent, 0)
+        child_w = tree.itemWidget(child, 0)
+        if not parent_w or not child_w or not child_w.isVisible():
+            return
+        p_frame = parent_w.node_frame
+        start = p_frame.mapTo(tree.viewport(), QPoint(int(p_frame.width() / 2), p_frame.height()))
+        c_btn = child_w.btn_expand
+        end = c_btn.mapTo(tree.viewport(), QPoint(0, int(c_btn.height() / 2)))
+        dy = end.y() - start.y()
+        dx = end.x() - start.x()
+        path = QPainterPath()
+        path.moveTo(start)
+        path.cubicTo(QPoint(start.x(), start.y() + int(dy * 0.5)), QPoint(end.x() - int(dx * 0.5), end.y()), end)
+        painter.drawPath(path)
+
+    def walk(item):
+        for i in range(item.childCount()):
+            draw(item, item.child(i))
+            if item.isExpanded():
+                walk(item.child(i))
+
+    for i in range(tree.topLevelItemCount()):
+        walk(tree.topLevelItem(i))
+
+def legacy_watermark(tree, painter):
+    painter.save()
+    painter.setFont(QtGui.QFont("Arial", 40, QtGui.QFont.Bold))
+    painter.setPen(QtGui.QColor(255, 255, 255, 20))
+    painter.drawText(tree.viewport().rect(), Qt.AlignCenter, tree.watermark_text.upper())
+    painter.restore()
+
+def time_frames(app, tree, frames, paint):
+    image = QtGui.QImage(tree.viewport().size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    bar = tree.verticalScrollBar()
+    elapsed = 0.0
+    for f in range(frames):
+        bar.setValue(int(bar.maximum() * f / max(1, frames - 1)))
+        app.processEvents()
+        image.fill(0)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        start = time.perf_counter()
+        paint(painter)
+        elapsed += time.perf_counter() - start
+        painter.end()
+    return elapsed / frames * 1000
+
+def main():
+    sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    frames = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    panel = ProjectStructureWidget(view_mode="widgets")
+    panel.set_theme(DARK_THEME)
+    panel.apply_template("Shots Only")
+    root = panel.tree.topLevelItem(0)
+    sequence = root.child(0)
+    for s in range(sequences):
+        if s:
+            sequence = panel.add_node(root, "sequence")
+        while sequence.childCount() < shots:
+            panel.add_node(sequence, "shot")
+    panel.resize(800, 900)
+    panel.show()
+    app.processEvents()
+
+    tree = panel.tree
+    nodes = 1 + sequences * (1 + shots)
+    print(f"{nodes} nodes, {frames} frames, viewport {tree.viewport().width()}x{tree.viewport().height()}")
+
+    results = [
+        ("connectors (full walk)", lambda p: legacy_connectors(tree, p)),
+        ("connectors (culled + cached)", tree.connectors.paint),
+        ("watermark (drawText)", lambda p: legacy_watermark(tree, p)),
+        ("watermark (cached pixmap)", lambda p: draw_watermark(p, tree.viewport().rect(), tree.watermark_text, DARK_THEME)),
+    ]
+    for label, paint in results:
+        print(f"{label:>30}: {time_frames(app, tree, frames, paint):8.3f} ms/frame")
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        tree.viewport().repaint()
+    print(f"{'full repaint':>30}: {(time.perf_counter() - start) / frames * 1000:8.3f} ms/frame")
+    panel.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Project tree search benchmark: per-keystroke lookup time of NodeSearchIndex for
+a show with many shots (names, codes and ids indexed, as ProjectStructureWidget
+does), against scanning every node's terms, which is what walking the tree with
+QTreeWidgetItemIterator costs at best.
+
+    python tests/benchmark_tree_search.py [sequences] [shots_per_sequence]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_ingester.core.search import NodeSearchIndex
+
+KEYSTROKES = ["s", "sh", "sh0", "sh04", "sh042", "sh0420", "h0420", "0420", "sq01", "12::3"]
+
+def build_nodes(sequences, shots):
+    nodes = []
+    for s in range(1, sequences + 1):
+        nodes.append((f"sq{s:03d}", f"seq{s:02d}", str(s)))
+        for h in range(1, shots + 1):
+            nodes.append((f"sh{(s - 1) * shots + h:04d}", f"sh{h:02d}", f"{s}::{h}"))
+    return nodes
+
+def scan(nodes, query):
+    query = query.lower()
+    return [terms for terms in nodes if any(query in t.lower() for t in terms)]
+
+def best_of(runs, fn):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+def main():
+    sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    nodes = build_nodes(sequences, shots)
+    print(f"{len(nodes)} nodes ({sequences} sequences x {shots} shots)")
+
+    index = NodeSearchIndex()
+    start = time.perf_counter()
+    for n, terms in enumerate(nodes):
+        index.add(n, *terms)
+    index.find("warm up")  # sorts the prefix list once
+    print(f"{'index build':>16}: {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    print(f"{'query':>16}  {'index':>9}  {'scan':>9}  matches")
+    for query in KEYSTROKES:
+        indexed = best_of(20, lambda: index.find(query))
+        scanned = best_of(3, lambda: scan(nodes, query))
+        print(f"{query:>16}  {indexed:6.3f} ms  {scanned:6.1f} ms  {len(index.find(query))}")
+
+    start = time.perf_counter()
+    index.add(len(nodes) // 2, "hero", "sh01", "50::1")
+    index.remove(len(nodes) - 1)
+    print(f"{'rename + delete':>16}: {(time.perf_counter() - start) * 1000:9.3f} ms")
+
+if __name__ == '__main__':
+    main()
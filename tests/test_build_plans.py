@@ -0,0 +1,114 @@
+import unittest
+import sys
+import os
+import threading
+from unittest.mock import patch
+
+# Add project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core.setup import ProjectManager, merge_plans
+from project_ingester.core import validator
+from test_plan_io import MockTreeItem, MockTreeWidget, build_tree
+
+class TestBuildPlans(unittest.TestCase):
+    def setUp(self):
+        self.manager = ProjectManager(log_callback=lambda m, l: None)
+
+    @patch("project_ingester.core.setup.gazu")
+    def test_roots_share_project_prefetch(self, mock_gazu):
+        self.manager.connected = True
+        mock_gazu.project.get_project_by_name.return_value = {"id": "p1"}
+        mock_gazu.shot.all_episodes_for_project.return_value = [{"code": "ep01"}]
+        mock_gazu.shot.all_sequences_for_project.return_value = []
+
+        root = build_tree()
+        episode = root.child(0)
+        sequence = episode.child(0)
+        asset_type = root.child(1)
+
+        plan = self.manager.build_plans([episode, asset_type], MockTreeWidget())
+
+        # One pre-fetch for both roots of 'PlanProject'
+        self.assertEqual(mock_gazu.project.get_project_by_name.call_count, 1)
+        self.assertEqual([s["name"] for s in plan], ["Episode 01", "SQ010", "SH010", "SH020", "Characters", "Hero"])
+        self.assertEqual([s["index"] for s in plan], list(range(6)))
+        self.assertEqual([s["parent"] for s in plan], [None, 0, 1, 1, None, 4])
+        # Existing 'ep01' is skipped by the shared allocator
+        self.assertEqual(plan[0]["params"]["code"], "ep02")
+        # Steps keep the real node widgets for the confirmation dialog
+        self.assertIs(plan[1]["widget"], sequence)
+
+        # A root inside another root is not built twice
+        plan = self.manager.build_plans([root, sequence], MockTreeWidget())
+        self.assertEqual(len(plan), 7)
+
+    def test_sibling_roots_share_codes(self):
+        root = build_tree()
+        second = root.addChild(MockTreeItem("episode", "Episode 02"))
+        second.addChild(MockTreeItem("sequence", "SQ020")).addChild(MockTreeItem("shot", "SH010"))
+        first = root.child(0)
+
+        whole = self.manager.build_plan(root, MockTreeWidget())
+        plan = self.manager.build_plans([first, second], MockTreeWidget())
+        codes = lambda steps: [s["params"]["code"] for s in steps if s["type"] in ("episode", "sequence")]
+        self.assertEqual(codes(plan), ["ep01", "seq01", "ep02", "seq01"])
+        self.assertEqual(codes(plan), codes(whole))
+        self.assertEqual(validator.validate_plan(plan), [])
+
+    def test_projects_fetched_concurrently(self):
+        first = build_tree()
+        second = MockTreeItem("project", "OtherProject", {"production_type": "short", "root_path": "Y:/o"})
+        # Each fetch waits for the other one: only passes if they overlap
+        barrier = threading.Barrier(2, timeout=5)
+        def fetch(name):
+            barrier.wait()
+            return {"episodes": [], "sequences": [], "shots": []}
+        with patch.object(self.manager, "fetch_existing_codes", side_effect=fetch) as fetched:
+            plan = self.manager.build_plans([first, second], MockTreeWidget())
+        self.assertEqual(sorted(c.args[0] for c in fetched.call_args_list), ["OtherProject", "PlanProject"])
+        self.assertEqual(len(plan), 8)
+
+    @patch("project_ingester.core.setup.gazu")
+    def test_validation_fetches_every_project(self, mock_gazu):
+        self.manager.connected = True
+        mock_gazu.asset.all_asset_types.return_value = []
+        mock_gazu.project.get_project_by_name.side_effect = lambda name: {"id": name} if name == "OtherProject" else None
+        mock_gazu.shot.all_sequences_for_project.return_value = [{"id": "s1", "name": "SQ100"}]
+        first = build_tree()
+        second = MockTreeItem("project", "OtherProject", {"production_type": "short", "root_path": "Y:/o"})
+        second.addChild(MockTreeItem("sequence", "SQ100"))
+
+        plan = self.manager.build_plans([first, second], MockTreeWidget())
+        problems = self.manager.validate_plan(plan)
+        looked_up = [c.args[0] for c in mock_gazu.project.get_project_by_name.call_args_list]
+        self.assertIn("PlanProject", looked_up)
+        self.assertIn("OtherProject", looked_up)
+        self.assertEqual([(p["name"], p["severity"]) for p in problems], [("SQ100", "WARNING")])
+
+    def test_merged_projects_stay_linked(self):
+        first = build_tree()
+        second = MockTreeItem("project", "OtherProject", {"production_type": "short", "root_path": "Y:/o"})
+        second.addChild(MockTreeItem("sequence", "SQ100")).addChild(MockTreeItem("shot", "SH100"))
+
+        plan = self.manager.build_plans([first, second], MockTreeWidget())
+        self.assertEqual(len(plan), 10)
+        self.assertEqual([s["parent"] for s in plan[7:]], [None, 7, 8])
+        self.assertEqual(validator.validate_plan(plan), [])
+
+        self.assertEqual(merge_plans([]), [])
+
+        # Executed one project at a time
+        with patch("project_ingester.core.setup.gazu") as mock_gazu:
+            mock_gazu.project.get_project_by_name.side_effect = lambda name: {"name": name, "id": name}
+            mock_gazu.shot.new_sequence.side_effect = lambda **kw: {"name": kw["name"], "id": kw["name"]}
+            mock_gazu.shot.all_sequences_for_project.return_value = []
+            self.assertTrue(self.manager.execute_plan(plan))
+            self.assertEqual(mock_gazu.project.get_project_by_name.call_args_list[-1].args, ("OtherProject",))
+            self.assertEqual(mock_gazu.shot.new_shot.call_args.kwargs["sequence"]["id"], "SQ100")
+
+if __name__ == '__main__':
+    unittest.main()
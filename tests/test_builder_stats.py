@@ -0,0 +1,104 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, Qt
+from project_ingester.ui.dialogs_builder import FolderBuilderDialog
+
+def recount(tree):
+    """Full-tree count, for comparison with the incremental counters."""
+    counts = {}
+    unmapped = 0
+    stack = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount())]
+    while stack:
+        item = stack.pop()
+        data = item.data(0, Qt.UserRole) or {}
+        if data.get('node_kind') == 'instance' and data.get('type') != 'project':
+            counts[data['type']] = counts.get(data['type'], 0) + 1
+        elif data.get('node_kind') == 'unmapped_item':
+            unmapped += 1
+        stack.extend(item.child(i) for i in range(item.childCount()))
+    return counts, unmapped
+
+class TestBuilderStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.test_dir, "Show")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _counters(self, dialog):
+        return {t: n for t, n in dialog.instance_counts.items() if n}, dialog.unmapped_count
+
+    def test_cascade_refreshes_stats_once(self):
+        # 30 sequences, each with shots/sh010 and alt/sh020 + alt/sh030
+        for s in range(30):
+            os.makedirs(os.path.join(self.root, f"sq{s:03d}", "shots", "sh010"))
+            os.makedirs(os.path.join(self.root, f"sq{s:03d}", "alt", "sh020"))
+            os.makedirs(os.path.join(self.root, f"sq{s:03d}", "alt", "sh030"))
+
+        dialog = FolderBuilderDialog(streaming=False)
+        dialog.template_combo.setCurrentIndex(dialog.template_combo.findText("Shots Only"))
+        dialog.project_root = self.root
+        dialog.refresh_tree()
+        self.app.processEvents()
+        self.assertEqual(self._counters(dialog), ({"sequence": 30, "shot": 30}, 0))
+
+        # Remapping sq000's shots to 'alt' cascades over the 29 siblings
+        shot_category = dialog.tree.topLevelItem(0).child(0).child(0).child(0)
+        combo = dialog.tree.itemWidget(shot_category, 1)
+        refreshes = []
+        def counting_stats():
+            refreshes.append(1)
+            FolderBuilderDialog.calculate_stats(dialog)
+        dialog.calculate_stats = counting_stats
+        combo.setCurrentIndex(combo.findText("alt"))
+        self.app.processEvents()
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(self._counters(dialog), recount(dialog.tree))
+        self.assertEqual(self._counters(dialog), ({"sequence": 30, "shot": 60}, 0))
+        self.assertIn("Mapped Entities: 90", dialog.log_edit.toPlainText())
+        dialog.reject()
+
+    def test_counters_follow_moves_and_removals(self):
+        for name in ("ep01", "SQ010", "Characters", "misc", "temp"):
+            os.makedirs(os.path.join(self.root, name))
+
+        dialog = FolderBuilderDialog(streaming=False)
+        dialog.template_combo.setCurrentIndex(dialog.template_combo.findText("Custom"))
+        dialog.project_root = self.root
+        dialog.refresh_tree()
+        dialog.wait_for_scan()
+        self.assertEqual(self._counters(dialog), ({"episode": 1, "sequence": 1}, 3))
+
+        root = dialog.tree.topLevelItem(0)
+        unmapped = root.child(0)
+        asset_types = [root.child(i) for i in range(root.childCount()) if root.child(i).text(0) == "Category: asset_type"][0]
+        dialog.move_folder_to_category(unmapped.child(0), asset_types)   # Characters
+        dialog.remove_unmapped_item(unmapped.child(1))                    # temp
+        dialog.wait_for_scan()
+
+        self.assertEqual(self._counters(dialog), recount(dialog.tree))
+        self.assertEqual(self._counters(dialog), ({"episode": 1, "sequence": 1, "asset_type": 1}, 1))
+        self.assertEqual(dialog.status_label.text(), "Unmapped: 1")
+
+        dialog.refresh_tree()
+        dialog.wait_for_scan()
+        self.assertEqual(self._counters(dialog), ({"episode": 1, "sequence": 1}, 3))
+        dialog.reject()
+
+if __name__ == '__main__':
+    unittest.main()
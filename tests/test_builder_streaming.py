@@ -0,0 +1,174 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from unittest.mock import patch
+from project_ingester.utils.compat import QApplication, QComboBox, QMessageBox
+from project_ingester.ui.dialogs_builder import FolderBuilderDialog
+from project_ingester.core.scan_rules import ScanRules
+
+def snapshot(tree):
+    """(text, child snapshots) of every row, ignoring expansion state."""
+    def walk(item):
+        return (item.text(0), [walk(item.child(i)) for i in range(item.childCount())])
+    return [walk(tree.topLevelItem(i)) for i in range(tree.topLevelItemCount())]
+
+class TestBuilderStreaming(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.test_dir, "Show")
+        for s in range(5):
+            for h in range(4):
+                os.makedirs(os.path.join(self.root, f"sq{s:02d}", f"sh{h:03d}"))
+        os.makedirs(os.path.join(self.root, ".git"))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _dialog(self, streaming):
+        dialog = FolderBuilderDialog(streaming=streaming)
+        dialog.template_combo.setCurrentIndex(dialog.template_combo.findText("Shots Only"))
+        dialog.project_root = self.root
+        return dialog
+
+    def test_streamed_rows_match_synchronous_scan(self):
+        sync = self._dialog(streaming=False)
+        sync.refresh_tree()
+
+        dialog = self._dialog(streaming=True)
+        dialog.refresh_tree()
+        # Nothing listed on the GUI thread yet, only the placeholders
+        seq_category = dialog.tree.topLevelItem(0).child(0)
+        self.assertEqual(seq_category.childCount(), 0)
+        self.assertTrue(dialog.cancel_scan_btn.isVisibleTo(dialog))
+
+        self.assertTrue(dialog.wait_for_scan())
+        self.assertEqual(snapshot(dialog.tree), snapshot(sync.tree))
+        self.assertEqual(seq_category.childCount(), 5)
+        self.assertEqual(seq_category.child(0).child(0).childCount(), 4)
+        self.assertEqual(dialog.scanned_folders, 6)
+        self.assertFalse(dialog.cancel_scan_btn.isVisibleTo(dialog))
+        dialog.reject()
+
+    def test_cancel_leaves_rows_usable(self):
+        dialog = self._dialog(streaming=True)
+        dialog.refresh_tree()
+        dialog.cancel_scan()
+
+        self.assertEqual(dialog.pending_listings, {})
+        combo = dialog.tree.itemWidget(dialog.tree.topLevelItem(0).child(0), 1)
+        self.assertIsInstance(combo, QComboBox)
+        self.assertTrue(combo.isEnabled())
+
+        # Late batches from the cancelled scan are ignored
+        dialog.wait_for_scan(timeout=0.2)
+        self.assertEqual(dialog.tree.topLevelItem(0).child(0).childCount(), 0)
+        dialog.reject()
+
+    def test_build_waits_for_complete_scan(self):
+        dialog = self._dialog(streaming=True)
+        dialog.refresh_tree()
+        self.assertFalse(dialog.build_btn.isEnabled())
+        dialog.on_build() # e.g. a shortcut: still refused mid-scan
+        self.assertIsNone(dialog.result_data)
+
+        self.assertTrue(dialog.wait_for_scan())
+        self.assertTrue(dialog.build_btn.isEnabled())
+        dialog.build_btn.click()
+        self.assertEqual(len(dialog.result_data["children"]), 5)
+
+        # After a stopped scan, building needs confirmation
+        dialog = self._dialog(streaming=True)
+        dialog.refresh_tree()
+        dialog.cancel_scan()
+        self.assertTrue(dialog.build_btn.isEnabled())
+        with patch("project_ingester.ui.dialogs_builder.QMessageBox.warning", return_value=QMessageBox.No) as warning:
+            dialog.build_btn.click()
+        self.assertIn("not listed", warning.call_args.args[2])
+        self.assertIsNone(dialog.result_data)
+        dialog.reject()
+
+    def test_sibling_cascade_applied_in_one_pass(self):
+        for s in range(5):
+            os.makedirs(os.path.join(self.root, f"sq{s:02d}", "alt", "sh900"))
+        dialog = self._dialog(streaming=True)
+        dialog.refresh_tree()
+        self.assertTrue(dialog.wait_for_scan())
+        seq_category = dialog.tree.topLevelItem(0).child(0)
+        shots = lambda s: seq_category.child(s).child(0)
+        self.assertEqual(shots(1).childCount(), 5) # Direct Children: 4 shots + 'alt'
+        
+        listed = dialog.scanned_folders
+        combo = dialog.tree.itemWidget(shots(0), 1)
+        combo.setCurrentIndex(combo.findText("alt"))
+        self.assertTrue(dialog.wait_for_scan())
+        self.assertTrue(dialog.cascade_progress.isHidden())
+        
+        for s in range(5):
+            self.assertEqual(dialog.tree.itemWidget(shots(s), 1).currentText(), "alt")
+            self.assertEqual([shots(s).child(i).text(0) for i in range(shots(s).childCount())], ["sh900"])
+        # Only sq00/alt went through the row scanner; siblings came from the cascade's listings
+        self.assertEqual(dialog.scanned_folders, listed + 1)
+        self.assertEqual(dialog.pending_listings, {})
+        dialog.reject()
+
+    def test_stop_cancels_sibling_cascade(self):
+        for s in range(5):
+            os.makedirs(os.path.join(self.root, f"sq{s:02d}", "alt", "sh900"))
+        dialog = self._dialog(streaming=True)
+        dialog.refresh_tree()
+        self.assertTrue(dialog.wait_for_scan())
+        shots = lambda s: dialog.tree.topLevelItem(0).child(0).child(s).child(0)
+        combo = dialog.tree.itemWidget(shots(0), 1)
+        slow_list = lambda worker, path: time.sleep(0.2) or []
+        with patch("project_ingester.ui.dialogs_builder.SiblingPrefetchWorker._list", slow_list):
+            combo.setCurrentIndex(combo.findText("alt"))
+            # sq00/alt is listed first, then the siblings' cascade starts
+            deadline = time.monotonic() + 5
+            while dialog.cascade_worker is None and time.monotonic() < deadline:
+                QApplication.processEvents()
+                time.sleep(0.01)
+            self.assertIsNotNone(dialog.cascade_worker)
+            self.assertTrue(dialog.cancel_scan_btn.isVisibleTo(dialog))
+            self.assertFalse(dialog.build_btn.isEnabled())
+            dialog.cancel_scan_btn.click()
+        self.assertIsNone(dialog.cascade_worker)
+        self.assertFalse(dialog.cancel_scan_btn.isVisibleTo(dialog))
+        self.assertTrue(dialog.build_btn.isEnabled())
+        self.assertEqual(dialog.scan_stopped, 4) # The four siblings were not re-listed
+        self.assertEqual(shots(1).childCount(), 5)
+        dialog.reject()
+
+    def test_scan_rules_match_mapper(self):
+        open(os.path.join(self.root, "sq01", ".noscan"), "w").close()
+        rules = ScanRules(exclude=[".*", "sq03"], stop_markers=[".noscan"])
+        trees = []
+        for streaming in (False, True):
+            dialog = self._dialog(streaming)
+            dialog.scan_rules = rules
+            dialog.refresh_tree()
+            self.assertTrue(dialog.wait_for_scan())
+            trees.append(snapshot(dialog.tree))
+            seq_category = dialog.tree.topLevelItem(0).child(0)
+            names = [seq_category.child(i).text(0) for i in range(seq_category.childCount())]
+            self.assertEqual(names, ["sq00", "sq01", "sq02", "sq04"])
+            self.assertEqual(seq_category.child(0).child(0).childCount(), 4)
+            self.assertEqual(seq_category.child(1).child(0).childCount(), 0)
+            dialog.reject()
+        self.assertEqual(trees[0], trees[1])
+
+if __name__ == '__main__':
+    unittest.main()
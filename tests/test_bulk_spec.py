@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import types
+
+# Add project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core import bulk, validator
+from project_ingester.core.setup import ProjectManager
+from test_plan_io import MockTreeItem, MockTreeWidget
+
+def film_spec():
+    return {
+        "type": "sequence", "count": 12, "pattern": "SQ{n:03d}", "start": 10, "step": 10,
+        "children": [{"type": "shot", "count": 80, "pattern": "{parent}_SH{n:04d}", "start": 10, "step": 10}]
+    }
+
+class TestBulkSpec(unittest.TestCase):
+    def test_spec_helpers(self):
+        spec = bulk.normalize_spec(film_spec())
+        self.assertEqual(bulk.count_nodes(spec), {"sequence": 12, "shot": 960})
+        self.assertEqual(bulk.describe(spec), "12 sequences x 80 shots (960 shots)")
+        self.assertEqual(bulk.short_label(spec), "12×SQ")
+
+        with self.assertRaises(ValueError):
+            bulk.normalize_spec({"type": "shot", "count": 3, "pattern": "SH{missing}"})
+        with self.assertRaises(ValueError):
+            bulk.normalize_spec({"type": "shot", "count": 3, "step": 0})
+
+    def test_structure_is_lazy(self):
+        structure = bulk.iter_structure(bulk.normalize_spec(film_spec()))
+        self.assertIsInstance(structure, types.GeneratorType)
+        first = next(structure)
+        self.assertEqual(first["name"], "SQ010")
+        self.assertIsInstance(first["children"], types.GeneratorType)
+        self.assertEqual(next(first["children"])["name"], "SQ010_SH0010")
+
+    def test_build_plan_expands_block(self):
+        root = MockTreeItem("project", "BulkProject", {"production_type": "movie", "root_path": "X:/p"})
+        root.addChild(MockTreeItem("sequence", "12×SQ", {"bulk_spec": film_spec()}))
+
+        manager = ProjectManager(log_callback=lambda m, l: None)
+        plan = manager.build_plan(root, MockTreeWidget())
+
+        self.assertEqual(len(plan), 1 + 12 + 960)
+        seq, shot = plan[1], plan[2]
+        self.assertEqual((seq["name"], seq["parent"], seq["role"]), ("SQ010", 0, "Bulk"))
+        self.assertIsNone(seq["widget"])
+        self.assertEqual((shot["name"], shot["parent"]), ("SQ010_SH0010", 1))
+        self.assertEqual(plan[-1]["name"], "SQ120_SH0800")
+        self.assertTrue(plan[2]["params"]["data"]["shot_path"].startswith(seq["params"]["data"]["sequence_path"]))
+
+        # Codes are allocated per sequence exactly like hand-made nodes
+        self.assertEqual(validator.validate_plan(plan), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,6 +36,32 @@ class TestCodeGen(unittest.TestCase):
         existing_caps = ["SEQ01", "SEQ02"]
         self.assertEqual(code_gen.generate_incremental_code("seq", existing_caps, 0), "seq03")
 
+    def test_code_allocator_matches_incremental(self):
+        import re
+        existing = ["seq01", "SEQ07", "seq03_sh01", "ep02", "seqx", "", None, "xseq09"]
+        allocator = code_gen.CodeAllocator(existing)
+
+        # Reference: the original per-call regex scan
+        def reference(prefix, count):
+            pattern = re.compile(rf"^{prefix}(\d+)", re.IGNORECASE)
+            nums = [int(m.group(1)) for m in (pattern.search(c) for c in existing if c) if m]
+            return f"{prefix}{max(nums + [0]) + 1 + count:02d}"
+
+        for prefix in ["seq", "ep", "sh", "SEQ"]:
+            for count in range(5):
+                self.assertEqual(allocator.code_for(prefix, count), reference(prefix, count))
+
+    def test_code_allocator_reserved_and_padding(self):
+        allocator = code_gen.CodeAllocator(["ep01", "ep02"], padding=3, reserved={"ep": [3, 5]})
+        self.assertEqual(allocator.code_for("ep", 0), "ep004")
+        self.assertEqual(allocator.code_for("ep", 1), "ep006")
+
+        self.assertEqual(allocator.next_code("ep"), "ep004")
+        self.assertEqual(allocator.next_code("ep"), "ep006")
+        self.assertTrue(allocator.is_taken("EP006"))
+        self.assertTrue(allocator.is_taken("ep005"))
+        self.assertFalse(allocator.is_taken("ep007"))
+
     def test_shot_code(self):
         self.assertEqual(code_gen.generate_shot_code("seq01", 1), "seq01_sh01")
         self.assertEqual(code_gen.generate_shot_code("seq03", 10), "seq03_sh10")
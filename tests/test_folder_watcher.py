@@ -0,0 +1,159 @@
+import unittest
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core.watcher import FolderWatcher, coalesce, CREATED, DELETED, RESCAN, _PollingBackend, \
+    _InotifyBackend, _EVENT_HEADER, _IN_Q_OVERFLOW
+from project_ingester.utils.compat import QApplication
+from project_ingester.ui.dialogs_builder import FolderBuilderDialog
+
+class TestFolderWatcher(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_dir, "sq010"))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_coalesce(self):
+        events = [(CREATED, "/a"), (CREATED, "/tmp"), (DELETED, "/tmp"), (DELETED, "/b"), (CREATED, "/b")]
+        self.assertEqual(coalesce(events), [(CREATED, "/a"), (DELETED, "/b"), (CREATED, "/b")])
+        self.assertEqual(coalesce(events + [(RESCAN, None), (CREATED, "/c")]), [(RESCAN, None)])
+
+    def test_polling_keeps_its_interval(self):
+        watcher = FolderWatcher(lambda events: None, backend="poll", debounce=0.05, poll_interval=0.5)
+        watcher.watch(self.test_dir, ["sq010"])
+        with patch("project_ingester.core.watcher.os.stat", wraps=os.stat) as stat:
+            watcher.start()
+            time.sleep(1.2)
+            watcher.stop()
+        polls = sum(1 for call in stat.call_args_list if call.args[0] == self.test_dir)
+        self.assertIn(polls, (2, 3)) # At 0, 0.5 and maybe 1.0s; not every 0.2s
+
+    def test_inotify_overflow_asks_for_rescan(self):
+        backend = _InotifyBackend.__new__(_InotifyBackend)
+        backend.paths, backend.wds, backend.lock = {}, {}, threading.Lock()
+        backend.fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, _EVENT_HEADER.pack(-1, _IN_Q_OVERFLOW, 0, 0))
+            self.assertEqual(backend.read(1), [(RESCAN, None)])
+        finally:
+            os.close(write_fd)
+            backend.close()
+
+    def test_polling_trusts_known_names(self):
+        os.makedirs(os.path.join(self.test_dir, "other"))
+        old = time.time() - 60
+        os.utime(self.test_dir, (old, old))
+        backend = _PollingBackend(interval=0)
+        backend.add(self.test_dir, ["sq010"])  # 'other' left out on purpose: not re-listed
+        self.assertEqual(backend.read(0), [])
+        os.makedirs(os.path.join(self.test_dir, "sq020"))
+        self.assertEqual(backend.read(0), [(CREATED, os.path.join(self.test_dir, "other")),
+                                           (CREATED, os.path.join(self.test_dir, "sq020"))])
+
+    def _collect(self, backend):
+        batches = []
+        delivered = threading.Event()
+        def on_changes(events):
+            batches.append(events)
+            delivered.set()
+
+        watcher = FolderWatcher(on_changes, backend=backend, debounce=0.1, poll_interval=0.05)
+        watcher.watch(self.test_dir, ["sq010"])
+        watcher.start()
+        try:
+            time.sleep(0.2)
+            os.makedirs(os.path.join(self.test_dir, "sq020"))
+            os.rename(os.path.join(self.test_dir, "sq010"), os.path.join(self.test_dir, "sq011"))
+            os.makedirs(os.path.join(self.test_dir, "tmp"))
+            os.rmdir(os.path.join(self.test_dir, "tmp"))
+            open(os.path.join(self.test_dir, "notes.txt"), "w").close()
+            self.assertTrue(delivered.wait(5))
+            time.sleep(0.3)
+        finally:
+            watcher.stop()
+        return watcher, batches
+
+    def test_backends_report_net_folder_changes(self):
+        for backend in ("poll", "auto"):
+            watcher, batches = self._collect(backend)
+            self.assertEqual(len(batches), 1) # Debounced into one batch
+            self.assertEqual(sorted(batches[0]), [
+                (CREATED, os.path.join(self.test_dir, "sq011")),
+                (CREATED, os.path.join(self.test_dir, "sq020")),
+                (DELETED, os.path.join(self.test_dir, "sq010")),
+            ], watcher.backend_name)
+            for name in ("sq011", "sq020"):
+                os.rmdir(os.path.join(self.test_dir, name))
+            os.makedirs(os.path.join(self.test_dir, "sq010"))
+            os.remove(os.path.join(self.test_dir, "notes.txt"))
+
+class TestBuilderWatching(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.test_dir, "Show")
+        for s in range(2):
+            os.makedirs(os.path.join(self.root, f"sq{s:02d}", "sh010"))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _wait(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.02)
+        return condition()
+
+    def test_changes_applied_without_rescan(self):
+        dialog = FolderBuilderDialog()
+        dialog.template_combo.setCurrentIndex(dialog.template_combo.findText("Shots Only"))
+        dialog.project_root = self.root
+        dialog.refresh_tree()
+        self.assertTrue(dialog.wait_for_scan())
+        dialog.watch_check.setChecked(True)
+        scanned = dialog.scanned_folders
+
+        seq_category = dialog.tree.topLevelItem(0).child(0)
+        names = lambda: [seq_category.child(i).text(0) for i in range(seq_category.childCount())]
+        self.assertEqual(names(), ["sq00", "sq01"])
+
+        os.makedirs(os.path.join(self.root, "sq02"))
+        shutil.rmtree(os.path.join(self.root, "sq00"))
+        self.assertTrue(self._wait(lambda: names() == ["sq01", "sq02"]), names())
+        # Only the new folder was listed
+        self.assertTrue(dialog.wait_for_scan())
+        self.assertEqual(dialog.scanned_folders, scanned + 1)
+
+        # New shot inside the new sequence (watched once listed)
+        os.makedirs(os.path.join(self.root, "sq02", "sh020"))
+        shots = seq_category.child(1).child(0)
+        self.assertTrue(self._wait(lambda: shots.childCount() == 1))
+        self.assertEqual(shots.child(0).text(0), "sh020")
+
+        # Lost events (inotify overflow): the watched folders are listed again
+        os.makedirs(os.path.join(self.root, "sq03"))
+        shutil.rmtree(os.path.join(self.root, "sq01"))
+        dialog.on_folder_changes([(RESCAN, None)])
+        self.assertEqual(names(), ["sq02", "sq03"])
+        dialog.reject()
+        self.assertIsNone(dialog.watcher)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core.setup import ProjectManager
+from project_ingester.core import materialize, plan_io
+from project_ingester.utils.compat import QApplication
+from project_ingester.ui.dialogs import GenerationSummaryDialog
+from test_plan_io import MockTreeWidget, build_tree
+
+class TestMaterialize(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root_path = os.path.join(self.tmp, "projects").replace("\\", "/")
+        self.manager = ProjectManager(log_callback=lambda m, l: None)
+        tree = build_tree()
+        tree.node_frame.properties["root_path"] = self.root_path
+        self.plan = self.manager.build_plan(tree, MockTreeWidget())
+        self.project = self.plan[0]["params"]["data"]["project_path"]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_collect_expands_templates(self):
+        folders = materialize.collect_directories(self.plan, task_types=["anim"])
+        rel = {os.path.relpath(f, self.project).replace("\\", "/") for f in folders if f.startswith(self.project + "/")}
+
+        # Literal parts of the project tree, entity paths and task folders
+        self.assertIn("shared/lut", rel)
+        self.assertIn("assets", rel)
+        self.assertIn("episode 01/sq010/sh010/compositing/publish", rel) # shot steps list their tasks
+        self.assertIn("assets/characters/hero/anim/work", rel)
+        # Entity placeholders are never created literally
+        self.assertFalse([f for f in folders if "{" in f])
+        # Deduplicated, parents first
+        self.assertEqual(len(folders), len(set(folders)))
+        self.assertLess(folders.index(self.project), folders.index(self.project + "/shared"))
+
+    def test_dry_run_then_create_is_idempotent(self):
+        folders = materialize.collect_directories(self.plan, task_types=[])
+
+        dry = materialize.materialize(folders, dry_run=True)
+        self.assertEqual(dry["created"], folders)
+        self.assertFalse(os.path.exists(self.root_path))
+
+        report = materialize.materialize(folders, workers=4)
+        self.assertEqual(sorted(report["created"]), sorted(folders))
+        self.assertEqual(report["failed"], [])
+        self.assertTrue(all(os.path.isdir(f) for f in folders))
+
+        again = materialize.materialize(folders, workers=4)
+        self.assertEqual(again["created"], [])
+        self.assertEqual(again["existing"], len(folders))
+        self.assertIn(f"{len(folders)} already existed", materialize.format_summary(again))
+
+    def test_manager_from_plan_file(self):
+        path = os.path.join(self.tmp, "plan.jsonl")
+        plan_io.write_plan(self.plan, path)
+        # A file where a folder should go is reported, not fatal
+        os.makedirs(self.project)
+        open(os.path.join(self.project, "shared"), "w").close()
+
+        report = self.manager.materialize_folders(path)
+        failed = [p for p, _ in report["failed"]]
+        self.assertEqual(failed[0], self.project + "/shared")
+        self.assertTrue(all(p.startswith(self.project + "/shared") for p in failed))
+        self.assertTrue(os.path.isdir(os.path.join(self.project, "episode 01", "sq010", "sh020")))
+
+    def test_plan_dialog_creates_folders(self):
+        app = QApplication.instance() or QApplication(sys.argv)
+        dialog = GenerationSummaryDialog(self.plan, manager=self.manager)
+        dialog.btn_folders.click()
+        self.assertTrue(os.path.isdir(os.path.join(self.project, "episode 01", "sq010", "sh020")))
+        self.assertIn("created", dialog.status_label.text())
+        self.assertTrue(dialog.btn_folders.isEnabled())
+        dialog.reject()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+import os
+import sys
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, QLineEdit, QtCore, QtGui, Qt
+from project_ingester.ui.tree import ProjectStructureWidget
+from project_ingester.ui.tree_model import TreeNode, node_geometry
+from project_ingester.ui.themes import DARK_THEME
+from project_ingester.core.setup import ProjectManager
+
+def click(tree, pos, double=False):
+    event_type = QtCore.QEvent.MouseButtonDblClick if double else QtCore.QEvent.MouseButtonPress
+    event = QtGui.QMouseEvent(event_type, QtCore.QPointF(pos), QtCore.QPointF(tree.viewport().mapToGlobal(pos)),
+                              Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+    if double:
+        tree.mouseDoubleClickEvent(event)
+    else:
+        tree.mousePressEvent(event)
+
+class TestModelTree(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def build(self, mode):
+        panel = ProjectStructureWidget(view_mode=mode)
+        panel.set_theme(DARK_THEME)
+        panel.apply_template("TV Show")
+        sequence = panel.tree.topLevelItem(0).child(0).child(0)
+        for _ in range(3):
+            panel.add_node(sequence, "shot")
+        panel.on_delete_node(sequence.child(3))
+        return panel, sequence
+
+    def test_same_structure_and_plan_as_widget_tree(self):
+        manager = ProjectManager(log_callback=lambda m, l: None)
+        plans = {}
+        for mode in ("widgets", "model"):
+            panel, sequence = self.build(mode)
+            root = panel.tree.topLevelItem(0)
+            plan = manager.build_plans([root], panel.tree)
+            plans[mode] = [(s["type"], s["name"], s["params"].get("code"), s["parent"]) for s in plan]
+
+            # Only the last sibling can be deleted
+            frames = [panel.tree.itemWidget(sequence.child(i), 0).node_frame for i in range(sequence.childCount())]
+            if mode == "model":
+                self.assertEqual([f.can_delete for f in frames], [False, False, True])
+            else:
+                self.assertEqual([f.btn_del.isVisibleTo(f) for f in frames], [False, False, True])
+        self.assertEqual(plans["model"], plans["widgets"])
+
+    def test_painted_nodes_handle_clicks_and_editing(self):
+        panel, sequence = self.build("model")
+        panel.resize(600, 900)
+        panel.show()
+        self.app.processEvents()
+        tree = panel.tree
+        shot = sequence.child(0)
+        geometry = node_geometry(tree.visualRect(tree.tree_model.index_of(shot)), shot)
+
+        # Click on the frame selects, the "S" button adds a sibling
+        click(tree, geometry["label"].center())
+        self.assertEqual(panel.selected_nodes, [shot])
+        self.assertTrue(shot._is_selected)
+        sibling_button = [rect for action, _, rect in geometry["buttons"] if action == "add_sibling"][0]
+        click(tree, sibling_button.center())
+        self.assertEqual(sequence.childCount(), 4)
+        self.assertEqual(sequence.child(3).properties["name"], "SH004")
+
+        # Collapse through the expander
+        seq_geometry = node_geometry(tree.visualRect(tree.tree_model.index_of(sequence)), sequence)
+        click(tree, seq_geometry["expander"].center())
+        self.assertFalse(tree.isExpanded(tree.tree_model.index_of(sequence)))
+        self.assertFalse(sequence.isExpanded())
+        sequence.setExpanded(True)
+        self.assertTrue(tree.isExpanded(tree.tree_model.index_of(sequence)))
+
+        # Double click opens an editor for that node only
+        click(tree, geometry["label"].center(), double=True)
+        editors = tree.viewport().findChildren(QLineEdit)
+        self.assertEqual(len(editors), 1)
+        editors[0].setText("SH_hero")
+        tree.delegate.setModelData(editors[0], tree.tree_model, tree.tree_model.index_of(shot))
+        self.assertEqual(shot.properties["name"], "SH_hero")
+        self.assertEqual(shot.label, "SH_hero")
+
+        # Rubber band hit testing works on the painted frames
+        hits = tree.frames_in_rect(QtCore.QRect(tree.viewport().pos(), tree.viewport().size()))
+        self.assertIn(shot, hits)
+        panel.close()
+
+    def test_large_model_builds_without_widgets(self):
+        panel = ProjectStructureWidget(view_mode="model")
+        panel.apply_template("Shots Only")
+        tree = panel.tree
+        root = tree.topLevelItem(0)
+        sequences = []
+        for s in range(50):
+            sequence = TreeNode("sequence", node_id=str(s + 1))
+            sequence.children = [TreeNode("shot", node_id=f"{s + 1}::{i + 1}") for i in range(1000)]
+            sequences.append(sequence)
+        tree.tree_model.add_nodes(root, sequences)
+        self.assertIs(sequences[3].child(5).parent(), sequences[3])
+        self.assertEqual(sequences[3].indexOfChild(sequences[3].child(5)), 5)
+        tree.expandAll()
+        panel.resize(600, 900)
+        panel.show()
+        self.app.processEvents()
+        tree.viewport().repaint()
+
+        self.assertGreater(len(tree.get_all_node_frames()), 50000)
+        # Only rows on screen are touched when painting or hit testing
+        visible = list(tree.visible_rows())
+        self.assertLess(len(visible), 30)
+        self.assertFalse(tree.viewport().findChildren(QLineEdit))
+        panel.close()
+
+if __name__ == '__main__':
+    unittest.main()
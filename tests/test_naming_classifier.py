@@ -0,0 +1,92 @@
+import unittest
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core.naming import NameClassifier
+from project_ingester.data.rules import ENTITY_NAME_PATTERNS
+from project_ingester.utils.compat import QApplication
+from project_ingester.ui.dialogs_builder import FolderBuilderDialog
+
+class TestNameClassifier(unittest.TestCase):
+    def test_classify(self):
+        classifier = NameClassifier(ENTITY_NAME_PATTERNS)
+        self.assertEqual(classifier.classify("EP01"), "episode")
+        self.assertEqual(classifier.classify("episode_12"), "episode")
+        self.assertEqual(classifier.classify("sq010"), "sequence")
+        self.assertEqual(classifier.classify("Seq-020"), "sequence")
+        self.assertEqual(classifier.classify("SH0010"), "shot")
+        self.assertIsNone(classifier.classify("Characters"))
+        self.assertIsNone(classifier.classify("shots"))
+        self.assertIsNone(NameClassifier({}).classify("EP01"))
+
+    def test_first_type_wins(self):
+        classifier = NameClassifier({"sequence": r"^s\d+", "shot": r"^sh?\d+"})
+        self.assertEqual(classifier.classify("s01"), "sequence")
+        self.assertEqual(classifier.classify("sh01"), "shot")
+
+    def test_split_large_batch(self):
+        listing = []
+        for i in range(10000):
+            name = ("ep%03d", "SQ%04d", "Prop%d")[i % 3] % i
+            listing.append((name, "/show/" + name))
+
+        classifier = NameClassifier(ENTITY_NAME_PATTERNS)
+        start = time.perf_counter()
+        mapped, leftovers = classifier.split(listing)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+        self.assertEqual(len(mapped["episode"]), 3334)
+        self.assertEqual(len(mapped["sequence"]), 3333)
+        self.assertEqual(len(leftovers), 3333)
+        self.assertEqual(mapped["sequence"][0], ("SQ0001", "/show/SQ0001"))
+
+class TestBuilderAutoMap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.test_dir, "Show")
+        for name in ("ep01", "ep02", "SQ010", "Characters", "misc"):
+            os.makedirs(os.path.join(self.root, name))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _rows(self, item):
+        return [item.child(i).text(0) for i in range(item.childCount())]
+
+    def test_root_folders_auto_mapped(self):
+        for streaming in (False, True):
+            dialog = FolderBuilderDialog(streaming=streaming)
+            dialog.template_combo.setCurrentIndex(dialog.template_combo.findText("Custom"))
+            dialog.project_root = self.root
+            dialog.refresh_tree()
+            self.assertTrue(dialog.wait_for_scan())
+
+            root = dialog.tree.topLevelItem(0)
+            categories = {root.child(i).text(0): root.child(i) for i in range(1, root.childCount())}
+            self.assertEqual(self._rows(root.child(0)), ["Characters", "misc"])
+            self.assertEqual(self._rows(categories["Category: episode"]), ["ep01", "ep02"])
+            self.assertEqual(self._rows(categories["Category: sequence"]), ["SQ010"])
+            self.assertEqual(self._rows(categories["Category: asset_type"]), [])
+            self.assertEqual(dialog.status_label.text(), "Unmapped: 2")
+
+            # Turning it off puts everything back to Unmapped
+            dialog.auto_map_check.setChecked(False)
+            self.assertTrue(dialog.wait_for_scan())
+            self.assertEqual(dialog.tree.topLevelItem(0).child(0).childCount(), 5)
+            dialog.reject()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+# Add project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core.setup import ProjectManager
+from project_ingester.core import plan_io
+
+class MockNodeFrame:
+    def __init__(self, node_type, name, properties=None):
+        self.node_type = node_type
+        self.properties = properties or {}
+        self.properties["name"] = name
+
+class MockTreeItem:
+    def __init__(self, node_type, name, properties=None):
+        self.node_frame = MockNodeFrame(node_type, name, properties)
+        self.item = self
+        self.children = []
+        self.parent_item = None
+
+    def addChild(self, item):
+        self.children.append(item)
+        item.parent_item = self
+        return item
+
+    def childCount(self):
+        return len(self.children)
+
+    def child(self, i):
+        return self.children[i]
+
+    def parent(self):
+        return self.parent_item
+
+class MockTreeWidget:
+    def itemWidget(self, item, column):
+        return item
+
+def build_tree():
+    root = MockTreeItem("project", "PlanProject", {"production_type": "tv", "root_path": "X:/p"})
+    ep = root.addChild(MockTreeItem("episode", "Episode 01"))
+    seq = ep.addChild(MockTreeItem("sequence", "SQ010"))
+    seq.addChild(MockTreeItem("shot", "SH010"))
+    seq.addChild(MockTreeItem("shot", "SH020"))
+    at = root.addChild(MockTreeItem("asset_type", "Characters"))
+    at.addChild(MockTreeItem("asset", "Hero"))
+    return root
+
+class TestPlanIO(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "plan.jsonl")
+        self.manager = ProjectManager(log_callback=lambda m, l: None)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmp)
+
+    def test_stream_roundtrip(self):
+        tree = MockTreeWidget()
+        memory_plan = self.manager.build_plan(build_tree(), tree)
+
+        with plan_io.PlanWriter(self.path) as writer:
+            self.manager.build_plan(build_tree(), tree, sink=writer)
+        self.assertEqual(len(writer), len(memory_plan))
+
+        steps = plan_io.read_plan(self.path)
+        self.assertEqual([s["name"] for s in steps], [s["name"] for s in memory_plan])
+        self.assertEqual([s["parent"] for s in steps], [None, 0, 1, 2, 2, 0, 5])
+        self.assertNotIn("widget", steps[0])
+        self.assertEqual(steps[2]["params"]["code"], memory_plan[2]["params"]["code"])
+
+        # write_plan resolves parents for plans built without indexes
+        for step in memory_plan:
+            step.pop("index"); step.pop("parent")
+        plan_io.write_plan(memory_plan, self.path)
+        self.assertEqual([s["parent"] for s in plan_io.iter_plan(self.path)], [None, 0, 1, 2, 2, 0, 5])
+
+    def test_rejects_foreign_file(self):
+        with open(self.path, "w") as f:
+            f.write('{"hello": 1}\n')
+        with self.assertRaises(ValueError):
+            plan_io.read_plan(self.path)
+
+    @patch("project_ingester.core.setup.gazu")
+    def test_execute_from_file(self, mock_gazu):
+        with plan_io.PlanWriter(self.path) as writer:
+            self.manager.build_plan(build_tree(), MockTreeWidget(), sink=writer)
+
+        mock_gazu.project.get_project_by_name.return_value = {"name": "PlanProject", "id": "p1", "production_type": "tv_show"}
+        mock_gazu.shot.new_episode.side_effect = lambda **kw: {"name": kw["name"], "id": "e1"}
+        mock_gazu.shot.new_sequence.side_effect = lambda **kw: {"name": kw["name"], "id": "s1"}
+        mock_gazu.shot.new_shot.side_effect = lambda **kw: {"name": kw["name"]}
+        mock_gazu.asset.new_asset.side_effect = lambda **kw: {"name": kw["name"]}
+        mock_gazu.asset.get_asset_type_by_name.return_value = {"name": "Characters", "id": "at1"}
+        mock_gazu.shot.all_sequences_for_project.return_value = []
+
+        self.assertTrue(self.manager.execute_plan(self.path))
+
+        seq_call = mock_gazu.shot.new_sequence.call_args.kwargs
+        self.assertEqual(seq_call["episode"]["id"], "e1")
+        self.assertEqual(mock_gazu.shot.new_shot.call_count, 2)
+        self.assertEqual(mock_gazu.shot.new_shot.call_args.kwargs["sequence"]["id"], "s1")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+
+# Add project root to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.core import validator
+
+def step(index, parent, node_type, name, code=None, data=None):
+    params = {"name": name}
+    if code: params["code"] = code
+    if data: params["data"] = data
+    return {"index": index, "parent": parent, "type": node_type, "name": name, "params": params}
+
+class TestPlanValidator(unittest.TestCase):
+    def test_clean_plan(self):
+        plan = [
+            step(0, None, "project", "Proj", "PRO"),
+            step(1, 0, "sequence", "SQ010", "seq01"),
+            step(2, 1, "shot", "SH010", "sq010_sh01"),
+            step(3, 1, "shot", "SH020", "sq010_sh02"),
+            step(4, 0, "asset_type", "Characters"),
+            step(5, 4, "asset", "Hero", "characters_hero", {"asset_type": "characters"}),
+        ]
+        self.assertEqual(validator.validate_plan(plan), [])
+
+    def test_reports_all_problems_at_once(self):
+        plan = [
+            step(0, None, "project", "Proj", "PRO"),
+            step(1, 0, "sequence", "SQ010", "seq01"),
+            step(2, 1, "shot", "SH010", "sq010_sh01"),
+            step(3, 1, "shot", "sh010", "sq010_sh01"),        # duplicate name + code
+            step(4, 0, "shot", "SH030", "x_sh01"),            # no sequence parent
+            step(5, 0, "asset", "Hero", "props_hero", {"asset_type": "props"}),  # unresolved type
+        ]
+        problems = validator.validate_plan(plan)
+        messages = [(p["index"], p["message"]) for p in problems]
+
+        self.assertTrue(validator.has_errors(problems))
+        self.assertIn((3, "Duplicate shot name 'sh010' (also step 2)."), messages)
+        self.assertIn((3, "Code 'sq010_sh01' collides with step 2."), messages)
+        self.assertIn((4, "shot needs a sequence parent."), messages)
+        self.assertIn((5, "Asset type 'props' cannot be resolved."), messages)
+
+        # Same name under a different parent is fine
+        plan.append(step(6, 0, "sequence", "SQ020", "seq02"))
+        plan.append(step(7, 6, "shot", "SH010", "sq020_sh01"))
+        self.assertFalse([p for p in validator.validate_plan(plan) if p["index"] == 7])
+
+    def test_existing_server_names(self):
+        existing = validator.existing_names_from_entities(
+            sequences=[{"id": "s1", "name": "SQ010"}],
+            shots=[{"id": "h1", "name": "SH010", "parent_id": "s1"}],
+            asset_types=[{"id": "t1", "name": "Props"}],
+        )
+        plan = [
+            step(0, None, "project", "Proj", "PRO"),
+            step(1, 0, "sequence", "SQ010", "seq02"),
+            step(2, 1, "shot", "SH010", "sq010_sh01"),
+            step(3, 0, "asset", "Lamp", "props_lamp", {"asset_type": "props"}),
+        ]
+        problems = validator.validate_plan(plan, existing)
+        self.assertFalse(validator.has_errors(problems))
+        self.assertEqual([p["index"] for p in problems], [1, 2])
+
+    def test_episodes_matched_by_server_name(self):
+        # execute_plan names episodes after their code: 'Episode 01' -> 'EP01'
+        existing = validator.existing_names_from_entities(
+            episodes=[{"id": "e1", "name": "EP01"}],
+            sequences=[{"id": "s1", "name": "SQ010", "parent_id": "e1"}],
+        )
+        plan = [
+            step(0, None, "project", "Proj", "PRO"),
+            step(1, 0, "episode", "Episode 01", "ep01"),
+            step(2, 1, "sequence", "SQ010", "seq01"),
+            step(3, 0, "episode", "Episode 02", "ep02"),
+            step(4, 3, "sequence", "SQ010", "seq01"),
+        ]
+        problems = validator.validate_plan(plan, existing)
+        self.assertEqual([(p["index"], p["severity"]) for p in problems], [(1, "WARNING"), (2, "WARNING")])
+        self.assertIn("'EP01'", problems[0]["message"])
+
+        # Merged plans: each project's steps are checked against its own entities
+        other = [step(5, None, "project", "Other", "OTH"),
+                 step(6, 5, "episode", "Episode 01", "ep01"),
+                 step(7, 6, "sequence", "SQ010", "seq01")]
+        problems = validator.validate_plan(plan + other, existing_by_project={0: {}, 5: existing})
+        self.assertEqual([p["index"] for p in problems], [6, 7])
+
+if __name__ == '__main__':
+    unittest.main()
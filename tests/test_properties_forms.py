@@ -0,0 +1,119 @@
+import unittest
+import os
+import sys
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, Qt, QtCore, QtGui
+from project_ingester.config import PROPERTIES_MAX_TABS
+from project_ingester.ui.properties import PropertiesWidget
+from project_ingester.ui.forms import MultiEditForm, ShotForm, ProjectForm
+from project_ingester.ui.tree import NodeData
+
+def type_keys(widget, text, key=None):
+    """Sends key presses as if typed (text), or a single 'key'."""
+    presses = [(key, "")] if key is not None else [(Qt.Key(ord(c.upper())), c) for c in text]
+    for code, char in presses:
+        QApplication.sendEvent(widget, QtGui.QKeyEvent(QtCore.QEvent.KeyPress, code, Qt.NoModifier, char))
+
+def shots(count):
+    return [NodeData("shot", node_id=f"1::{i + 1}") for i in range(count)]
+
+class TestPropertiesForms(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_forms_are_rebound_not_rebuilt(self):
+        panel = PropertiesWidget()
+        first, second = shots(2)
+        second.properties["frame_in"] = 950
+        panel.load_nodes([first])
+        page = panel.tab_widget.widget(0)
+        panel.load_nodes([second])
+        self.assertEqual(panel.tab_widget.count(), 1)
+        self.assertIs(panel.tab_widget.widget(0), page)
+
+        (_, form), = panel.form_pool[(ShotForm, None)]
+        self.assertEqual(form.name_input.text(), "SH002")
+        self.assertEqual(form.frame_in.value(), 950)
+        # Binding does not write back; edits go to the bound node only
+        self.assertNotIn("frame_in", first.properties)
+        form.name_input.setText("SH_hero")
+        self.assertEqual(second.properties["name"], "SH_hero")
+        self.assertEqual(first.properties["name"], "SH001")
+
+        project = NodeData("project", is_root=True)
+        project.properties["data"] = {"root_path": "/mnt/a"}
+        panel.load_nodes([project])
+        (_, project_form), = panel.form_pool[(ProjectForm, True)]
+        other = NodeData("project", is_root=True)
+        other.properties["data"] = {"root_path": "/mnt/b"}
+        panel.load_nodes([other])
+        self.assertIs(panel.form_pool[(ProjectForm, True)][0][1], project_form)
+        self.assertEqual(project_form.root_path_edit.text(), "/mnt/b")
+        self.assertEqual(project.properties["data"]["root_path"], "/mnt/a")
+
+        panel.load_nodes([])
+        self.assertEqual(panel.tab_widget.count(), 0)
+
+    def test_multi_edit_writes_all_selected_nodes(self):
+        panel = PropertiesWidget()
+        logs = []
+        panel.log_message.connect(lambda message, level: logs.append(message))
+        nodes = shots(3)
+        nodes[0].properties["frame_in"] = 990
+        panel.load_nodes(nodes)
+        # One shared form plus a tab per node
+        self.assertEqual(panel.tab_widget.count(), 4)
+        page, form = panel.multi_edit_forms["shot"]
+        self.assertIs(panel.tab_widget.widget(0), page)
+        self.assertIsInstance(form, MultiEditForm)
+
+        frame_in = form.frame_inputs["frame_in"]
+        self.assertEqual(frame_in.value(), frame_in.minimum())  # mixed
+        self.assertEqual(form.frame_inputs["frame_out"].value(), 1100)
+        # Typing a value is one write to all nodes once confirmed, not one per digit
+        frame_in.lineEdit().selectAll()
+        type_keys(frame_in, "1010")
+        self.assertEqual(nodes[1].properties.get("frame_in"), None)
+        type_keys(frame_in, "", Qt.Key_Return)
+        self.assertEqual([n.properties["frame_in"] for n in nodes], [1010] * 3)
+        self.assertEqual(len(logs), 1)
+
+        # Typing the description writes nothing until it is Set
+        form.desc_edit.setPlainText("crowd shots")
+        self.assertNotIn("description", nodes[0].properties)
+        form.desc_set_btn.click()
+        self.assertEqual(len(logs), 2)
+        form.data_key.setText("priority")
+        form.data_value.setText("high")
+        form.on_data_set()
+        for node in nodes:
+            self.assertEqual(node.properties["description"], "crowd shots")
+            self.assertEqual(node.properties["data"], {"priority": "high"})
+        self.assertIsNot(nodes[0].properties["data"], nodes[1].properties["data"])
+
+        # Each tab re-reads its node when shown: no stale values in either direction
+        panel.tab_widget.setCurrentIndex(1)
+        (_, shot_form), *_ = panel.form_pool[(ShotForm, None)]
+        self.assertEqual(shot_form.frame_in.value(), 1010)
+        shot_form.frame_in.setValue(1200)
+        panel.tab_widget.setCurrentIndex(0)
+        self.assertEqual(frame_in.value(), frame_in.minimum())  # mixed again
+        self.assertEqual(nodes[1].properties["frame_in"], 1010)
+
+        # Large selections only get the shared form, which is reused
+        many = shots(PROPERTIES_MAX_TABS + 5)
+        panel.load_nodes(many)
+        self.assertEqual(panel.tab_widget.count(), 1)
+        self.assertIs(panel.multi_edit_forms["shot"][1], form)
+        self.assertEqual(form.node_frames, many)
+        self.assertEqual(form.frame_inputs["frame_in"].value(), 1001)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+# Ensure parent directory is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_ingester.core.scan_cache import ScanCache
+from project_ingester.core.scanner import FolderMapper
+
+class TestScanCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        for name in ("SQ020", "sq010", "Assets"):
+            os.makedirs(os.path.join(self.test_dir, name))
+        self._age(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _age(self, path):
+        # Push the mtime out of the racy window, as for a folder created earlier
+        past = time.time() - 60
+        os.utime(path, (past, past))
+
+    def test_relists_only_changed_directories(self):
+        cache = ScanCache(ttl=0)
+        calls = []
+        def loader(path):
+            calls.append(path)
+            return [(e.name, e.path) for e in os.scandir(path) if e.is_dir()]
+
+        names = [n for n, _ in cache.list_dirs(self.test_dir, loader)]
+        self.assertEqual(names, ["Assets", "sq010", "SQ020"])
+
+        # Unchanged mtime: served from cache after a single stat
+        cache.list_dirs(self.test_dir, loader)
+        self.assertEqual(len(calls), 1)
+
+        os.makedirs(os.path.join(self.test_dir, "SQ030"))
+        names = [n for n, _ in cache.list_dirs(self.test_dir, loader)]
+        self.assertIn("SQ030", names)
+        self.assertEqual(len(calls), 2)
+
+        self.assertEqual(cache.list_dirs(os.path.join(self.test_dir, "missing"), loader), [])
+
+    def test_ttl_skips_stat(self):
+        cache = ScanCache(ttl=60)
+        cache.list_dirs(self.test_dir)
+        os.makedirs(os.path.join(self.test_dir, "SQ030"))
+        # Within the TTL the (now stale) listing is trusted
+        self.assertEqual(len(cache.list_dirs(self.test_dir)), 3)
+
+        cache.invalidate(self.test_dir)
+        self.assertEqual(len(cache.list_dirs(self.test_dir)), 4)
+
+    def test_mapper_rescan_uses_cache(self):
+        cache = ScanCache(ttl=0)
+        mappings = {"project": self.test_dir, "sequence": self.test_dir}
+        first = FolderMapper(cache=cache).scan_structure("Shots Only", mappings)
+        misses = cache.misses
+        second = FolderMapper(cache=cache).scan_structure("Shots Only", mappings)
+
+        self.assertEqual(first, second)
+        # Only the freshly created (racy) leaf folders are listed again
+        self.assertLess(cache.misses - misses, misses)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import patch
+
+# Ensure parent directory is in path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_ingester.core.scan_rules import ScanRules
+from project_ingester.core.scanner import FolderMapper
+from project_ingester.core.scan_cache import ScanCache
+
+class TestScanRules(unittest.TestCase):
+    def test_globs_and_regexes(self):
+        rules = ScanRules(exclude=[".*", "tmp_*"], exclude_regex=[r"^v\d+$"], include=[], include_regex=[])
+        self.assertFalse(rules.accepts(".git"))
+        self.assertFalse(rules.accepts("TMP_render"))
+        self.assertFalse(rules.accepts("v012"))
+        self.assertTrue(rules.accepts("v012_notes"))
+        self.assertTrue(rules.accepts("SQ010"))
+
+        listing = [("SQ010", "/p/SQ010"), (".vs", "/p/.vs"), ("v1", "/p/v1")]
+        self.assertEqual(rules.filter(listing), [("SQ010", "/p/SQ010")])
+
+    def test_include_restricts_after_exclude(self):
+        rules = ScanRules(exclude=["*_old"], exclude_regex=[], include=["sq*"], include_regex=[r"^ep\d+"])
+        self.assertTrue(rules.accepts("SQ010"))
+        self.assertTrue(rules.accepts("ep01"))
+        self.assertFalse(rules.accepts("sq010_old"))
+        self.assertFalse(rules.accepts("Characters"))
+
+    def test_no_rules_accepts_everything(self):
+        rules = ScanRules(exclude=[], exclude_regex=[], include=[], include_regex=[], max_depth=None, stop_markers=[])
+        self.assertTrue(rules.accepts(".git"))
+        self.assertTrue(rules.can_descend("/nowhere", 100))
+
+class TestMapperRules(unittest.TestCase):
+    def setUp(self):
+        # Film/SQ000..SQ003/SH0000..SH0002 plus excluded 'reference' trees
+        self.test_dir = tempfile.mkdtemp()
+        self.film = os.path.join(self.test_dir, "Film")
+        for s in range(4):
+            for h in range(3):
+                os.makedirs(os.path.join(self.film, f"SQ{s:03d}", f"SH{h:04d}"))
+        os.makedirs(os.path.join(self.film, "reference", "SQ999", "SH0000"))
+        os.makedirs(os.path.join(self.film, "SQ000", "SH0000", "reference"))
+        self.mappings = {"project": self.film, "sequence": self.film}
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _scan(self, rules, workers):
+        calls = []
+        real_scandir = os.scandir
+        def counting_scandir(path):
+            calls.append(os.path.basename(path))
+            return real_scandir(path)
+
+        mapper = FolderMapper(workers=workers, cache=ScanCache(), scan_rules=rules)
+        with patch("project_ingester.core.scanner.os.scandir", side_effect=counting_scandir):
+            result = mapper.scan_structure("Feature Film", self.mappings)
+        return result, calls
+
+    def test_excluded_subtrees_never_opened(self):
+        rules = ScanRules(exclude=["reference", "SQ002"], exclude_regex=[], include=[], include_regex=[])
+        for workers in (1, 4):
+            result, calls = self._scan(rules, workers)
+            self.assertEqual([c['name'] for c in result['children']], ["SQ000", "SQ001", "SQ003"])
+            self.assertNotIn("reference", calls)
+            self.assertNotIn("SQ002", calls)
+
+    def test_max_depth_and_stop_markers(self):
+        open(os.path.join(self.film, "SQ001", ".noscan"), "w").close()
+        rules = ScanRules(max_depth=None, stop_markers=[".noscan"])
+        for workers in (1, 4):
+            result, calls = self._scan(rules, workers)
+            by_name = {c['name']: c for c in result['children']}
+            self.assertEqual(len(by_name["SQ000"]['children']), 3)
+            # Shown, but not opened
+            self.assertEqual(by_name["SQ001"]['children'], [])
+            self.assertNotIn("SQ001", calls)
+
+        rules = ScanRules(max_depth=1)
+        for workers in (1, 4):
+            result, calls = self._scan(rules, workers)
+            self.assertEqual(len(result['children']), 4)
+            self.assertTrue(all(c['children'] == [] for c in result['children']))
+            self.assertEqual(calls, ["Film"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,15 @@ import os
 import sys
 import shutil
 import tempfile
+import threading
+import time
+from unittest.mock import patch
 
 # Ensure parent directory is in path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from project_ingester.core.scanner import FolderMapper
+from project_ingester.core.scan_cache import ScanCache
 
 class TestFolderMapper(unittest.TestCase):
     def setUp(self):
@@ -66,5 +70,92 @@ class TestFolderMapper(unittest.TestCase):
         seq_names = sorted([c['name'] for c in ep1['children']])
         self.assertEqual(seq_names, ['Sq010', 'Sq020'])
 
+    def _film_tree(self):
+        # Film/Seqs/SQ###/SH####, plus an ignored 'plates' folder in every sequence
+        film = os.path.join(self.test_dir, "Film")
+        seqs = os.path.join(film, "Seqs")
+        for s in range(6):
+            for h in range(5):
+                os.makedirs(os.path.join(seqs, f"SQ{s:03d}", f"SH{h:04d}"))
+            os.makedirs(os.path.join(seqs, f"SQ{s:03d}", "plates"))
+        return {"project": film, "sequence": seqs}
+
+    def test_parallel_matches_serial(self):
+        mappings = self._film_tree()
+        serial = FolderMapper(workers=1).scan_structure("Feature Film", mappings)
+        parallel = FolderMapper(workers=8).scan_structure("Feature Film", mappings)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual([c['name'] for c in serial['children']], [f"SQ{s:03d}" for s in range(6)])
+        self.assertEqual([c['name'] for c in serial['children'][0]['children']], [f"SH{h:04d}" for h in range(5)])
+
+    def test_mount_limit_bounds_concurrency(self):
+        mappings = self._film_tree()
+        active = []
+        peak = []
+        lock = threading.Lock()
+        real_scandir = os.scandir
+
+        def slow_scandir(path):
+            with lock:
+                active.append(path)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(path)
+            return real_scandir(path)
+
+        mapper = FolderMapper(workers=8, mount_limits={self.test_dir: 2})
+        with patch("project_ingester.core.scanner.os.scandir", side_effect=slow_scandir):
+            result = mapper.scan_structure("Feature Film", mappings)
+
+        self.assertEqual(len(result['children']), 6)
+        self.assertLessEqual(max(peak), 2)
+
+    def test_custom_root_listed_once(self):
+        # Custom: episode, sequence and asset_type all mapped to the project root
+        root = os.path.join(self.test_dir, "Custom")
+        os.makedirs(os.path.join(root, "EP01", "SQ010", "SH0010"))
+        os.makedirs(os.path.join(root, "SQ020", "SH0010"))
+        os.makedirs(os.path.join(root, "Characters", "Hero"))
+        mappings = {"project": root, "episode": root, "sequence": root, "asset_type": root}
+
+        for workers in (1, 4):
+            calls = []
+            real_scandir = os.scandir
+            def counting_scandir(path):
+                calls.append(path)
+                return real_scandir(path)
+
+            with patch("project_ingester.core.scanner.os.scandir", side_effect=counting_scandir):
+                result = FolderMapper(workers=workers, cache=ScanCache()).scan_structure("Custom", mappings)
+
+            self.assertEqual(
+                [(c['type'], c['name']) for c in result['children']],
+                [("asset_type", "Characters"), ("episode", "EP01"), ("sequence", "SQ020")]
+            )
+            self.assertEqual(result['children'][0]['children'][0]['type'], "asset")
+            self.assertEqual(result['children'][1]['children'][0]['children'][0]['name'], "SH0010")
+            # Every directory is listed exactly once
+            self.assertEqual(len(calls), len(set(calls)))
+            self.assertEqual(len(calls), 5) # root, EP01, SQ010, SQ020, Characters (leaves are never listed)
+
+    def test_template_naming_conventions(self):
+        # Same per-template conventions as the folder builder's auto-mapping
+        root = os.path.join(self.test_dir, "Custom")
+        os.makedirs(os.path.join(root, "e101", "SQ010"))
+        os.makedirs(os.path.join(root, "Characters"))
+        mappings = {"project": root, "episode": root, "sequence": root, "asset_type": root}
+        mapper = FolderMapper(workers=1, cache=ScanCache())
+
+        result = mapper.scan_structure("Custom", mappings)
+        self.assertEqual([(c['type'], c['name']) for c in result['children']],
+                         [("asset_type", "Characters"), ("asset_type", "e101")])
+        with patch.dict("project_ingester.data.rules.TEMPLATE_NAME_PATTERNS", {"Custom": {"episode": r"^e\d{3}"}}):
+            result = mapper.scan_structure("Custom", mappings)
+        self.assertEqual([(c['type'], c['name']) for c in result['children']],
+                         [("asset_type", "Characters"), ("episode", "e101")])
+        self.assertEqual(result['children'][1]['children'][0]['type'], "sequence")
+
 if __name__ == '__main__':
     unittest.main()
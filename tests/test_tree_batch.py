@@ -0,0 +1,130 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, QtWidgets
+from project_ingester.ui.tree import ProjectStructureWidget
+from project_ingester.ui.themes import DARK_THEME
+from project_ingester.core.setup import ProjectManager
+
+STRUCTURE = {
+    "type": "project", "name": "show", "path": "/mnt/show",
+    "children": [{
+        "type": "sequence", "name": f"SQ{s:02d}",
+        "children": [{"type": "shot", "name": f"SH{h:03d}", "children": []} for h in range(6)],
+    } for s in range(3)],
+}
+
+class TestTreeBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def populate(self, mode):
+        panel = ProjectStructureWidget(view_mode=mode)
+        panel.set_theme(DARK_THEME)
+        panel.current_template = "Shots Only"
+        panel.resize(600, 1600)
+        panel.show()
+        with patch.object(panel, "refresh_siblings_buttons", wraps=panel.refresh_siblings_buttons) as refresh:
+            panel.populate_from_structure(STRUCTURE)
+        return panel, refresh
+
+    def test_siblings_settled_once_per_parent(self):
+        manager = ProjectManager(log_callback=lambda m, l: None)
+        plans = {}
+        for mode in ("widgets", "model"):
+            panel, refresh = self.populate(mode)
+            self.assertIsNone(panel._batch_parents)
+            # Project + 3 sequences, not one refresh per inserted node
+            self.assertEqual(refresh.call_count, 4)
+            self.assertTrue(panel.tree.updatesEnabled())
+            self.assertFalse(panel.tree.signalsBlocked())
+
+            root = panel.tree.topLevelItem(0)
+            sequence = root.child(2)
+            self.assertTrue(sequence.isExpanded())
+            self.assertEqual(panel.tree.itemWidget(sequence.child(5), 0).node_frame.node_id, "3::6")
+            frames = [panel.tree.itemWidget(sequence.child(i), 0).node_frame for i in range(6)]
+            if mode == "model":
+                self.assertTrue(panel.tree.isExpanded(panel.tree.tree_model.index_of(sequence)))
+                self.assertEqual([f.can_delete for f in frames], [False] * 5 + [True])
+            else:
+                self.assertEqual(panel.tree.itemWidget(sequence, 0).btn_expand.text(), "▼")
+                self.assertEqual([f.btn_del.isVisibleTo(f) for f in frames], [False] * 5 + [True])
+
+            plan = manager.build_plans([root], panel.tree)
+            plans[mode] = [(s["type"], s["name"], s["parent"]) for s in plan]
+        self.assertEqual(plans["model"], plans["widgets"])
+        self.assertEqual(plans["widgets"][-1], ("shot", "SH005", 15))
+        panel.close()
+
+    def test_nested_batches_finish_with_the_outer_one(self):
+        panel = ProjectStructureWidget(view_mode="widgets")
+        panel.current_template = "Shots Only"
+        with panel.batch_insert():
+            root = panel.add_node(None, "project", is_root=True)
+            sequence = panel.add_node(root, "sequence")
+            with panel.batch_insert():
+                panel.add_node(sequence, "shot")
+                panel.add_node(sequence, "shot")
+            self.assertFalse(panel.tree.updatesEnabled())
+            self.assertEqual(list(panel._batch_parents), [root, sequence])
+        self.assertTrue(panel.tree.updatesEnabled())
+        self.assertTrue(panel.tree.itemWidget(sequence.child(1), 0).node_frame.btn_del.isVisibleTo(
+            panel.tree.itemWidget(sequence.child(1), 0).node_frame))
+
+    def test_widgets_built_only_for_rows_on_screen(self):
+        panel = ProjectStructureWidget(view_mode="widgets")
+        panel.set_theme(DARK_THEME)
+        panel.current_template = "Shots Only"
+        panel.resize(600, 400)
+        panel.show()
+        structure = dict(STRUCTURE, children=[dict(STRUCTURE["children"][0], children=[
+            {"type": "shot", "name": f"SH{h:03d}", "children": []} for h in range(40)])])
+        panel.populate_from_structure(structure)
+        tree = panel.tree
+
+        def built():
+            items = []
+            iterator = QtWidgets.QTreeWidgetItemIterator(tree)
+            while iterator.value():
+                if QtWidgets.QTreeWidget.itemWidget(tree, iterator.value(), 0) is not None:
+                    items.append(iterator.value())
+                iterator += 1
+            return items
+
+        self.assertLess(len(built()), 10)
+        # Plans and forms read the placeholder data of the rows never shown
+        sequence = tree.topLevelItem(0).child(0)
+        last = sequence.child(39)
+        self.assertEqual(tree.itemWidget(last, 0).node_frame.properties["name"], "SH039")
+        self.assertEqual(len(ProjectManager(log_callback=lambda m, l: None).build_plans([tree.topLevelItem(0)], tree)), 42)
+        self.assertLess(len(built()), 10)
+
+        # Scrolling a row into view builds its widget with the data gathered so far
+        tree.verticalScrollBar().setValue(tree.verticalScrollBar().maximum())
+        self.assertIn(last, built())
+        frame = tree.itemWidget(last, 0).node_frame
+        self.assertEqual(frame.name_edit.text(), "SH039")
+        self.assertTrue(frame.btn_del.isVisibleTo(frame))
+
+        # Inside a collapsed branch a new node stays a placeholder until expanded
+        sequence.setExpanded(False)
+        task = panel.add_node(sequence.child(0), "task")
+        self.assertNotIn(task, built())
+        self.assertFalse(hasattr(tree.itemWidget(task, 0), "btn_expand"))
+        sequence.setExpanded(True)
+        tree.scrollToItem(task)
+        self.assertIn(task, built())
+        panel.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication
+from project_ingester.ui.tree import ProjectStructureWidget, SiblingNumbers
+
+class TestTreeIds(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_sibling_numbers_reuse_the_lowest_freed(self):
+        numbers = SiblingNumbers()
+        self.assertEqual([numbers.take() for _ in range(4)], [1, 2, 3, 4])
+        numbers.release(3)
+        numbers.release(2)
+        self.assertEqual([numbers.take() for _ in range(3)], [2, 3, 5])
+
+    def test_adds_and_deletes_touch_constant_siblings(self):
+        for mode in ("widgets", "model"):
+            panel = ProjectStructureWidget(view_mode=mode)
+            panel.apply_template("Shots Only")
+            sequence = panel.tree.topLevelItem(0).child(0)
+            with panel.batch_insert():
+                for _ in range(199):
+                    panel.add_node(sequence, "shot")
+            frame = lambda i: panel.tree.itemWidget(sequence.child(i), 0).node_frame
+            deletable = lambda f: f.btn_del.isVisibleTo(f) if hasattr(f, "btn_del") else f.can_delete
+            self.assertEqual(frame(199).node_id, "1::200")
+
+            with patch.object(panel, "refresh_siblings_buttons", side_effect=AssertionError), \
+                 patch.object(panel, "_update_delete_button", wraps=panel._update_delete_button) as update:
+                shot = panel.add_node(sequence, "shot")
+                self.assertEqual(update.call_count, 2)
+                self.assertEqual(frame(200).node_id, "1::201")
+                self.assertEqual([deletable(frame(i)) for i in (199, 200)], [False, True])
+
+                # A bulk block in the middle can go; its id comes back without colliding
+                bulk_item = panel.add_bulk_node(sequence, {"type": "shot", "count": 3})
+                panel.add_node(sequence, "shot")
+                self.assertEqual(frame(202).node_id, "1::203")
+                update.reset_mock()
+                panel.on_delete_node(bulk_item)
+                self.assertEqual(update.call_count, 0)
+                again = panel.add_node(sequence, "shot")
+                self.assertEqual(frame(202).node_id, "1::202")
+                self.assertEqual(frame(202).properties["name"], "SH202")
+                self.assertEqual(len(panel.nodes), 1 + 1 + 203)
+
+                # Deleting the last child makes the previous one deletable
+                update.reset_mock()
+                panel.on_delete_node(again)
+                self.assertEqual(update.call_count, 1)
+                self.assertTrue(deletable(frame(201)))
+
+            # A deleted branch takes its children's numbering with it
+            panel.add_node(shot, "task")
+            panel.add_node(shot, "task")
+            panel.on_delete_node(panel.tree.topLevelItem(0).child(0).child(200))
+            panel.add_node(sequence, "shot")
+            reused = panel.add_node(sequence.child(sequence.childCount() - 1), "task")
+            self.assertEqual(panel.tree.itemWidget(reused, 0).node_frame.node_id, "1::201::1")
+            panel.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import os
+import sys
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, QPoint
+from project_ingester.ui.tree import ProjectStructureWidget, NodeFrame, watermark_pixmap, visible_rows, tree_stylesheet
+from project_ingester.ui.themes import DARK_THEME, LIGHT_THEME
+
+class TestTreePaint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_connectors_cached_for_visible_rows(self):
+        panel = ProjectStructureWidget(view_mode="widgets")
+        panel.set_theme(DARK_THEME)
+        panel.apply_template("Shots Only")
+        sequence = panel.tree.topLevelItem(0).child(0)
+        for _ in range(24):
+            panel.add_node(sequence, "shot")
+        panel.resize(500, 400)
+        panel.show()
+        self.app.processEvents()
+        tree = panel.tree
+
+        tree.viewport().repaint()
+        rows = list(visible_rows(tree))
+        self.assertLess(len(rows), 10)
+        # One path per visible child row, nothing for the rows off screen
+        self.assertEqual(len(tree.connectors.paths), len([r for r in rows if r[0].parent().isValid()]))
+
+        # The cached path joins the parent frame to the child expander
+        shot = sequence.child(0)
+        path = tree.connectors.paths[tree.indexFromItem(shot).internalId()]
+        frame = tree.itemWidget(sequence, 0).node_frame
+        expander = tree.itemWidget(shot, 0).btn_expand
+        offset = QPoint(tree.horizontalOffset(), tree.verticalOffset())
+        self.assertEqual(path.elementAt(0).x, frame.mapTo(tree.viewport(), QPoint(frame.width() // 2, 0)).x())
+        self.assertEqual(path.currentPosition().toPoint(),
+                         expander.mapTo(tree.viewport(), QPoint(0, expander.height() // 2)) + offset)
+
+        # Scrolling reuses the paths; collapsing drops them
+        cached = dict(tree.connectors.paths)
+        tree.verticalScrollBar().setValue(tree.verticalScrollBar().maximum())
+        tree.viewport().repaint()
+        for key, value in cached.items():
+            self.assertIs(tree.connectors.paths.get(key, value), value)
+        self.assertGreater(len(tree.connectors.paths), len(cached))
+        sequence.setExpanded(False)
+        self.assertEqual(tree.connectors.paths, {})
+        panel.close()
+
+    def test_nodes_styled_by_one_tree_stylesheet(self):
+        panel = ProjectStructureWidget(view_mode="widgets")
+        panel.set_theme(DARK_THEME)
+        panel.apply_template("Shots Only")
+        panel.resize(500, 400)
+        panel.show()
+        self.app.processEvents()
+        tree = panel.tree
+        shot = tree.topLevelItem(0).child(0).child(0)
+        frame = tree.itemWidget(shot, 0).node_frame
+        color = lambda x, y: frame.grab().toImage().pixelColor(x, y).name()
+
+        # Type, selection and search match come from dynamic properties
+        self.assertEqual(tree.styleSheet(), tree_stylesheet(DARK_THEME))
+        self.assertIs(tree_stylesheet(DARK_THEME), tree_stylesheet(DARK_THEME))
+        self.assertEqual(color(3, frame.height() - 4), DARK_THEME.colors['node_bg_shot'].lower())
+        frame.set_selected(True)
+        self.assertEqual(frame.property("state"), "selected")
+        self.assertEqual(color(3, frame.height() - 4), DARK_THEME.colors['node_bg_sel'].lower())
+        frame.set_selected(False)
+        frame.set_highlighted(True)
+        self.assertEqual(color(0, frame.height() // 2), DARK_THEME.colors['node_border_match'].lower())
+
+        # A theme change sets one stylesheet on the tree, none on the nodes
+        panel.set_theme(LIGHT_THEME)
+        self.assertEqual(color(3, frame.height() - 4), LIGHT_THEME.colors['node_bg_shot'].lower())
+        self.assertFalse(any(f.styleSheet() for f in tree.viewport().findChildren(NodeFrame)))
+        panel.close()
+
+    def test_watermark_rendered_once_per_theme(self):
+        first = watermark_pixmap("TV Show", DARK_THEME)
+        self.assertIs(watermark_pixmap("TV Show", DARK_THEME), first)
+        self.assertIsNot(watermark_pixmap("TV Show", LIGHT_THEME), first)
+        self.assertFalse(first.isNull())
+
+if __name__ == '__main__':
+    unittest.main()
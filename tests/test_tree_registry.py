@@ -0,0 +1,66 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication
+from project_ingester.ui.tree import ProjectStructureWidget
+from project_ingester.ui.themes import DARK_THEME, LIGHT_THEME
+
+STRUCTURE = {
+    "type": "project", "name": "show", "path": "/mnt/show",
+    "children": [{
+        "type": "sequence", "name": f"SQ{s:02d}",
+        "children": [{"type": "shot", "name": f"SH{h:03d}", "children": []} for h in range(4)],
+    } for s in range(2)],
+}
+
+class TestTreeRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_registry_follows_adds_deletes_and_loads(self):
+        for mode in ("widgets", "model"):
+            panel = ProjectStructureWidget(view_mode=mode)
+            panel.current_template = "Shots Only"
+            panel.populate_from_structure(STRUCTURE)
+            tree = panel.tree
+            root = tree.topLevelItem(0)
+            self.assertEqual(len(panel.nodes), 1 + 2 * 5)
+            self.assertIs(panel.node_item(""), root)
+            self.assertIs(panel.node_item("2::3"), root.child(1).child(2))
+            self.assertEqual(panel.items_of_type("sequence"), [root.child(0), root.child(1)])
+            self.assertEqual([f.properties["name"] for f in panel.node_frames("shot")][:4],
+                             ["SH000", "SH001", "SH002", "SH003"])
+
+            shot = panel.add_node(root.child(1), "shot")
+            self.assertIs(panel.node_item("2::5"), shot)
+            self.assertEqual(len(panel.items_of_type("shot")), 9)
+
+            # Deleting a node forgets its whole branch
+            panel.add_node(shot, "task")
+            self.assertIn("2::5::1", panel.nodes)
+            panel.on_delete_node(shot)
+            self.assertNotIn("2::5", panel.nodes)
+            self.assertNotIn("2::5::1", panel.nodes)
+            self.assertEqual(panel.items_of_type("task"), [])
+
+            # Theme changes do not walk the tree
+            with patch.object(tree, "get_all_node_frames", side_effect=AssertionError):
+                panel.set_theme(LIGHT_THEME)
+                panel.set_theme(DARK_THEME)
+
+            panel.apply_template("Shots Only")
+            self.assertEqual(sorted(panel.nodes), ["", "1", "1::1"])
+            self.assertEqual(panel.items_of_type("shot"), [tree.topLevelItem(0).child(0).child(0)])
+            panel.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import os
+import sys
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, QtWidgets
+from project_ingester.ui.tree import ProjectStructureWidget
+from project_ingester.ui.themes import DARK_THEME
+from project_ingester.core.search import NodeSearchIndex
+
+STRUCTURE = {
+    "type": "project", "name": "show", "path": "/mnt/show",
+    "children": [{
+        "type": "sequence", "name": f"SQ{s:02d}",
+        "children": [{"type": "shot", "name": f"SH{s}{h:03d}", "children": []} for h in range(12)],
+    } for s in range(3)],
+}
+
+class TestNodeSearchIndex(unittest.TestCase):
+    def test_prefix_then_substring_matches(self):
+        index = NodeSearchIndex()
+        for name, code in [("sh0420", "sh01"), ("SH0421", "sh02"), ("xsh0420", "sh03"), ("sq01", "seq01")]:
+            index.add(name, name, code)
+        self.assertEqual(index.find("SH042"), ["sh0420", "SH0421", "xsh0420"])
+        self.assertEqual(index.find("h0420"), ["sh0420", "xsh0420"])
+        self.assertEqual(index.find("se"), ["sq01"])
+        self.assertEqual(index.find("h0"), []) # Too short for a substring lookup
+        self.assertEqual(index.find("sh", limit=2), ["sh0420", "SH0421"])
+
+        # Re-indexing replaces the terms, removing drops the node
+        index.add("sh0420", "hero", "sh01")
+        index.remove("SH0421")
+        self.assertEqual(index.find("sh042"), ["xsh0420"])
+        self.assertEqual(index.find("her"), ["sh0420"])
+        self.assertEqual(len(index), 3)
+        index.clear()
+        self.assertEqual(index.find("sh"), [])
+
+class TestTreeSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_search_highlights_and_reveals_matches(self):
+        for mode in ("widgets", "model"):
+            panel = ProjectStructureWidget(view_mode=mode)
+            panel.set_theme(DARK_THEME)
+            panel.current_template = "Shots Only"
+            panel.resize(600, 400)
+            panel.show()
+            panel.populate_from_structure(STRUCTURE)
+            tree = panel.tree
+            root = tree.topLevelItem(0)
+            last_sequence = root.child(2)
+            last_sequence.setExpanded(False)
+            frame = lambda item: tree.itemWidget(item, 0).node_frame
+
+            # Typing in the box: the match is highlighted, its branch opened and shown
+            panel.search_input.setText("sh2007")
+            shot = last_sequence.child(7)
+            self.assertEqual(panel._matches, [shot])
+            self.assertTrue(last_sequence.isExpanded())
+            self.assertTrue(frame(shot)._is_highlighted)
+            self.assertEqual(panel.search_count.text(), "1/1")
+            if mode == "widgets":
+                self.assertIsInstance(QtWidgets.QTreeWidget.itemWidget(tree, shot, 0), QtWidgets.QWidget)
+
+            # Substring and id lookups; Enter steps through the matches
+            matches = panel.search("007")
+            self.assertEqual(matches, [root.child(s).child(7) for s in range(3)])
+            self.assertFalse(frame(root.child(0).child(6))._is_highlighted)
+            panel.next_match()
+            self.assertEqual(panel.search_count.text(), "2/3")
+            self.assertEqual(panel.search("2::5"), [root.child(1).child(4)])
+            self.assertFalse(frame(shot)._is_highlighted)
+
+            # Renames from the properties panel and deletions keep the index current
+            renamed = root.child(0).child(11)
+            frame(renamed).properties["name"] = "hero"
+            panel.on_node_property_changed(frame(renamed), "name")
+            self.assertEqual(panel.search("her"), [renamed])
+            self.assertEqual(frame(renamed).label if mode == "model" else frame(renamed).name_edit.text(), "hero")
+            self.assertEqual(panel.search("SH0011"), [])
+            panel.on_delete_node(renamed)
+            self.assertEqual(panel._matches, [])
+            self.assertEqual(panel.search("hero"), [])
+
+            panel.search_input.setText("")
+            self.assertFalse(any(getattr(frame(root.child(s).child(7)), "_is_highlighted") for s in range(3)))
+            self.assertEqual(panel.search_count.text(), "")
+            panel.populate_from_structure(STRUCTURE)
+            self.assertEqual(len(panel.search_index), 1 + 3 * 13)
+            panel.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+
+# Add project root path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from project_ingester.utils.compat import QApplication, QtCore, Qt
+from project_ingester.ui.tree import ProjectStructureWidget
+from project_ingester.ui.themes import DARK_THEME
+
+class TestTreeSelection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def build(self, mode):
+        panel = ProjectStructureWidget(view_mode=mode)
+        panel.set_theme(DARK_THEME)
+        panel.apply_template("Shots Only")
+        sequence = panel.tree.topLevelItem(0).child(0)
+        for _ in range(19):
+            panel.add_node(sequence, "shot")
+        panel.resize(600, 400)
+        panel.show()
+        self.app.processEvents()
+        notifications = []
+        panel.node_selected.connect(lambda frames: notifications.append(list(frames)))
+        return panel, sequence, notifications
+
+    def test_rubber_band_selects_visible_rows_in_one_notification(self):
+        for mode in ("widgets", "model"):
+            panel, sequence, notifications = self.build(mode)
+            tree = panel.tree
+            everything = QtCore.QRect(QtCore.QPoint(-10000, -10000), QtCore.QSize(20000, 20000))
+
+            panel.on_rubberband_selection(everything, Qt.NoModifier)
+            self.assertEqual(len(notifications), 1)
+            first = panel.selected_nodes
+            # Only rows on screen are hit tested, top to bottom
+            self.assertTrue(0 < len(first) < 10)
+            self.assertIs(first[0], tree.itemWidget(tree.topLevelItem(0), 0).node_frame)
+            self.assertNotIn(tree.itemWidget(sequence.child(19), 0).node_frame, first)
+            self.assertTrue(all(frame._is_selected for frame in first))
+
+            # Ctrl extends the selection with what is now on screen, still one notification
+            tree.verticalScrollBar().setValue(tree.verticalScrollBar().maximum())
+            self.app.processEvents()
+            panel.on_rubberband_selection(everything, Qt.ControlModifier)
+            self.assertEqual(len(notifications), 2)
+            last = tree.itemWidget(sequence.child(19), 0).node_frame
+            self.assertEqual(panel.selected_nodes[:len(first)], first)
+            self.assertIn(last, panel.selected_nodes)
+
+            # A plain click replaces the selection with a single notification
+            panel.on_node_clicked(last)
+            self.assertEqual(len(notifications), 3)
+            self.assertEqual(notifications[-1], [last])
+            self.assertFalse(any(frame._is_selected for frame in first))
+            panel.clear_selection()
+            self.assertEqual(panel.selected_nodes, [])
+            self.assertFalse(last._is_selected)
+            panel.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -81,6 +81,7 @@ def main():
         dialog.project_root = proj_a
         dialog.root_edit.setText(proj_a)
         dialog.refresh_tree()
+        dialog.wait_for_scan()
         log("Tree Refreshed.")
         
         # Check Root
@@ -143,6 +144,7 @@ def main():
         os.makedirs(empty_dir, exist_ok=True)
         dialog.project_root = empty_dir
         dialog.refresh_tree()
+        dialog.wait_for_scan()
         
         root_item = dialog.tree.topLevelItem(0)
         log(f"Empty Root Expanded: {root_item.isExpanded()}")